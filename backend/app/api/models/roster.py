@@ -0,0 +1,12 @@
+"""
+Roster models for VoiceTaskAI
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class RosterUpdateRequest(BaseModel):
+    """Roster change request model"""
+    add: List[str] = Field(default_factory=list, description="Names to add")
+    remove: List[str] = Field(default_factory=list, description="Names to remove")
+    replace: Optional[List[str]] = Field(None, description="Full replacement list, applied before add/remove")
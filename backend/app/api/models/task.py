@@ -2,7 +2,7 @@
 Task model for VoiceTaskAI
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -47,3 +47,9 @@ class TaskResponse(BaseModel):
     """Task response model"""
     task: Task
     message: str = "Task created successfully"
+
+
+class ParseTextBatchRequest(BaseModel):
+    """Batch text parsing request model"""
+    texts: List[str] = Field(..., description="Transcribed voice commands to parse")
+    batch_size: Optional[int] = Field(None, ge=1, description="Texts per spaCy batch")
@@ -3,10 +3,38 @@ Configuration settings for VoiceTaskAI
 """
 import os
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic_settings import BaseSettings
 
 
+# Named Whisper decoding profiles. Keys are passed to whisper's transcribe(),
+# except "initial_prompt_vocabulary", which seeds the prompt with users and categories.
+DECODE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Short English commands: no language detection pass, greedy only, no fallback retries
+    "command-fast": {
+        "language": "en",
+        "temperature": 0.0,
+        "compression_ratio_threshold": None,
+        "logprob_threshold": None,
+        "condition_on_previous_text": False,
+        "without_timestamps": True,
+        "sample_len": 128,
+        "initial_prompt_vocabulary": True,
+    },
+    # Beam search with Whisper's temperature fallback for hard recordings
+    "accurate": {
+        "language": "en",
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "beam_size": 5,
+        "best_of": 5,
+        "condition_on_previous_text": True,
+        "initial_prompt_vocabulary": True,
+    },
+    # Whisper's own defaults (language detection, fallback, unbounded output)
+    "whisper-default": {},
+}
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
     
@@ -17,17 +45,66 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     
+    # Load and warm up models in the background at startup (otherwise on first request)
+    preload_models: bool = True
+    
     # Whisper settings
     whisper_model: str = "base"
     whisper_device: str = "cpu"
     
+    # Two-tier ASR cascade: whisper_model only runs when cascade_fast_model looks unsure
+    cascade_enabled: bool = False
+    cascade_fast_model: str = "tiny"
+    cascade_min_avg_logprob: float = -0.7
+    cascade_max_no_speech_prob: float = 0.5
+    
+    # Whisper decoding profile, one of DECODE_PROFILES
+    decode_profile: str = "command-fast"
+    # Longest vocabulary prompt in characters; Whisper only reads about 224 prompt tokens
+    vocabulary_prompt_max_chars: int = 600
+    
     # spaCy settings
     spacy_model: str = "en_core_web_sm"
+    # "full", "tokenizer" (model tokenizer, no trained components) or "blank"
+    spacy_pipeline: str = "tokenizer"
+    
+    # Command keyword variations (comma separated), matched anywhere inside a word
+    task_keywords: str = "task,tasks,tusk,tack"
+    user_keywords: str = "user,users,youser,yuser"
+    category_keywords: str = "category,categories,cat,type,kind"
+    deadline_keywords: str = "deadlin,deadline,dead line"
+    
+    # Deadline parsing: rules first, dateparser limited to these languages (comma separated)
+    deadline_languages: str = "en"
+    deadline_cache_max_entries: int = 1024
+    deadline_end_of_day_hour: int = 17
+    
+    # Batch text parsing (/parse-text/batch)
+    parse_batch_size: int = 64
+    # nlp.pipe worker processes; >1 only pays off for large batches
+    parse_n_process: int = 1
+    parse_batch_max_texts: int = 1000
     
     # File storage
     data_dir: str = "./data"
     audio_cache_dir: str = "./data/audio_cache"
     tasks_file: str = "./data/tasks.json"
+    # Task records: "json" (one file per task in task_storage_dir) or "sqlite" (task_storage_db)
+    task_storage_backend: str = "json"
+    task_storage_dir: str = "./data/processed_tasks"
+    task_storage_db: str = "./data/tasks.db"
+    # JSON backend: tasks are served from memory; files changed by others are picked up this often
+    task_index_refresh_seconds: float = 2.0
+    # GET /tasks page size (default and largest allowed)
+    tasks_page_size: int = 50
+    tasks_page_max: int = 500
+    # Category tasks are journaled and folded into categories_file every
+    # categories_compact_seconds, or once categories_compact_every entries are pending
+    categories_file: str = "./data/categories.json"
+    categories_compact_every: int = 500
+    categories_compact_seconds: float = 30.0
+    # Node component of generated task/recording IDs (0 to 1048575); unset derives it from host and PID
+    node_id: Optional[int] = None
     
     # Logging
     log_level: str = "INFO"
@@ -36,6 +113,32 @@ class Settings(BaseSettings):
     # Audio processing
     max_audio_size_mb: int = 50
     supported_audio_formats: str = "wav"
+    # "memory" pipes uploads through ffmpeg stdin/stdout, "disk" uses temp files
+    audio_decode_mode: str = "memory"
+    
+    # Voice activity detection (silence trimming before Whisper)
+    vad_enabled: bool = True
+    vad_padding_ms: int = 200
+    vad_min_speech_ms: int = 150
+    
+    # Inference pool
+    inference_max_concurrency: int = 1
+    inference_max_queue: int = 8
+    inference_retry_after_seconds: int = 2
+    
+    # Micro-batching (needs inference_max_concurrency > 1 so requests can overlap)
+    batch_enabled: bool = False
+    batch_window_ms: int = 30
+    batch_max_size: int = 8
+    
+    # Result cache
+    result_cache_max_mb: int = 64
+    result_cache_disk: bool = False
+    result_cache_dir: str = "./data/result_cache"
+    
+    # Streaming transcription (WebSocket)
+    stream_window_seconds: float = 25.0
+    stream_partial_interval_ms: int = 1000
     
     # User management
     predefined_users: str = "Alice,Bob,Charlie,Ali"
@@ -43,6 +146,17 @@ class Settings(BaseSettings):
     # Category management
     predefined_categories: str = "Construction,Inspection,Maintenance"
     
+    # Roster store (users and categories), watched for changes; seeded from the lists above
+    roster_file: str = "./data/roster.json"
+    roster_poll_seconds: float = 2.0
+    
+    # Name/category similarity matches kept per lookup
+    similarity_top_k: int = 10
+    # Match names by phonetic key (Soundex/Metaphone) before fuzzy scoring
+    phonetic_matching: bool = True
+    # Memoized name/category resolutions, dropped whenever the roster changes
+    name_memo_max_entries: int = 4096
+    
     @property
     def supported_formats_list(self) -> List[str]:
         """Convert supported formats string to list"""
@@ -58,6 +172,30 @@ class Settings(BaseSettings):
         """Convert predefined categories string to list"""
         return [category.strip() for category in self.predefined_categories.split(",")]
     
+    @property
+    def deadline_languages_list(self) -> List[str]:
+        """Convert deadline languages string to list"""
+        return [language.strip() for language in self.deadline_languages.split(",") if language.strip()]
+    
+    @property
+    def keyword_variations(self) -> List[Tuple[str, List[str]]]:
+        """Command keyword variations in the order the parser assigns them"""
+        keywords = [
+            ("task", self.task_keywords),
+            ("user", self.user_keywords),
+            ("category", self.category_keywords),
+            ("deadline", self.deadline_keywords),
+        ]
+        return [(kind, [var.strip() for var in variations.split(",") if var.strip()])
+                for kind, variations in keywords]
+    
+    @property
+    def decode_profile_options(self) -> Dict[str, Any]:
+        """Options for the selected decoding profile"""
+        if self.decode_profile not in DECODE_PROFILES:
+            raise ValueError(f"Unknown decode profile '{self.decode_profile}', expected one of {list(DECODE_PROFILES)}")
+        return dict(DECODE_PROFILES[self.decode_profile])
+    
     @property
     def data_path(self) -> Path:
         """Get data directory path"""
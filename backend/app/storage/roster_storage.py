@@ -0,0 +1,163 @@
+"""
+Roster storage for VoiceTaskAI
+Keeps the predefined users and categories in a JSON file that running
+servers watch, so roster changes apply without a restart
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ROSTER_KINDS = ("users", "categories")
+
+
+class RosterStorage:
+    """File-backed users and categories lists with a change watcher"""
+
+    def __init__(self,
+                 roster_file: str = "data/roster.json",
+                 default_users: Optional[List[str]] = None,
+                 default_categories: Optional[List[str]] = None):
+        """
+        Initialize roster storage
+
+        Args:
+            roster_file: JSON file holding the roster
+            default_users: Users written when the file is first loaded or updated
+            default_categories: Categories written when the file is first loaded or updated
+        """
+        self.roster_file = roster_file
+        self.default_users = default_users or []
+        self.default_categories = default_categories or []
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _ensure_roster_file(self):
+        """Seed the roster file from configuration if it doesn't exist yet"""
+        if not os.path.exists(self.roster_file):
+            self._write({"version": 1, "users": self.default_users, "categories": self.default_categories})
+
+    def _write(self, roster: Dict[str, Any]):
+        """Replace the roster file atomically so watchers never read half a file"""
+        directory = os.path.dirname(os.path.abspath(self.roster_file))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".roster-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(roster, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.roster_file)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Read the roster
+
+        Returns:
+            Dict with "version", "users" and "categories"
+        """
+        self._ensure_roster_file()
+        with open(self.roster_file, 'r', encoding='utf-8') as f:
+            roster = json.load(f)
+        return {
+            "version": int(roster.get("version", 0)),
+            "users": [str(name) for name in roster.get("users", [])],
+            "categories": [str(name) for name in roster.get("categories", [])]
+        }
+
+    def update(self,
+               kind: str,
+               add: Optional[List[str]] = None,
+               remove: Optional[List[str]] = None,
+               replace: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Change one roster list and bump the version
+
+        Args:
+            kind: "users" or "categories"
+            add: Names to append (names already present are skipped)
+            remove: Names to remove
+            replace: New full list, applied before add/remove
+
+        Returns:
+            The updated roster
+        """
+        if kind not in ROSTER_KINDS:
+            raise ValueError(f"Unknown roster kind '{kind}', expected one of {ROSTER_KINDS}")
+
+        with self._lock:
+            roster = self.load()
+            names = list(roster[kind]) if replace is None else []
+            for name in (replace or []) + (add or []):
+                name = name.strip()
+                if name and name not in names:
+                    names.append(name)
+            removed = {name.strip() for name in remove or []}
+            names = [name for name in names if name not in removed]
+
+            if names != roster[kind]:
+                roster[kind] = names
+                roster["version"] += 1
+                self._write(roster)
+                logger.info(f"Roster {kind} updated to version {roster['version']}: {len(names)} entries")
+            return roster
+
+    def _mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.roster_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def watch(self, callback: Callable[[Dict[str, Any]], None], interval_seconds: float = 2.0):
+        """
+        Call back with the roster whenever the file changes
+
+        Args:
+            callback: Receives the freshly loaded roster
+            interval_seconds: How often the file's modification time is checked
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        def run():
+            last_seen = self._mtime()
+            while not self._stop.wait(interval_seconds):
+                mtime = self._mtime()
+                if mtime is None or mtime == last_seen:
+                    continue
+                try:
+                    roster = self.load()
+                except (OSError, ValueError) as e:
+                    # Likely mid-edit by hand; try again on the next tick
+                    logger.warning(f"Could not reload roster: {e}")
+                    continue
+                last_seen = mtime
+                try:
+                    callback(roster)
+                except Exception as e:
+                    logger.error(f"❌ Roster reload failed: {e}")
+
+        self._stop.clear()
+        self._watcher = threading.Thread(target=run, name="roster-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the watcher thread"""
+        self._stop.set()
+
+
+# Global roster storage instance
+roster_storage = RosterStorage(
+    settings.roster_file,
+    default_users=settings.predefined_users_list,
+    default_categories=settings.predefined_categories_list
+)
@@ -0,0 +1,283 @@
+"""
+SQLite task storage for VoiceTaskAI
+Keeps task records in one WAL-mode database with indexes on the columns
+tasks are listed and filtered by. Tasks are ordered and paged by sort_id,
+sort_string() of the task ID, so pages match the JSON backend's for the
+same cursor, legacy IDs included
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.storage.task_storage import BaseTaskStorage, TaskFilter
+from app.utils.ids import id_generator, sort_string
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per query while iterating
+ITER_PAGE_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id   TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    assignee  TEXT,
+    category  TEXT,
+    deadline  TEXT,
+    record    TEXT NOT NULL,
+    sort_id   TEXT
+);
+"""
+
+INDEXES = """
+DROP INDEX IF EXISTS idx_tasks_assignee;
+DROP INDEX IF EXISTS idx_tasks_category;
+CREATE INDEX IF NOT EXISTS idx_tasks_sort ON tasks (sort_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_timestamp ON tasks (timestamp);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee_sort ON tasks (assignee, sort_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_category_sort ON tasks (category, sort_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline);
+"""
+
+INSERT = "INSERT {}INTO tasks (task_id, timestamp, assignee, category, deadline, record, sort_id) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+
+class SQLiteTaskStorage(BaseTaskStorage):
+    """Task storage backed by an embedded SQLite database in WAL mode"""
+
+    def __init__(self, db_path: str = "data/tasks.db"):
+        """
+        Initialize SQLite task storage
+
+        Args:
+            db_path: Database file, created with its schema if missing
+        """
+        self.db_path = db_path
+        # One connection per thread; WAL lets readers run while a writer commits
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+        self._add_sort_ids(connection)
+        connection.executescript(INDEXES)
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _add_sort_ids(connection: sqlite3.Connection):
+        """Fill in sort_id for databases created before the column existed"""
+        columns = [name for _, name, *_ in connection.execute("PRAGMA table_info(tasks)")]
+        with connection:
+            if "sort_id" not in columns:
+                connection.execute("ALTER TABLE tasks ADD COLUMN sort_id TEXT")
+            task_ids = [task_id for task_id, in connection.execute("SELECT task_id FROM tasks WHERE sort_id IS NULL")]
+            connection.executemany("UPDATE tasks SET sort_id = ? WHERE task_id = ?",
+                                   [(sort_string(task_id), task_id) for task_id in task_ids])
+        if task_ids:
+            logger.info(f"Added sort IDs to {len(task_ids)} tasks in {connection}")
+
+    @staticmethod
+    def _row(record: Dict[str, Any]) -> tuple:
+        """Column values for a task record"""
+        task_data = record.get("task_data") or {}
+        return (
+            record["task_id"],
+            record.get("timestamp", ""),
+            task_data.get("assignee"),
+            task_data.get("category"),
+            task_data.get("deadline"),
+            json.dumps(record, ensure_ascii=False),
+            sort_string(record["task_id"])
+        )
+
+    def _location(self, task_id: str) -> str:
+        return f"{self.db_path}#{task_id}"
+
+    def save_processed_task(self,
+                            audio_filename: str,
+                            transcription: str,
+                            task_data: Dict[str, Any],
+                            processing_metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Save processed task data to the database
+
+        Args:
+            audio_filename: Name of the original audio file
+            transcription: Whisper transcription text
+            task_data: Extracted task information
+            processing_metadata: Additional processing metadata
+
+        Returns:
+            str: Database path and task ID ("data/tasks.db#task_...")
+        """
+        return self.save_processed_tasks(audio_filename, transcription, [task_data], processing_metadata)[0]
+
+    def save_processed_tasks(self,
+                             audio_filename: str,
+                             transcription: str,
+                             tasks: List[Dict[str, Any]],
+                             processing_metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Save every task dictated in one recording in a single transaction
+
+        Args:
+            audio_filename: Name of the original audio file
+            transcription: Whisper transcription text
+            tasks: Extracted task information, one dict per task
+            processing_metadata: Additional processing metadata shared by the tasks
+
+        Returns:
+            List[str]: Database path and task ID of each saved task, in task order
+        """
+        records = []
+        for i, task_data in enumerate(tasks):
+            task_id = id_generator.new_id("task")
+            metadata = {**(processing_metadata or {}), "task_index": i, "task_count": len(tasks)}
+            records.append(self._task_record(task_id, audio_filename, transcription, task_data, metadata))
+
+        connection = self._connection()
+        with connection:
+            connection.executemany(INSERT.format(""),
+                                   [self._row(record) for record in records])
+        return [self._location(record["task_id"]) for record in records]
+
+    def import_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert existing task records, keeping any already stored under the same ID
+
+        Args:
+            records: Task records as produced by TaskStorage
+
+        Returns:
+            int: Number of records inserted
+        """
+        connection = self._connection()
+        with connection:
+            before = connection.total_changes
+            connection.executemany(INSERT.format("OR IGNORE "),
+                                   [self._row(record) for record in records if record.get("task_id")])
+            return connection.total_changes - before
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a specific task by ID
+
+        Args:
+            task_id: Task ID to retrieve
+
+        Returns:
+            Dict containing task data or None if not found
+        """
+        row = self._connection().execute("SELECT record FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_all_tasks(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve all processed tasks
+
+        Returns:
+            List of all task records, newest first
+        """
+        rows = self._connection().execute("SELECT record FROM tasks ORDER BY sort_id DESC, task_id DESC")
+        return [json.loads(record) for record, in rows]
+
+    def query_tasks(self,
+                    task_filter: Optional[TaskFilter] = None,
+                    cursor: Optional[str] = None,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        One page of tasks matching a filter, newest first, answered from the indexes
+
+        Args:
+            task_filter: Conditions every returned task meets (None for all tasks)
+            cursor: Task ID of the last task on the previous page
+            limit: Maximum number of tasks returned
+
+        Returns:
+            List of matching task records
+        """
+        task_filter = task_filter or TaskFilter()
+        clauses, params = [], []
+        for column, value in (("assignee", task_filter.assignee), ("category", task_filter.category)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for condition, value in (("deadline >= ?", task_filter.due_after), ("deadline < ?", task_filter.due_before),
+                                 ("timestamp >= ?", task_filter.since), ("timestamp < ?", task_filter.until)):
+            if value is not None:
+                clauses.append(condition)
+                params.append(value)
+        if task_filter.status is not None:
+            clauses.append("json_extract(record, '$.status') = ?")
+            params.append(task_filter.status)
+        if cursor is not None:
+            # The cursor task need not exist any more; its ID alone places it
+            clauses.append("sort_id < ?")
+            params.append(sort_string(cursor))
+
+        sql = "SELECT record FROM tasks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY sort_id DESC, task_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(record) for record, in self._connection().execute(sql, params)]
+
+    def iter_tasks(self,
+                   task_filter: Optional[TaskFilter] = None,
+                   cursor: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Tasks matching a filter, newest first, fetched a page at a time
+
+        Each page is its own query on the calling thread's connection, so the
+        iterator can be advanced from different threads (as streaming responses do).
+
+        Args:
+            task_filter: Conditions every returned task meets (None for all tasks)
+            cursor: Task ID of the last task already seen; only older tasks are returned
+
+        Returns:
+            Iterator over task records
+        """
+        while True:
+            page = self.query_tasks(task_filter, cursor, limit=ITER_PAGE_SIZE)
+            yield from page
+            if len(page) < ITER_PAGE_SIZE:
+                return
+            cursor = page[-1]["task_id"]
+
+    def delete_task(self, task_id: str) -> bool:
+        """
+        Delete a specific task
+
+        Args:
+            task_id: Task ID to delete
+
+        Returns:
+            bool: True if deleted successfully
+        """
+        connection = self._connection()
+        try:
+            with connection:
+                return connection.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,)).rowcount > 0
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting task {task_id}: {e}")
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Row count for /metrics"""
+        count = self._connection().execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return {"backend": "sqlite", "tasks": count}
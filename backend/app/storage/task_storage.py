@@ -3,28 +3,365 @@ Task storage utilities for VoiceTaskAI
 """
 import os
 import json
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
+from app.config import settings
+from app.utils.ids import id_generator, id_timestamp, sort_key
 
-class TaskStorage:
-    """Storage class for processed task data"""
+# A directory mtime this recent may still change within the same clock tick, so it isn't trusted
+DIR_MTIME_SETTLE_NS = 100_000_000
+
+
+class TaskFilter:
+    """Conditions on task records; unset conditions match every task"""
+    
+    def __init__(self,
+                 assignee: Optional[str] = None,
+                 category: Optional[str] = None,
+                 status: Optional[str] = None,
+                 due_after: Optional[str] = None,
+                 due_before: Optional[str] = None,
+                 since: Optional[str] = None,
+                 until: Optional[str] = None):
+        """
+        Initialize task filter
+        
+        Args:
+            assignee: Exact assignee name
+            category: Exact category name
+            status: Record status (e.g. "processed")
+            due_after: ISO datetime; deadline at or after it
+            due_before: ISO datetime; deadline before it
+            since: ISO datetime; processed at or after it
+            until: ISO datetime; processed before it
+        """
+        self.assignee = assignee
+        self.category = category
+        self.status = status
+        self.due_after = due_after
+        self.due_before = due_before
+        self.since = since
+        self.until = until
+    
+    def matches(self, task: Dict[str, Any]) -> bool:
+        """Whether a task record meets every condition"""
+        task_data = task.get('task_data') or {}
+        if self.assignee is not None and task_data.get('assignee') != self.assignee:
+            return False
+        if self.category is not None and task_data.get('category') != self.category:
+            return False
+        if self.status is not None and task.get('status') != self.status:
+            return False
+        if self.due_after is not None or self.due_before is not None:
+            deadline = task_data.get('deadline')
+            if not deadline:
+                return False
+            if self.due_after is not None and deadline < self.due_after:
+                return False
+            if self.due_before is not None and deadline >= self.due_before:
+                return False
+        timestamp = task.get('timestamp', '')
+        if self.since is not None and timestamp < self.since:
+            return False
+        if self.until is not None and timestamp >= self.until:
+            return False
+        return True
+
+
+def project_task(task: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """
+    Copy only the requested fields of a task record
+    
+    Args:
+        task: Task record
+        fields: Top-level keys or dotted paths into nested dicts (e.g. "task_data.title")
+        
+    Returns:
+        Dict with the same nesting holding just those fields
+    """
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        path = field.split('.')
+        value = task
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = projected
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+    return projected
+
+
+def deep_sizeof(value: Any) -> int:
+    """Approximate memory held by a parsed JSON value, containers included"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(key) + deep_sizeof(item) for key, item in value.items())
+    elif isinstance(value, list):
+        size += sum(deep_sizeof(item) for item in value)
+    return size
+
+
+class BaseTaskStorage(ABC):
+    """Interface shared by the task storage backends"""
+    
+    @abstractmethod
+    def save_processed_task(self,
+                            audio_filename: str,
+                            transcription: str,
+                            task_data: Dict[str, Any],
+                            processing_metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Save one task; returns where it was stored"""
+    
+    @abstractmethod
+    def save_processed_tasks(self,
+                             audio_filename: str,
+                             transcription: str,
+                             tasks: List[Dict[str, Any]],
+                             processing_metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Save every task of one recording atomically; returns where each was stored"""
+    
+    @abstractmethod
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Task record by ID, or None"""
+    
+    @abstractmethod
+    def get_all_tasks(self) -> List[Dict[str, Any]]:
+        """All task records, newest first"""
+    
+    @abstractmethod
+    def delete_task(self, task_id: str) -> bool:
+        """Delete a task; returns True if it existed"""
+    
+    def iter_tasks(self,
+                   task_filter: Optional["TaskFilter"] = None,
+                   cursor: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Tasks matching a filter, newest first, read lazily
+        
+        Args:
+            task_filter: Conditions every returned task meets (None for all tasks)
+            cursor: Task ID of the last task already seen; only older tasks are returned
+            
+        Returns:
+            Iterator over task records
+        """
+        task_filter = task_filter or TaskFilter()
+        tasks = iter(self.get_all_tasks())
+        if cursor is not None:
+            for task in tasks:
+                if task.get('task_id') == cursor:
+                    break
+        return (task for task in tasks if task_filter.matches(task))
+    
+    def query_tasks(self,
+                    task_filter: Optional["TaskFilter"] = None,
+                    cursor: Optional[str] = None,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        One page of tasks matching a filter, newest first
+        
+        Args:
+            task_filter: Conditions every returned task meets (None for all tasks)
+            cursor: Task ID of the last task on the previous page
+            limit: Maximum number of tasks returned
+            
+        Returns:
+            List of matching task records
+        """
+        return list(islice(self.iter_tasks(task_filter, cursor), limit))
     
-    def __init__(self, storage_dir: str = "data/processed_tasks"):
+    def stats(self) -> Dict[str, Any]:
+        """Backend details for /metrics"""
+        return {}
+    
+    def _task_record(self,
+                     task_id: str,
+                     audio_filename: str,
+                     transcription: str,
+                     task_data: Dict[str, Any],
+                     processing_metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the stored record for one task"""
+        return {
+            "task_id": task_id,
+            "timestamp": datetime.now().isoformat(),
+            "audio_filename": audio_filename,
+            "transcription": transcription,
+            "task_data": task_data,
+            "processing_metadata": processing_metadata or {},
+            "status": "processed"
+        }
+
+
+class TaskStorage(BaseTaskStorage):
+    """
+    Storage class for processed task data, one JSON file per task
+    
+    Records are kept in an in-memory index built at startup and updated on
+    save and delete, so reads never touch the disk. Files added, changed or
+    removed by other processes are picked up by an incremental refresh that
+    re-reads only files whose size or modification time changed. Reads only
+    trigger one when the directory's modification time moved, which creating,
+    renaming or deleting a task file does; a file rewritten in place is seen
+    with the next such change or an explicit refresh().
+    """
+    
+    def __init__(self, storage_dir: str = "data/processed_tasks", refresh_interval_seconds: float = 2.0):
         """
         Initialize task storage
         
         Args:
             storage_dir: Directory to store processed tasks
+            refresh_interval_seconds: Minimum time between directory rescans on read
         """
         self.storage_dir = storage_dir
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._lock = threading.RLock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        # task ID -> (mtime_ns, size) of the file the record was read from
+        self._file_state: Dict[str, Tuple[int, int]] = {}
+        # task ID -> approximate memory held by the parsed record
+        self._sizes: Dict[str, int] = {}
+        # (sort_key(task_id), task_id), oldest first
+        self._order: List[Tuple[Tuple[int, str], str]] = []
+        self._last_refresh = 0.0
+        # Directory mtime_ns as of the last full scan, None when it can't be trusted
+        self._dir_mtime: Optional[int] = None
+        self.refreshes = 0
+        self.files_reloaded = 0
+        self.last_refresh_ms = 0.0
+        self.total_refresh_ms = 0.0
         self._ensure_storage_dir()
+        self.refresh()
     
     def _ensure_storage_dir(self):
         """Create storage directory if it doesn't exist"""
         os.makedirs(self.storage_dir, exist_ok=True)
     
+    def _task_path(self, task_id: str) -> str:
+        return os.path.join(self.storage_dir, f"{task_id}.json")
+    
+    def _index_put(self, task_id: str, record: Dict[str, Any], file_state: Tuple[int, int]):
+        """Add or replace a record in the index"""
+        with self._lock:
+            if task_id not in self._records:
+                insort(self._order, (sort_key(task_id), task_id))
+            self._records[task_id] = record
+            self._file_state[task_id] = file_state
+            self._sizes[task_id] = deep_sizeof(record)
+    
+    def _index_drop(self, task_id: str):
+        """Remove a record from the index"""
+        with self._lock:
+            if self._records.pop(task_id, None) is None:
+                return
+            del self._file_state[task_id]
+            del self._sizes[task_id]
+            entry = (sort_key(task_id), task_id)
+            position = bisect_left(self._order, entry)
+            if position < len(self._order) and self._order[position] == entry:
+                del self._order[position]
+    
+    def _index_file(self, task_id: str, record: Dict[str, Any]):
+        """Put the record of a just-written file in the index so the next refresh doesn't re-read it"""
+        stat = os.stat(self._task_path(task_id))
+        self._index_put(task_id, record, (stat.st_mtime_ns, stat.st_size))
+    
+    def _dir_state(self) -> Optional[int]:
+        try:
+            return os.stat(self.storage_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def _own_change(self, dir_before: Optional[int]):
+        """Keep trusting the directory mtime after a save or delete here, unless something else moved it first"""
+        dir_after = self._dir_state()
+        with self._lock:
+            if self._dir_mtime is not None and self._dir_mtime == dir_before:
+                self._dir_mtime = dir_after
+    
+    def refresh(self) -> int:
+        """
+        Bring the index in line with the directory
+        
+        Only files whose size or modification time differ from the indexed
+        version are parsed again. The directory is scanned without holding the
+        index lock; saves and deletes made meanwhile win over what the scan saw.
+        
+        Returns:
+            int: Number of files read
+        """
+        start = time.perf_counter()
+        dir_mtime = self._dir_state()
+        with self._lock:
+            known = dict(self._file_state)
+        
+        seen = set()
+        changed = []
+        try:
+            entries = list(os.scandir(self.storage_dir))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            task_id = entry.name[:-len('.json')]
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            seen.add(task_id)
+            file_state = (stat.st_mtime_ns, stat.st_size)
+            if known.get(task_id) == file_state:
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    changed.append((task_id, json.load(f), file_state))
+            except Exception as e:
+                print(f"Error reading task file {entry.name}: {e}")
+        
+        with self._lock:
+            for task_id, record, file_state in changed:
+                if self._file_state.get(task_id) == known.get(task_id):
+                    self._index_put(task_id, record, file_state)
+            for task_id, file_state in known.items():
+                if task_id not in seen and self._file_state.get(task_id) == file_state:
+                    self._index_drop(task_id)
+            
+            if dir_mtime is not None and time.time_ns() - dir_mtime < DIR_MTIME_SETTLE_NS:
+                dir_mtime = None
+            self._dir_mtime = dir_mtime
+            reloaded = len(changed)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._last_refresh = time.monotonic()
+            self.refreshes += 1
+            self.files_reloaded += reloaded
+            self.last_refresh_ms = elapsed_ms
+            self.total_refresh_ms += elapsed_ms
+        return reloaded
+    
+    def _ensure_fresh(self):
+        """Rescan the directory if the last scan is older than the refresh interval and the directory changed"""
+        if time.monotonic() - self._last_refresh < self.refresh_interval_seconds:
+            return
+        if self._dir_mtime is not None and self._dir_state() == self._dir_mtime:
+            self._last_refresh = time.monotonic()
+            return
+        self.refresh()
+    
     def save_processed_task(self, 
                           audio_filename: str, 
                           transcription: str, 
@@ -43,28 +380,73 @@ class TaskStorage:
             str: Path to the saved task file
         """
         # Generate task ID and filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        task_id = f"task_{timestamp}"
-        task_filename = f"{task_id}.json"
-        task_path = os.path.join(self.storage_dir, task_filename)
+        task_id = id_generator.new_id("task")
+        task_path = self._task_path(task_id)
         
         # Create task record
-        task_record = {
-            "task_id": task_id,
-            "timestamp": datetime.now().isoformat(),
-            "audio_filename": audio_filename,
-            "transcription": transcription,
-            "task_data": task_data,
-            "processing_metadata": processing_metadata or {},
-            "status": "processed"
-        }
+        task_record = self._task_record(task_id, audio_filename, transcription, task_data, processing_metadata)
         
         # Save to JSON file
+        dir_before = self._dir_state()
         with open(task_path, 'w', encoding='utf-8') as f:
             json.dump(task_record, f, indent=2, ensure_ascii=False)
+        self._index_file(task_id, task_record)
+        self._own_change(dir_before)
         
         return task_path
     
+    def save_processed_tasks(self,
+                             audio_filename: str,
+                             transcription: str,
+                             tasks: List[Dict[str, Any]],
+                             processing_metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Save every task dictated in one recording as a single transaction
+        
+        All records are written to temporary files first and only renamed into
+        place once every one of them was written, so a failure leaves none behind.
+        
+        Args:
+            audio_filename: Name of the original audio file
+            transcription: Whisper transcription text
+            tasks: Extracted task information, one dict per task
+            processing_metadata: Additional processing metadata shared by the tasks
+            
+        Returns:
+            List[str]: Paths to the saved task files, in task order
+        """
+        staged = []
+        committed = []
+        dir_before = self._dir_state()
+        try:
+            for i, task_data in enumerate(tasks):
+                task_id = id_generator.new_id("task")
+                task_path = self._task_path(task_id)
+                metadata = {**(processing_metadata or {}), "task_index": i, "task_count": len(tasks)}
+                task_record = self._task_record(task_id, audio_filename, transcription, task_data, metadata)
+                
+                tmp_path = f"{task_path}.tmp"
+                staged.append((tmp_path, task_path, task_id, task_record))
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(task_record, f, indent=2, ensure_ascii=False)
+            
+            for tmp_path, task_path, _, _ in staged:
+                os.replace(tmp_path, task_path)
+                committed.append(task_path)
+        except Exception:
+            # Roll back: drop staged files and anything already renamed into place
+            for tmp_path, _, _, _ in staged:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            for task_path in committed:
+                os.remove(task_path)
+            raise
+        
+        for _, _, task_id, task_record in staged:
+            self._index_file(task_id, task_record)
+        self._own_change(dir_before)
+        return committed
+    
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific task by ID
@@ -73,46 +455,53 @@ class TaskStorage:
             task_id: Task ID to retrieve
             
         Returns:
-            Dict containing task data or None if not found
+            Dict containing task data or None if not found (shared with the
+            index, so callers must not modify it)
         """
-        task_filename = f"{task_id}.json"
-        task_path = os.path.join(self.storage_dir, task_filename)
-        
-        if not os.path.exists(task_path):
-            return None
-        
-        try:
-            with open(task_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error reading task {task_id}: {e}")
-            return None
+        self._ensure_fresh()
+        return self._records.get(task_id)
     
     def get_all_tasks(self) -> List[Dict[str, Any]]:
         """
         Retrieve all processed tasks
         
         Returns:
-            List of all task records
+            List of all task records, newest first
+        """
+        return list(self.iter_tasks())
+    
+    def iter_tasks(self,
+                   task_filter: Optional[TaskFilter] = None,
+                   cursor: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        tasks = []
+        Tasks matching a filter, newest first, served from the index
         
-        if not os.path.exists(self.storage_dir):
-            return tasks
+        The index is ordered by task ID, which follows creation time, so a
+        cursor is a binary search and a time-bounded query stops early.
         
-        for filename in os.listdir(self.storage_dir):
-            if filename.endswith('.json'):
-                task_path = os.path.join(self.storage_dir, filename)
-                try:
-                    with open(task_path, 'r', encoding='utf-8') as f:
-                        task_data = json.load(f)
-                        tasks.append(task_data)
-                except Exception as e:
-                    print(f"Error reading task file {filename}: {e}")
+        Args:
+            task_filter: Conditions every returned task meets (None for all tasks)
+            cursor: Task ID of the last task already seen; only older tasks are returned
+            
+        Returns:
+            Iterator over task records
+        """
+        task_filter = task_filter or TaskFilter()
+        self._ensure_fresh()
+        with self._lock:
+            end = len(self._order) if cursor is None else bisect_left(self._order, (sort_key(cursor), ""))
+            task_ids = [task_id for _, task_id in self._order[:end]]
+        # IDs are allocated just before the record's timestamp is taken
+        oldest = datetime.fromisoformat(task_filter.since) - timedelta(minutes=1) if task_filter.since else None
         
-        # Sort by timestamp (newest first)
-        tasks.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return tasks
+        for task_id in reversed(task_ids):
+            if oldest is not None:
+                created = id_timestamp(task_id)
+                if created is not None and created < oldest:
+                    break
+            task = self._records.get(task_id)
+            if task is not None and task_filter.matches(task):
+                yield task
     
     def delete_task(self, task_id: str) -> bool:
         """
@@ -124,52 +513,355 @@ class TaskStorage:
         Returns:
             bool: True if deleted successfully
         """
-        task_filename = f"{task_id}.json"
-        task_path = os.path.join(self.storage_dir, task_filename)
+        task_path = self._task_path(task_id)
         
         if os.path.exists(task_path):
             try:
+                dir_before = self._dir_state()
                 os.remove(task_path)
+                self._index_drop(task_id)
+                self._own_change(dir_before)
                 return True
             except Exception as e:
                 print(f"Error deleting task {task_id}: {e}")
                 return False
         
+        self._index_drop(task_id)
         return False
+    
+    def stats(self) -> Dict[str, Any]:
+        """Index size and refresh counters"""
+        with self._lock:
+            return {
+                "backend": "json",
+                "tasks": len(self._records),
+                "index_bytes": sum(self._sizes.values()),
+                "file_bytes": sum(size for _, size in self._file_state.values()),
+                "refreshes": self.refreshes,
+                "files_reloaded": self.files_reloaded,
+                "last_refresh_ms": round(self.last_refresh_ms, 3),
+                "total_refresh_ms": round(self.total_refresh_ms, 3)
+            }
 
 
 class CategoriesStorage:
-    """Storage class for categories and their tasks"""
-    def __init__(self, categories_file: str = "data/categories.json"):
+    """
+    Storage class for categories and their tasks
+    
+    The categories file is a snapshot; tasks added since are appended to a
+    journal next to it and merged in memory, so an insert writes one line
+    instead of the whole file. A background compactor folds the journal into
+    a new snapshot, written to a temporary file and renamed into place. A
+    snapshot edited by something else is noticed by its mtime and size, read
+    again and merged with the journal instead of being overwritten.
+    """
+    def __init__(self,
+                 categories_file: str = "data/categories.json",
+                 compact_every: int = 500,
+                 compact_interval_seconds: float = 30.0):
+        """
+        Initialize categories storage
+        
+        Args:
+            categories_file: Snapshot file; the journal is this path plus ".journal"
+            compact_every: Journal entries that trigger a compaction right away
+            compact_interval_seconds: How often the compactor folds in a non-empty journal
+        """
         self.categories_file = categories_file
+        self.journal_file = f"{categories_file}.journal"
+        # Journal being folded into the snapshot; only left behind by a crash mid-compaction
+        self.compacting_file = f"{categories_file}.journal.compacting"
+        self.compact_every = compact_every
+        self.compact_interval_seconds = compact_interval_seconds
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+        self.journal_entries = 0
+        self.compactions = 0
+        self.last_compaction_ms = 0.0
+        self._categories: List[Dict[str, Any]] = []
+        # Category by ID and the task_ids it holds, so adding a task doesn't scan the list
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._task_ids: Dict[str, Set[str]] = {}
+        # Lowercased category title to category ID
+        self._by_title: Dict[str, Any] = {}
+        # Bumped on every change; the serialized categories are reused until it moves
+        self._version = 0
+        self._json: Tuple[int, str] = (-1, "")
+        # (mtime_ns, size) of the snapshot as last read or written here
+        self._snapshot_state: Optional[Tuple[int, int]] = None
         self._ensure_categories_file()
+        self._replay()
 
     def _ensure_categories_file(self):
         if not os.path.exists(self.categories_file):
             # If file doesn't exist, create with empty list
-            with open(self.categories_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2)
+            self._write_snapshot([])
 
-    def load_categories(self) -> List[Dict[str, Any]]:
+    def _file_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.categories_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _prepare_snapshot(self, categories: List[Dict[str, Any]]) -> str:
+        """Write categories to a temporary file next to the snapshot and return its path"""
+        directory = os.path.dirname(os.path.abspath(self.categories_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".categories-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(categories, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def _install_snapshot(self, tmp_path: str):
+        """Rename a prepared snapshot into place and remember it as our own write"""
+        os.replace(tmp_path, self.categories_file)
+        self._snapshot_state = self._file_state()
+
+    def _write_snapshot(self, categories: List[Dict[str, Any]]):
+        """Replace the snapshot atomically so a crash leaves the old or the new file, never half of one"""
+        self._install_snapshot(self._prepare_snapshot(categories))
+
+    def _apply(self, category_id: str, task: Dict[str, Any]) -> bool:
+        """Add a task to a category in place, skipping a task_id the category already holds"""
+        key = str(category_id)
+        cat = self._by_id.get(key)
+        if cat is None:
+            return False
+        task_id = task.get('task_id')
+        if task_id is not None:
+            if task_id in self._task_ids[key]:
+                return False
+            self._task_ids[key].add(task_id)
+        cat.setdefault('tasks', []).append(task)
+        self._version += 1
+        return True
+
+    def _replay(self):
+        """Load the snapshot plus every journaled task, oldest journal first"""
+        # Stat before reading, so an edit landing in between is picked up next time
+        self._snapshot_state = self._file_state()
         with open(self.categories_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            self._categories = json.load(f)
+        self._by_id, self._task_ids, self._by_title = {}, {}, {}
+        for cat in self._categories:
+            key = str(cat.get('id'))
+            if key not in self._by_id:
+                self._by_id[key] = cat
+                self._task_ids[key] = {task['task_id'] for task in cat.get('tasks', [])
+                                       if task.get('task_id') is not None}
+            if cat.get('title') is not None:
+                self._by_title.setdefault(str(cat['title']).lower(), cat.get('id'))
+        self._version += 1
+        self.journal_entries = 0
+        for journal in (self.compacting_file, self.journal_file):
+            if not os.path.exists(journal):
+                continue
+            with open(journal, 'r+', encoding='utf-8') as f:
+                content = f.read()
+                if content and not content.endswith('\n'):
+                    # Cut a line torn by a crash mid-append so new entries start on a fresh line
+                    print(f"Dropping incomplete last line of {journal}")
+                    content = content[:content.rfind('\n') + 1]
+                    f.seek(0)
+                    f.truncate(len(content.encode('utf-8')))
+            for line in content.splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    print(f"Skipping unreadable line in {journal}")
+                    continue
+                self._apply(entry['category_id'], entry['task'])
+                if journal == self.journal_file:
+                    self.journal_entries += 1
+
+    def _refresh(self):
+        """Re-read the snapshot if something else replaced it; call with the lock held"""
+        if self._file_state() != self._snapshot_state:
+            print(f"{self.categories_file} changed on disk, merging it with the journal")
+            self._replay()
+
+    def load_categories(self) -> List[Dict[str, Any]]:
+        """Categories with their tasks, snapshot and journal merged"""
+        with self._lock:
+            self._refresh()
+            return [dict(cat, tasks=list(cat['tasks'])) if 'tasks' in cat else dict(cat)
+                    for cat in self._categories]
+
+    def categories_json(self) -> str:
+        """Categories with their tasks as a JSON array, serialized again only after a change"""
+        with self._lock:
+            self._refresh()
+            if self._json[0] != self._version:
+                self._json = (self._version, json.dumps(self._categories, ensure_ascii=False))
+            return self._json[1]
+
+    def find_category_id(self, name: str) -> Optional[Any]:
+        """
+        ID of the category with this title (case-insensitive) or ID, without copying any tasks
+        
+        Args:
+            name: Category title or ID
+            
+        Returns:
+            The category's ID, or None if there is no such category
+        """
+        with self._lock:
+            self._refresh()
+            category_id = self._by_title.get(str(name).lower())
+            if category_id is None and str(name) in self._by_id:
+                category_id = self._by_id[str(name)]['id']
+            return category_id
 
     def save_categories(self, categories: List[Dict[str, Any]]):
-        with open(self.categories_file, 'w', encoding='utf-8') as f:
-            json.dump(categories, f, indent=2, ensure_ascii=False)
+        """Replace all categories, discarding the journal"""
+        with self._compact_lock, self._lock:
+            self._write_snapshot(categories)
+            for journal in (self.compacting_file, self.journal_file):
+                if os.path.exists(journal):
+                    os.remove(journal)
+            self._replay()
 
     def add_task_to_category(self, category_id: str, task: Dict[str, Any]):
-        categories = self.load_categories()
-        for cat in categories:
-            if str(cat.get('id')) == str(category_id):
-                if 'tasks' not in cat:
-                    cat['tasks'] = []
-                cat['tasks'].append(task)
-                break
-        self.save_categories(categories)
+        """
+        Append a task to a category through the journal
+        
+        Args:
+            category_id: ID of the category
+            task: Category task entry; a "task_id" key makes replays skip duplicates
+        """
+        line = json.dumps({"category_id": str(category_id), "task": task}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._refresh()
+            if not self._apply(category_id, task):
+                return
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.journal_entries += 1
+            if self.journal_entries >= self.compact_every:
+                self._wake.set()
+
+    def compact(self) -> bool:
+        """
+        Fold the journal into a new snapshot
+        
+        The journal is renamed aside under the lock, so appends continue into a
+        fresh one while the snapshot is written; if the process dies before the
+        renamed journal is removed, the next start replays it and skips tasks
+        the snapshot already holds. The new snapshot only replaces the file if
+        nothing else changed it meanwhile; otherwise the edit is merged in and
+        the snapshot written again.
+        
+        Returns:
+            bool: True if there was anything to compact
+        """
+        with self._compact_lock:
+            start = time.perf_counter()
+            while True:
+                with self._lock:
+                    self._refresh()
+                    if not os.path.exists(self.journal_file) and not os.path.exists(self.compacting_file):
+                        return False
+                    if os.path.exists(self.journal_file):
+                        if os.path.exists(self.compacting_file):
+                            # Left by an earlier crash or a retry: append so nothing is lost
+                            with open(self.journal_file, 'r', encoding='utf-8') as src, \
+                                    open(self.compacting_file, 'a', encoding='utf-8') as dst:
+                                shutil.copyfileobj(src, dst)
+                            os.remove(self.journal_file)
+                        else:
+                            os.replace(self.journal_file, self.compacting_file)
+                    snapshot = [dict(cat, tasks=list(cat['tasks'])) if 'tasks' in cat else dict(cat)
+                                for cat in self._categories]
+                    self.journal_entries = 0
+
+                tmp_path = self._prepare_snapshot(snapshot)
+                with self._lock:
+                    if self._file_state() == self._snapshot_state:
+                        self._install_snapshot(tmp_path)
+                        os.remove(self.compacting_file)
+                        break
+                os.remove(tmp_path)
+
+            self.compactions += 1
+            self.last_compaction_ms = (time.perf_counter() - start) * 1000
+            return True
+
+    def start_compactor(self):
+        """Compact in a background thread every interval, or sooner once the journal is long"""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+
+        def run():
+            while not self._stop.is_set():
+                self._wake.wait(self.compact_interval_seconds)
+                self._wake.clear()
+                try:
+                    self.compact()
+                except Exception as e:
+                    print(f"Error compacting categories: {e}")
+
+        self._stop.clear()
+        self._compactor = threading.Thread(target=run, name="categories-compactor", daemon=True)
+        self._compactor.start()
+
+    def stop_compactor(self):
+        """Stop the compactor thread and fold in whatever is left"""
+        self._stop.set()
+        self._wake.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        self.compact()
+
+    def stats(self) -> Dict[str, Any]:
+        """Journal length and compaction counters"""
+        return {
+            "journal_entries": self.journal_entries,
+            "compactions": self.compactions,
+            "last_compaction_ms": round(self.last_compaction_ms, 3)
+        }
+
+
+def task_id_from_location(location: str) -> str:
+    """Task ID in a path returned by save_processed_task(s) of either backend"""
+    return os.path.splitext(os.path.basename(location.split('#')[-1]))[0]
+
+
+def create_task_storage(backend: Optional[str] = None) -> BaseTaskStorage:
+    """
+    Build the configured task storage backend
+    
+    Args:
+        backend: "json" or "sqlite", defaults to settings.task_storage_backend
+        
+    Returns:
+        Task storage instance
+    """
+    backend = backend or settings.task_storage_backend
+    if backend == "json":
+        return TaskStorage(settings.task_storage_dir, settings.task_index_refresh_seconds)
+    if backend == "sqlite":
+        from app.storage.sqlite_task_storage import SQLiteTaskStorage
+        return SQLiteTaskStorage(settings.task_storage_db)
+    raise ValueError(f"Unknown task storage backend '{backend}', expected 'json' or 'sqlite'")
+
 
 # Global task storage instance
-task_storage = TaskStorage() 
+task_storage = create_task_storage()
 
 # Global categories storage instance
-categories_storage = CategoriesStorage() 
\ No newline at end of file
+categories_storage = CategoriesStorage(
+    settings.categories_file,
+    compact_every=settings.categories_compact_every,
+    compact_interval_seconds=settings.categories_compact_seconds
+)
@@ -0,0 +1,175 @@
+"""
+Dynamic micro-batching for Whisper transcription
+Collects short clips that arrive close together and decodes them as one batch
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchItem:
+    """A clip waiting to be decoded"""
+
+    __slots__ = ("audio", "future", "enqueued_at")
+
+    def __init__(self, audio: np.ndarray):
+        self.audio = audio
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class BatchScheduler:
+    """Scheduler in front of a Whisper model that batches the encoder and greedy decoder"""
+
+    def __init__(self,
+                 model_provider: Callable[[], Any],
+                 window_ms: float = 30,
+                 max_batch_size: int = 8,
+                 model_lock: Optional[threading.Lock] = None,
+                 options_provider: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Initialize batch scheduler
+
+        Args:
+            model_provider: Callable returning the loaded Whisper model
+            window_ms: How long to wait for more clips after the first one arrives
+            max_batch_size: Maximum number of clips decoded together
+            model_lock: Lock shared with other users of the same model
+            options_provider: Callable returning extra whisper.DecodingOptions fields
+        """
+        self.model_provider = model_provider
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.model_lock = model_lock or threading.Lock()
+        self.options_provider = options_provider
+        self._queue: "queue.Queue[_BatchItem]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+        # Counters
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_worker(self):
+        """Start the batching thread on first use"""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="whisper-batcher", daemon=True)
+                self._worker.start()
+
+    def submit(self, audio: np.ndarray) -> Future:
+        """
+        Queue a clip for batched decoding
+
+        Args:
+            audio: 16 kHz mono float32 samples, at most 30 seconds long
+
+        Returns:
+            Future resolving to the transcription result dict
+        """
+        self._ensure_worker()
+        item = _BatchItem(audio)
+        self._queue.put(item)
+        return item.future
+
+    def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Queue a clip and block until its batch has been decoded"""
+        return self.submit(audio).result()
+
+    def _collect(self) -> List[_BatchItem]:
+        """Wait for one clip, then gather more until the window closes or the batch is full"""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """Batching thread main loop"""
+        while True:
+            batch = self._collect()
+            try:
+                results = self._decode_batch([item.audio for item in batch])
+                for item, result in zip(batch, results):
+                    item.future.set_result(result)
+            except Exception as e:
+                logger.error(f"❌ Batched transcription failed: {e}")
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+
+    def _decode_batch(self, clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+        """
+        Run the encoder and greedy decoder over a padded batch of clips
+
+        Args:
+            clips: 16 kHz mono float32 clips
+
+        Returns:
+            List of transcription result dicts, one per clip
+        """
+        import torch
+        import whisper
+
+        model = self.model_provider()
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(clip), n_mels=model.dims.n_mels)
+            for clip in clips
+        ]).to(model.device)
+        decoding = {"temperature": 0.0, "without_timestamps": True}
+        if self.options_provider is not None:
+            decoding.update(self.options_provider())
+        decoding["fp16"] = model.device.type == "cuda"
+        options = whisper.DecodingOptions(**decoding)
+
+        started_at = time.perf_counter()
+        with self.model_lock:
+            decoded = whisper.decode(model, mel, options)
+        elapsed = time.perf_counter() - started_at
+
+        self.batches += 1
+        self.items += len(clips)
+        logger.info(f"Decoded batch of {len(clips)} clips in {elapsed * 1000:.0f} ms")
+
+        results = []
+        for clip, result in zip(clips, decoded):
+            text = result.text.strip()
+            results.append({
+                "text": text,
+                "language": result.language or "unknown",
+                "segments": [{
+                    "start": 0.0,
+                    "end": len(clip) / whisper.audio.SAMPLE_RATE,
+                    "text": text,
+                    "avg_logprob": result.avg_logprob,
+                    "no_speech_prob": result.no_speech_prob,
+                    "compression_ratio": result.compression_ratio,
+                    "temperature": result.temperature
+                }],
+                "success": True
+            })
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching counters"""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "queued": self._queue.qsize(),
+            "window_ms": self.window * 1000,
+            "max_batch_size": self.max_batch_size
+        }
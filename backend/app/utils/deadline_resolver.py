@@ -0,0 +1,203 @@
+"""
+Deadline resolver for VoiceTaskAI
+Turns spoken deadlines ("tomorrow", "next Friday", "end of month") into
+datetimes with precompiled rules, falling back to dateparser for anything else
+"""
+import calendar
+import logging
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+WEEKDAYS = {
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2,
+    "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+}
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+}
+
+# Results depending on the time of day can't be shared across a whole day
+_TIME_RELATIVE = re.compile(r"\b(hours?|hrs?|minutes?|mins?|seconds?|secs?|now)\b")
+
+_WEEKDAY = "|".join(sorted(WEEKDAYS, key=len, reverse=True))
+_NUMBER = r"\d+|" + "|".join(NUMBER_WORDS)
+
+
+def add_months(day: date, months: int) -> date:
+    """Shift a date by whole months, clamping to the last day of shorter months"""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def end_of_month(day: date) -> date:
+    """Last day of the date's month"""
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+
+def _count(text: str) -> int:
+    return int(text) if text.isdigit() else NUMBER_WORDS[text]
+
+
+class DeadlineResolver:
+    """Rule-based deadline parsing with a cached dateparser fallback"""
+
+    def __init__(self,
+                 languages: List[str],
+                 cache_entries: int = 1024,
+                 end_of_day_hour: int = 17):
+        """
+        Initialize deadline resolver
+
+        Args:
+            languages: Languages dateparser may try for phrases the rules don't know
+            cache_entries: Resolved phrases kept per reference date
+            end_of_day_hour: Hour used for "today" and "end of day"; other rules resolve to midnight
+        """
+        self.languages = languages
+        self.end_of_day = time(hour=end_of_day_hour)
+        self.cache = LRUCache(max_entries=cache_entries)
+        self.rule_hits = 0
+        self.fallback_hits = 0
+        self.unparsed = 0
+
+        tomorrow = r"(tomorrow|tmrw|tomorow|tommorow)"
+        end_of_day = r"(end of (the )?day|eod|close of business|cob)"
+        # (pattern, handler(match, today) -> (date, time of day)), matched against the whole phrase
+        rules = [
+            # Midnight today has already passed when the command is spoken
+            (rf"today|{end_of_day}( today)?|end of today|tonight", lambda m, d: (d, self.end_of_day)),
+            (tomorrow, lambda m, d: (d + timedelta(days=1), time())),
+            (rf"{end_of_day} {tomorrow}|{tomorrow} {end_of_day}|tomorrow night",
+             lambda m, d: (d + timedelta(days=1), self.end_of_day)),
+            (r"(the )?day after tomorrow", lambda m, d: (d + timedelta(days=2), time())),
+            (rf"in ({_NUMBER}) days?", lambda m, d: (d + timedelta(days=_count(m.group(1))), time())),
+            (rf"in ({_NUMBER}) weeks?", lambda m, d: (d + timedelta(weeks=_count(m.group(1))), time())),
+            (rf"in ({_NUMBER}) months?", lambda m, d: (add_months(d, _count(m.group(1))), time())),
+            (rf"(this |coming |this coming )?({_WEEKDAY})", lambda m, d: (self._weekday(d, m.group(2)), time())),
+            (rf"next ({_WEEKDAY})", lambda m, d: (self._next_week(d) + timedelta(days=WEEKDAYS[m.group(1)]), time())),
+            (r"end of (the |this )?week|this week", lambda m, d: (self._end_of_week(d), time())),
+            (r"next week", lambda m, d: (self._next_week(d), time())),
+            (r"end of next week", lambda m, d: (self._next_week(d) + timedelta(days=4), time())),
+            (r"(this )?weekend", lambda m, d: (self._weekday(d, "saturday"), time())),
+            (r"next weekend", lambda m, d: (self._next_week(d) + timedelta(days=5), time())),
+            (r"end of (the |this )?month|this month", lambda m, d: (end_of_month(d), time())),
+            (r"next month", lambda m, d: (add_months(d.replace(day=1), 1), time())),
+            (r"end of next month", lambda m, d: (end_of_month(add_months(d.replace(day=1), 1)), time())),
+        ]
+        self._rules = [(re.compile(pattern), handler) for pattern, handler in rules]
+
+    @staticmethod
+    def _weekday(today: date, name: str) -> date:
+        """Soonest date on or after today falling on the named weekday"""
+        return today + timedelta(days=(WEEKDAYS[name] - today.weekday()) % 7)
+
+    @staticmethod
+    def _next_week(today: date) -> date:
+        """Monday of the following week"""
+        return today + timedelta(days=7 - today.weekday())
+
+    @staticmethod
+    def _end_of_week(today: date) -> date:
+        """Friday of the current week, or today once that has passed"""
+        friday = today + timedelta(days=4 - today.weekday())
+        return max(friday, today)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase, drop punctuation and filler words, collapse whitespace"""
+        phrase = re.sub(r"[^\w\s:]", " ", text.lower())
+        phrase = re.sub(r"^((by|on|before|due|until|til|till|the)\s+)+", "", phrase.strip())
+        return " ".join(phrase.split())
+
+    def _apply_rules(self, phrase: str, today: date) -> Optional[datetime]:
+        """Resolve a normalized phrase with the precompiled rules"""
+        for pattern, handler in self._rules:
+            match = pattern.fullmatch(phrase)
+            if match:
+                day, at = handler(match, today)
+                return datetime.combine(day, at)
+        return None
+
+    def _fallback(self, phrase: str, now: datetime) -> Optional[datetime]:
+        """Resolve a phrase with dateparser, restricted to the configured languages"""
+        # Imported lazily, it's slow to import
+        import dateparser
+        return dateparser.parse(phrase, languages=self.languages, settings={
+            "RELATIVE_BASE": now,
+            "PREFER_DATES_FROM": "future",
+            "RETURN_AS_TIMEZONE_AWARE": False,
+        })
+
+    def resolve(self, text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Resolve a spoken deadline
+
+        Args:
+            text: Natural language deadline (e.g., "Friday", "next week")
+            now: Reference time, defaults to the current time
+
+        Returns:
+            datetime or None if the phrase couldn't be understood
+        """
+        now = now or datetime.now()
+        phrase = self.normalize(text)
+        if not phrase:
+            return None
+
+        key = (phrase, now.date())
+        cached = self.cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        resolved = self._apply_rules(phrase, now.date())
+        if resolved is not None:
+            self.rule_hits += 1
+        else:
+            resolved = self._fallback(phrase, now)
+            logger.debug(f"Deadline '{phrase}' not covered by rules, dateparser gave {resolved}")
+            if resolved is None:
+                self.unparsed += 1
+            else:
+                self.fallback_hits += 1
+            if _TIME_RELATIVE.search(phrase):
+                return resolved
+
+        self.cache.put(key, resolved)
+        return resolved
+
+    def warm_up(self):
+        """Import dateparser and load its language data before the first fallback"""
+        self._fallback("in three fortnights", datetime.now())
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache and rule/fallback counters"""
+        return {
+            "cache": self.cache.stats(),
+            "rule_hits": self.rule_hits,
+            "fallback_hits": self.fallback_hits,
+            "unparsed": self.unparsed
+        }
+
+
+# Global deadline resolver instance
+deadline_resolver = DeadlineResolver(
+    languages=settings.deadline_languages_list,
+    cache_entries=settings.deadline_cache_max_entries,
+    end_of_day_hour=settings.deadline_end_of_day_hour
+)
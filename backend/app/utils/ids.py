@@ -0,0 +1,157 @@
+"""
+ID generation for VoiceTaskAI
+Sortable, collision-free IDs for task records and audio files: a millisecond
+timestamp, a node component and a per-node monotonic sequence, encoded in
+Crockford base32 so that string order is time order
+"""
+import os
+import random
+import re
+import socket
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.config import settings
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+TIME_CHARS = 10
+NODE_CHARS = 4
+SEQUENCE_CHARS = 6
+NODE_BITS = NODE_CHARS * 5
+SEQUENCE_BITS = SEQUENCE_CHARS * 5
+ID_LENGTH = TIME_CHARS + NODE_CHARS + SEQUENCE_CHARS
+
+# Task IDs from before sortable IDs: task_YYYYmmdd_HHMMSS with an optional _N per task in a recording
+_LEGACY_ID = re.compile(r"(?:[a-z]+_)?(\d{8}_\d{6})(?:_(\d+))?")
+_ID = re.compile(rf"(?:[a-z]+_)?([{ALPHABET}]{{{ID_LENGTH}}})")
+
+
+def encode_base32(value: int, length: int) -> str:
+    """Fixed-width Crockford base32"""
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def decode_base32(text: str) -> int:
+    """Inverse of encode_base32"""
+    value = 0
+    for char in text:
+        value = value * 32 + ALPHABET.index(char)
+    return value
+
+
+def default_node_id() -> int:
+    """Node component from the host name and process ID, so workers on one host differ"""
+    return zlib.crc32(f"{socket.gethostname()}:{os.getpid()}".encode()) % (1 << NODE_BITS)
+
+
+class IdGenerator:
+    """Thread-safe generator of monotonic, time-ordered IDs"""
+
+    def __init__(self, node_id: Optional[int] = None):
+        """
+        Initialize ID generator
+
+        Args:
+            node_id: Distinguishes processes generating IDs concurrently (0 to 2**20 - 1);
+                     derived from the host name and process ID if not given
+        """
+        self.node = encode_base32((default_node_id() if node_id is None else node_id) % (1 << NODE_BITS),
+                                  NODE_CHARS)
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+        self._random = random.Random()
+
+    def new_id(self, prefix: str = "") -> str:
+        """
+        Next ID, greater than every ID this generator returned before
+
+        Args:
+            prefix: Prepended with an underscore (e.g. "task" gives "task_01J...")
+
+        Returns:
+            str: New ID
+        """
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # Random start within the lower half leaves room for a burst in the same millisecond
+                self._sequence = self._random.getrandbits(SEQUENCE_BITS - 1)
+            else:
+                # Same millisecond, or the clock stepped back: keep counting from the last ID
+                self._sequence += 1
+                if self._sequence >= 1 << SEQUENCE_BITS:
+                    self._last_ms += 1
+                    self._sequence = 0
+            value = encode_base32(self._last_ms, TIME_CHARS) + self.node + encode_base32(self._sequence, SEQUENCE_CHARS)
+        return f"{prefix}_{value}" if prefix else value
+
+
+def id_timestamp(identifier: str) -> Optional[datetime]:
+    """
+    Creation time encoded in a generated or legacy ID
+
+    Args:
+        identifier: ID with or without its prefix
+
+    Returns:
+        datetime or None if the ID isn't in a known format
+    """
+    match = _ID.fullmatch(identifier)
+    if match:
+        return datetime.fromtimestamp(decode_base32(match.group(1)[:TIME_CHARS]) / 1000)
+    match = _LEGACY_ID.fullmatch(identifier)
+    if match:
+        return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+    return None
+
+
+def sort_key(identifier: str) -> Tuple[int, str]:
+    """
+    Key ordering generated and legacy IDs by creation time
+
+    Generated IDs already sort by time as strings; legacy timestamp IDs are
+    placed by their second, so both kinds can be listed and paged together.
+
+    Args:
+        identifier: ID with or without its prefix
+
+    Returns:
+        Tuple of (creation time in ms, tie-breaker)
+    """
+    match = _ID.fullmatch(identifier)
+    if match:
+        return decode_base32(match.group(1)[:TIME_CHARS]), match.group(1)[TIME_CHARS:]
+    match = _LEGACY_ID.fullmatch(identifier)
+    if match:
+        seconds = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").timestamp()
+        # Same-second legacy IDs order by their task number, ahead of any generated ID in that second
+        return int(seconds * 1000), f"{int(match.group(2) or 0):0{ID_LENGTH}d}"
+    return 0, identifier
+
+
+def sort_string(identifier: str) -> str:
+    """
+    sort_key() as a single string, for ordering both ID kinds in a database column
+
+    Args:
+        identifier: ID with or without its prefix
+
+    Returns:
+        str: Zero-padded creation time in ms followed by the tie-breaker
+    """
+    created_ms, tie_breaker = sort_key(identifier)
+    return f"{created_ms:015d}{tie_breaker}"
+
+
+# Global ID generator instance
+id_generator = IdGenerator(settings.node_id)
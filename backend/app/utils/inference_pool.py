@@ -0,0 +1,160 @@
+"""
+Inference worker pool for VoiceTaskAI
+Runs blocking model inference off the event loop with a bounded wait queue
+"""
+import asyncio
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class InferencePoolFull(Exception):
+    """Raised when the inference wait queue is full"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Inference queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class InferencePool:
+    """Executor-backed pool with a concurrency limit and a bounded wait queue"""
+
+    def __init__(self, max_concurrency: int = 1, max_queue: int = 8, retry_after_seconds: int = 2):
+        """
+        Initialize inference pool
+
+        Args:
+            max_concurrency: Number of inference jobs allowed to run at once
+            max_queue: Number of jobs allowed to wait for a free worker
+            retry_after_seconds: Minimum Retry-After hint returned when full
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.retry_after_seconds = retry_after_seconds
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+
+        # Live state
+        self._active = 0
+        self._waiting = 0
+
+        # Cumulative counters
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._cancelled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    def _retry_after(self) -> int:
+        """Estimate how long until a queue slot frees up"""
+        avg_run = self._total_run / self._completed if self._completed else 0.0
+        estimate = math.ceil(avg_run * (self._waiting + 1) / self.max_concurrency)
+        return max(self.retry_after_seconds, estimate)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the pool
+
+        Args:
+            fn: Function to run
+            *args, **kwargs: Arguments passed to fn
+
+        Returns:
+            The function's return value
+
+        Raises:
+            InferencePoolFull: If every worker is busy and the wait queue is full
+        """
+        with self._lock:
+            if self._active + self._waiting >= self.max_concurrency + self.max_queue:
+                self._rejected += 1
+                retry_after = self._retry_after()
+                logger.warning(f"Inference pool full ({self._active} active, {self._waiting} waiting), rejecting request")
+                raise InferencePoolFull(retry_after)
+            self._waiting += 1
+            self._submitted += 1
+
+        enqueued_at = time.perf_counter()
+
+        def job():
+            started_at = time.perf_counter()
+            wait = started_at - enqueued_at
+            with self._lock:
+                self._waiting -= 1
+                self._active += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+
+            failed = False
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._total_run += time.perf_counter() - started_at
+                    if failed:
+                        self._failed += 1
+                    else:
+                        self._completed += 1
+
+        def release_if_cancelled(future):
+            # Cancelled while still queued: job() never ran, so give the queue slot back here
+            if future.cancelled():
+                with self._lock:
+                    self._waiting -= 1
+                    self._cancelled += 1
+
+        future = self._executor.submit(job)
+        future.add_done_callback(release_if_cancelled)
+        # Cancelling the awaiting coroutine cancels the executor future if it hasn't started
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of pool state
+
+        Returns:
+            Dict with queue depth, wait times and counters
+        """
+        with self._lock:
+            started = self._submitted - self._waiting - self._cancelled
+            finished = self._completed + self._failed
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queue_depth": self._waiting,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "cancelled": self._cancelled,
+                "avg_wait_ms": round(1000 * self._total_wait / started, 2) if started else 0.0,
+                "max_wait_ms": round(1000 * self._max_wait, 2),
+                "avg_run_ms": round(1000 * self._total_run / finished, 2) if finished else 0.0,
+            }
+
+    def shutdown(self):
+        """Stop accepting work and wait for running jobs"""
+        self._executor.shutdown(wait=True)
+
+
+# Global inference pool instance
+inference_pool = InferencePool(
+    max_concurrency=settings.inference_max_concurrency,
+    max_queue=settings.inference_max_queue,
+    retry_after_seconds=settings.inference_retry_after_seconds
+)
@@ -0,0 +1,216 @@
+"""
+Keyword scanner for VoiceTaskAI
+Finds command keywords (task, user, category, deadline) in a token stream with a
+single Aho-Corasick automaton compiled from every keyword variation, so adding
+synonyms or locales doesn't add per-token work
+"""
+import string
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Tokens dropped from extracted spans
+SPAN_FILLERS = frozenset(['"', "'", 'the', 'a', 'an', ','])
+# Deadline spans and the to/by fallback keep commas
+SPAN_FILLERS_KEEP_COMMA = frozenset(['"', "'", 'the', 'a', 'an'])
+
+
+class KeywordScan:
+    """Keyword and separator positions found in one command"""
+
+    __slots__ = ("positions", "separators", "length")
+
+    def __init__(self, positions: Dict[str, int], separators: Dict[str, int], length: int):
+        self.positions = positions
+        self.separators = separators
+        self.length = length
+
+    def next_position(self, start: int, kinds: Iterable[str]) -> Optional[int]:
+        """
+        Position of the earliest of the given keywords that comes after start
+
+        Args:
+            start: Token index to search after
+            kinds: Keyword kinds that can end the span
+
+        Returns:
+            Token index, or None if none of them follow start
+        """
+        following = [self.positions[kind] for kind in kinds
+                     if kind in self.positions and self.positions[kind] > start]
+        return min(following) if following else None
+
+
+class KeywordScanner:
+    """Compiled matcher for command keyword variations"""
+
+    def __init__(self,
+                 keyword_variations: Sequence[Tuple[str, Iterable[str]]],
+                 separators: Iterable[str] = ()):
+        """
+        Build the automaton
+
+        Args:
+            keyword_variations: (kind, variations) pairs in precedence order; a
+                token containing any variation as a substring matches that kind
+            separators: Exact (lowercased) words whose last position is recorded
+        """
+        self.kinds: List[str] = [kind for kind, _ in keyword_variations]
+        self.separators = frozenset(word.lower() for word in separators)
+        self._all_kinds = (1 << len(self.kinds)) - 1
+        # Kinds each variation spells out as a whole word
+        self._whole_words: Dict[str, int] = {}
+        for bit, (_, variations) in enumerate(keyword_variations):
+            for variation in variations:
+                self._whole_words[variation.lower()] = self._whole_words.get(variation.lower(), 0) | 1 << bit
+
+        # Trie over every variation; _output holds a bitmask of kinds per state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[int] = [0]
+        for bit, (_, variations) in enumerate(keyword_variations):
+            for variation in variations:
+                state = 0
+                for char in variation.lower():
+                    next_state = self._goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto.append({})
+                        self._output.append(0)
+                        self._goto[state][char] = next_state
+                    state = next_state
+                if state:
+                    self._output[state] |= 1 << bit
+
+        # Failure links, breadth first so shorter suffixes are resolved first
+        self._fail = [0] * len(self._goto)
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def matches(self, word: str) -> int:
+        """
+        Keyword kinds contained in a word
+
+        Args:
+            word: Lowercased token text
+
+        Returns:
+            Bitmask with bit i set when the word contains a variation of kinds[i]
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        found = 0
+        for char in word:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found |= output[state]
+            if found == self._all_kinds:
+                break
+        return found
+
+    def scan(self, words: Sequence[str]) -> KeywordScan:
+        """
+        Locate keywords and separators in one pass over the tokens
+
+        A token fills the first kind (in precedence order) it matches that
+        hasn't been found yet, so only the first occurrence of each kind counts.
+
+        Args:
+            words: Token texts
+
+        Returns:
+            KeywordScan with the position of each kind found and the last
+            position of each separator
+        """
+        positions: Dict[str, int] = {}
+        separators: Dict[str, int] = {}
+        assigned = 0
+        for i, word in enumerate(words):
+            lowered = word.lower()
+            if lowered in self.separators:
+                separators[lowered] = i
+            if assigned == self._all_kinds:
+                continue
+            unassigned = self.matches(lowered) & ~assigned
+            if unassigned:
+                bit = unassigned & -unassigned
+                assigned |= bit
+                positions[self.kinds[bit.bit_length() - 1]] = i
+        return KeywordScan(positions, separators, len(words))
+
+    def split(self, words: Sequence[str], boundary: str = "task", after: str = "user") -> List[Tuple[int, int]]:
+        """
+        Split a token stream holding several commands into one range per command
+
+        A boundary keyword only starts a new command once the current one has
+        its `after` keyword, so words like "attack" inside a title don't split it,
+        and only if the new command gets its own `after` keyword before the next
+        boundary keyword that could start one, so "... check the task board first"
+        stays part of the command it was said in. While a candidate waits for its
+        `after` keyword, only a whole-word boundary keyword replaces it, so
+        "attack" in the title of the next command doesn't either. Keywords are
+        assigned with the same precedence as scan().
+
+        Args:
+            words: Token texts
+            boundary: Kind that starts a command
+            after: Kind each command needs before the next one can start
+
+        Returns:
+            List of (start, end) token ranges covering all the words
+        """
+        boundary_bit = 1 << self.kinds.index(boundary)
+        after_bit = 1 << self.kinds.index(after)
+
+        def assign(assigned: int, found: int) -> int:
+            unassigned = found & ~assigned
+            return assigned | (unassigned & -unassigned) if unassigned else assigned
+
+        ranges = []
+        start = 0
+        assigned = 0
+        # Candidate start of the next command and its keywords so far, until it has `after`
+        pending = None
+        pending_assigned = 0
+        for i, word in enumerate(words):
+            lowered = word.lower()
+            found = self.matches(lowered)
+            if found & boundary_bit and assigned & after_bit and (
+                    pending is None or self._whole_words.get(lowered.strip(string.punctuation), 0) & boundary_bit):
+                # Supersedes a pending candidate that never got its own `after`
+                pending = i
+                pending_assigned = 0
+            assigned = assign(assigned, found)
+            if pending is not None:
+                pending_assigned = assign(pending_assigned, found)
+                if pending_assigned & after_bit:
+                    ranges.append((start, pending))
+                    start = pending
+                    assigned = pending_assigned
+                    pending = None
+        ranges.append((start, len(words)))
+        return ranges
+
+
+def span_text(words: Sequence[str], start: int, end: int, fillers: frozenset = SPAN_FILLERS) -> Optional[str]:
+    """
+    Join the tokens in [start, end) leaving out filler words
+
+    Args:
+        words: Token texts
+        start: First token index
+        end: Index after the last token
+        fillers: Token texts to skip
+
+    Returns:
+        Space-joined span, or None if no tokens are left
+    """
+    kept = [word for word in words[start:end] if word not in fillers]
+    return " ".join(kept).strip() if kept else None
@@ -0,0 +1,67 @@
+"""
+Lazy model loading bookkeeping for VoiceTaskAI
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+
+class LoadState:
+    """Tracks load and warm-up progress for one lazily loaded model"""
+
+    def __init__(self, name: str):
+        """
+        Initialize load state
+
+        Args:
+            name: Model name reported by /ready
+        """
+        self.name = name
+        self.status = "not_loaded"
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        # Held while loading so concurrent callers wait for one load instead of starting their own
+        self.lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.status in ("loaded", "warming_up", "ready")
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    @contextmanager
+    def track(self, phase: str):
+        """
+        Time a load or warm-up phase and record failures
+
+        Args:
+            phase: "load" or "warmup"
+        """
+        self.status = "loading" if phase == "load" else "warming_up"
+        started_at = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            raise
+        elapsed = round(time.perf_counter() - started_at, 3)
+        if phase == "load":
+            self.load_seconds = elapsed
+            self.status = "loaded"
+        else:
+            self.warmup_seconds = elapsed
+            self.status = "ready"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "error": self.error
+        }
@@ -0,0 +1,199 @@
+"""
+Similarity index for VoiceTaskAI name mapping
+Finds the roster entries closest to a transcribed name without scoring the
+whole roster: a phonetic key lookup catches names Whisper spelled the way they
+sound, otherwise character n-grams pick candidates; SequenceMatcher ranks them
+"""
+import heapq
+import threading
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.phonetic import phonetic_keys
+
+
+class NameIndex:
+    """
+    Phonetic key and character n-gram index over a list of names (users or categories)
+
+    Names can be added and removed in place while other threads search: entries
+    are only ever appended, and removed ones are left as tombstones that
+    lookups skip.
+    """
+
+    def __init__(self,
+                 names: Iterable[str],
+                 top_k: int = 10,
+                 ngram_size: int = 3,
+                 full_scan_below: int = 64,
+                 max_candidates: int = 200,
+                 phonetic: bool = True):
+        """
+        Build the index
+
+        Args:
+            names: Roster entries, in priority order for tied scores
+            top_k: Number of matches returned per lookup
+            ngram_size: Character n-gram length used for candidate selection
+            full_scan_below: Rosters smaller than this are scored exhaustively
+            max_candidates: Most candidates scored per lookup on large rosters
+            phonetic: Look names up by phonetic key before fuzzy matching
+        """
+        self.top_k = max(1, top_k)
+        self.ngram_size = ngram_size
+        self.full_scan_below = full_scan_below
+        self.max_candidates = max_candidates
+        self.phonetic = phonetic
+        self.phonetic_hits = 0
+        self.fuzzy_lookups = 0
+
+        self._entries: List[Optional[str]] = []
+        self._lowered: List[str] = []
+        self._positions: Dict[str, List[int]] = defaultdict(list)
+        self._phonetic: Dict[str, List[int]] = defaultdict(list)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._live = 0
+        self._write_lock = threading.Lock()
+        self.add(names)
+
+    @property
+    def names(self) -> List[str]:
+        """Current entries in roster order"""
+        return [name for name in self._entries if name is not None]
+
+    @property
+    def tombstones(self) -> int:
+        """Removed entries still occupying positions"""
+        return len(self._entries) - self._live
+
+    def __len__(self) -> int:
+        return self._live
+
+    def add(self, names: Iterable[str]):
+        """
+        Append names to the index
+
+        Args:
+            names: Names to add; they rank after existing entries on tied scores
+        """
+        with self._write_lock:
+            for name in names:
+                lowered = name.lower()
+                i = len(self._entries)
+                # Entries first so any position a reader finds in the maps is valid
+                self._entries.append(name)
+                self._lowered.append(lowered)
+                self._positions[name].append(i)
+                if self.phonetic:
+                    for key in phonetic_keys(lowered):
+                        self._phonetic[key].append(i)
+                for gram in self._grams(lowered):
+                    self._postings[gram].append(i)
+                self._live += 1
+
+    def remove(self, names: Iterable[str]) -> int:
+        """
+        Remove names from the index
+
+        Args:
+            names: Names to remove (exact match)
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        with self._write_lock:
+            for name in names:
+                for i in self._positions.pop(name, []):
+                    self._entries[i] = None
+                    removed += 1
+            self._live -= removed
+        return removed
+
+    def _grams(self, text: str) -> Set[str]:
+        """Character n-grams of text, padded so short names still have some"""
+        padded = f"^{text}$"
+        n = self.ngram_size
+        if len(padded) <= n:
+            return {padded}
+        return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+    def _phonetic_matches(self, query: str) -> List[int]:
+        """Roster positions sharing a phonetic key with the query, in roster order"""
+        positions = set()
+        for key in phonetic_keys(query):
+            positions.update(self._phonetic.get(key, ()))
+        return sorted(i for i in positions if self._entries[i] is not None)
+
+    def _candidates(self, query: str) -> List[int]:
+        """Roster positions sharing the most n-grams with the query"""
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in self._grams(query):
+            for i in self._postings.get(gram, ()):
+                shared[i] += 1
+        if len(shared) <= self.max_candidates:
+            return list(shared)
+        return heapq.nlargest(self.max_candidates, shared, key=shared.__getitem__)
+
+    def _score(self, query: str, positions: Iterable[int]) -> List[Tuple[str, float]]:
+        """
+        SequenceMatcher ratio against each position, keeping the top_k
+
+        Candidates whose cheap upper bounds can't beat the current k-th best
+        are skipped without computing the full ratio.
+        """
+        matcher = SequenceMatcher(None, query)
+        best: List[Tuple[float, int]] = []  # min-heap of (score, -position)
+        for i in positions:
+            if self._entries[i] is None:
+                continue
+            matcher.set_seq2(self._lowered[i])
+            if len(best) == self.top_k:
+                floor = best[0][0]
+                if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                    continue
+            entry = (matcher.ratio(), -i)
+            if len(best) < self.top_k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+        best.sort(reverse=True)
+        results = [(self._entries[-neg_i], score) for score, neg_i in best]
+        # An entry removed while this lookup ran is dropped rather than returned as None
+        return [(name, score) for name, score in results if name is not None]
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """
+        Closest roster entries to a transcribed name
+
+        Names sharing a phonetic key with the query are returned without
+        looking further; fuzzy matching only runs when no key matches.
+
+        Args:
+            query: Transcribed name
+
+        Returns:
+            Up to top_k (name, similarity) tuples, best first; ties keep roster
+            order. Empty if nothing on a large roster shares an n-gram with it.
+        """
+        query = query.strip().lower()
+        if self._phonetic:
+            sounds_alike = self._phonetic_matches(query)
+            if sounds_alike:
+                self.phonetic_hits += 1
+                return self._score(query, sounds_alike)
+        self.fuzzy_lookups += 1
+        if self._live < self.full_scan_below:
+            return self._score(query, range(len(self._entries)))
+        return self._score(query, self._candidates(query))
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size and how lookups were answered"""
+        return {
+            "entries": self._live,
+            "tombstones": self.tombstones,
+            "phonetic_keys": len(self._phonetic),
+            "phonetic_hits": self.phonetic_hits,
+            "fuzzy_lookups": self.fuzzy_lookups
+        }
@@ -0,0 +1,110 @@
+"""
+Phonetic keys for VoiceTaskAI name mapping
+Whisper tends to misspell names the way they sound ("Alise", "Charley"), so
+names that sound alike should share a key
+"""
+import re
+from typing import List
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+# Spelling rewrites applied in order before vowels are dropped ("X" is the sh sound, "0" th)
+_METAPHONE_RULES = [
+    (re.compile(r"^(?:k(?=n)|g(?=n)|p(?=n)|w(?=r)|p(?=s))"), ""),
+    (re.compile(r"^x"), "s"),
+    (re.compile(r"mb$"), "m"),
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"ck"), "k"),
+    (re.compile(r"sch"), "sk"),
+    (re.compile(r"t?ch|sh"), "X"),
+    (re.compile(r"c(?=[iey])"), "s"),
+    (re.compile(r"dg(?=[iey])"), "j"),
+    (re.compile(r"gh(?![aeiou])"), ""),
+    (re.compile(r"g(?=[iey])"), "j"),
+    (re.compile(r"th"), "0"),
+    (re.compile(r"[cq]"), "k"),
+    (re.compile(r"x"), "ks"),
+    (re.compile(r"z"), "s"),
+    (re.compile(r"v"), "f"),
+    (re.compile(r"[why](?![aeiou])"), ""),
+]
+
+
+def _letters(word: str) -> str:
+    return re.sub(r"[^a-z]", "", word.lower())
+
+
+def soundex(word: str) -> str:
+    """
+    American Soundex code of a word
+
+    Args:
+        word: A single word
+
+    Returns:
+        str: Letter plus three digits (e.g. "A420"), or "" if the word has no letters
+    """
+    letters = _letters(word)
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+        if char not in "hw":
+            previous = digit
+    return (code + "000")[:4]
+
+
+def metaphone(word: str) -> str:
+    """
+    Simplified Metaphone key of a word
+
+    Covers the common English spelling rules (silent letters, soft c/g, ph, th,
+    ch/sh) and keeps only a leading vowel, so spellings that sound the same
+    collapse together even when their first letter differs ("Kathy"/"Cathy").
+
+    Args:
+        word: A single word
+
+    Returns:
+        str: Uppercase key, or "" if the word has no letters
+    """
+    letters = _letters(word)
+    if not letters:
+        return ""
+    letters = re.sub(r"(.)\1+", r"\1", letters)
+    for pattern, replacement in _METAPHONE_RULES:
+        letters = pattern.sub(replacement, letters)
+    if not letters:
+        return ""
+    return (letters[0] + re.sub(r"[aeiouy]", "", letters[1:])).upper()
+
+
+def phonetic_keys(text: str) -> List[str]:
+    """
+    Keys under which a (possibly multi-word) name is indexed
+
+    Args:
+        text: Name or category as spoken/transcribed
+
+    Returns:
+        Soundex and Metaphone keys of the whole phrase, word keys joined by
+        spaces; empty if the text has no letters
+    """
+    words = [word for word in text.split() if _letters(word)]
+    if not words:
+        return []
+    return [
+        "S:" + " ".join(soundex(word) for word in words),
+        "M:" + " ".join(metaphone(word) for word in words),
+    ]
@@ -0,0 +1,115 @@
+"""
+Content-addressed cache of transcription and parse results
+Identical audio decoded with the same model and settings is never transcribed twice
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Two-tier cache: in-memory LRU with size-based eviction plus optional JSON files on disk"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[str] = None):
+        """
+        Initialize result cache
+
+        Args:
+            max_bytes: Memory budget for serialized entries
+            disk_dir: Directory for the on-disk tier, or None to keep results in memory only
+        """
+        # Entries are stored serialized so sizes are exact and callers can't mutate them
+        self.memory = LRUCache(max_bytes=max_bytes)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_hits = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(audio_bytes: bytes, decode_fingerprint: Dict[str, Any]) -> str:
+        """
+        Build the cache key for an upload
+
+        Args:
+            audio_bytes: Raw audio file bytes
+            decode_fingerprint: Model name and decode settings that affect the transcription
+
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        digest = hashlib.sha256(audio_bytes)
+        digest.update(json.dumps(decode_fingerprint, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result, promoting disk hits into memory
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The cached result dict or None
+        """
+        payload = self.memory.get(key)
+        if payload is None and self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                payload = path.read_text(encoding="utf-8")
+                self.disk_hits += 1
+                self.memory.put(key, payload)
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.warning(f"Could not read cached result {path}: {e}")
+                return None
+        return json.loads(payload) if payload is not None else None
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """
+        Store a result in memory and, if enabled, on disk
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable result
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        self.memory.put(key, payload)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temp file and rename so readers never see a partial entry
+                fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(temp_path, path)
+            except Exception as e:
+                logger.warning(f"Could not write cached result {path}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory tier counters plus disk hits"""
+        stats = self.memory.stats()
+        stats["disk_enabled"] = self.disk_dir is not None
+        stats["disk_hits"] = self.disk_hits
+        return stats
+
+
+# Global result cache instance
+result_cache = ResultCache(
+    max_bytes=settings.result_cache_max_mb * 1024 * 1024,
+    disk_dir=settings.result_cache_dir if settings.result_cache_disk else None
+)
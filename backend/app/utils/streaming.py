@@ -0,0 +1,238 @@
+"""
+Streaming transcription for VoiceTaskAI
+Transcribes audio on a rolling window while the user is still speaking and
+parses the task as soon as the command keywords show up
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.config import settings
+from app.utils.inference_pool import inference_pool, InferencePoolFull
+from app.utils.task_parser import task_parser
+from app.utils.vad import speech_frames
+from app.utils.voice_processor import voice_processor
+from app.utils.wav_decoder import SAMPLE_RATE, StreamResampler, pcm16_to_mono
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingTranscriber:
+    """Per-connection state for streaming transcription"""
+
+    def __init__(self,
+                 sample_rate: int = SAMPLE_RATE,
+                 channels: int = 1,
+                 window_seconds: float = 25.0,
+                 partial_interval_ms: int = 1000):
+        """
+        Initialize a streaming session
+
+        Args:
+            sample_rate: Sample rate of the incoming PCM16 chunks
+            channels: Number of interleaved channels in the incoming chunks
+            window_seconds: Longest stretch of audio transcribed in one pass
+            partial_interval_ms: New audio needed before the next partial transcript
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.window_samples = int(min(window_seconds, 30.0) * SAMPLE_RATE)
+        self.partial_interval_samples = int(partial_interval_ms * SAMPLE_RATE / 1000)
+
+        self._resampler = StreamResampler(sample_rate, SAMPLE_RATE)
+        # Bytes of a frame split across two chunks
+        self._leftover = b""
+        self._flushed = False
+
+        self._chunks: List[np.ndarray] = []
+        self._total_samples = 0
+        self._last_partial_at = 0
+
+        # Audio that slid out of the window is transcribed once and kept as text
+        self._committed_samples = 0
+        self._committed_text = ""
+
+        self._last_text = ""
+        self.task: Optional[Dict[str, Any]] = None
+        self._partial_task: Optional[asyncio.Task] = None
+
+    @property
+    def audio(self) -> np.ndarray:
+        """Everything received so far as 16 kHz mono float32"""
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0] if self._chunks else np.zeros(0, dtype=np.float32)
+
+    @property
+    def duration(self) -> float:
+        return self._total_samples / SAMPLE_RATE
+
+    def add_chunk(self, pcm: bytes):
+        """
+        Append a chunk of raw little-endian PCM16 audio
+
+        Args:
+            pcm: Interleaved sample bytes at the session's sample rate
+        """
+        data = self._leftover + pcm
+        usable = len(data) - len(data) % (2 * self.channels)
+        self._leftover = data[usable:]
+        self._append(self._resampler.process(pcm16_to_mono(data[:usable], self.channels)))
+
+    def _append(self, samples: np.ndarray):
+        if len(samples):
+            self._chunks.append(samples)
+            self._total_samples += len(samples)
+
+    def partial_due(self) -> bool:
+        """Whether enough new audio arrived to refresh the partial transcript"""
+        in_flight = self._partial_task is not None and not self._partial_task.done()
+        return not in_flight and self._total_samples - self._last_partial_at >= self.partial_interval_samples
+
+    def start_partial(self, send) -> asyncio.Task:
+        """
+        Refresh the partial transcript in the background
+
+        Args:
+            send: Coroutine function used to push messages to the client
+        """
+        async def run():
+            message = await self.partial()
+            if message is not None:
+                await send(message)
+
+        self._partial_task = asyncio.create_task(run())
+        return self._partial_task
+
+    async def cancel(self):
+        """Stop a partial transcript that is still running"""
+        if self._partial_task is not None and not self._partial_task.done():
+            self._partial_task.cancel()
+            await asyncio.gather(self._partial_task, return_exceptions=True)
+
+    def _find_cut(self, pending: np.ndarray) -> int:
+        """Pick the quietest frame in the last 3 s of the window so words aren't split"""
+        frame = int(0.03 * SAMPLE_RATE)
+        search_start = max(0, self.window_samples - 3 * SAMPLE_RATE)
+        region = pending[search_start:self.window_samples]
+        n_frames = len(region) // frame
+        if n_frames == 0:
+            return self.window_samples
+        energy = np.mean(region[:n_frames * frame].reshape(n_frames, frame) ** 2, axis=1)
+        return search_start + int(np.argmin(energy)) * frame + frame // 2
+
+    async def _commit_overflow(self):
+        """Transcribe and commit audio that no longer fits in the rolling window"""
+        while self._total_samples - self._committed_samples > self.window_samples:
+            pending = self.audio[self._committed_samples:]
+            cut = self._find_cut(pending)
+            result = await inference_pool.run(voice_processor.transcribe_audio, pending[:cut])
+            if result.get("success") and result["text"]:
+                self._committed_text = f"{self._committed_text} {result['text']}".strip()
+            self._committed_samples += cut
+
+    async def _parse(self, text: str) -> Optional[Dict[str, Any]]:
+        """Parse the text once enough command keywords are present"""
+        keywords = task_parser.keywords_present(text)
+        if not {"task", "user"} <= keywords:
+            return None
+        task_info = await asyncio.to_thread(task_parser.parse_task_command, text)
+        task_info["complete"] = keywords == {"task", "user", "category", "deadline"}
+        return task_info
+
+    async def partial(self) -> Optional[Dict[str, Any]]:
+        """
+        Transcribe the rolling window and parse incrementally
+
+        Returns:
+            Message for the client, or None if there was nothing new to say
+        """
+        self._last_partial_at = self._total_samples
+        try:
+            await self._commit_overflow()
+            window = self.audio[self._committed_samples:]
+            if not speech_frames(window).any():
+                return None
+            result = await inference_pool.run(voice_processor.transcribe_audio, window)
+        except InferencePoolFull:
+            # Partials are best effort; the final pass still runs
+            logger.info("Inference pool full, skipping partial transcript")
+            return None
+
+        if not result.get("success"):
+            return None
+
+        text = f"{self._committed_text} {result['text']}".strip()
+        if text == self._last_text:
+            return None
+        self._last_text = text
+
+        task_info = await self._parse(text)
+        if task_info is not None:
+            self.task = task_info
+        return {
+            "type": "partial",
+            "transcription": text,
+            "duration": round(self.duration, 2),
+            "task": self.task
+        }
+
+    async def finish(self) -> Dict[str, Any]:
+        """
+        Final pass once the client stops sending audio
+
+        Returns:
+            Dict shaped like voice_to_task's result
+
+        Raises:
+            InferencePoolFull: If the final transcription can't be queued
+        """
+        if self._partial_task is not None:
+            await asyncio.gather(self._partial_task, return_exceptions=True)
+        if not self._flushed:
+            self._append(self._resampler.flush())
+            self._flushed = True
+
+        await self._commit_overflow()
+        tail = self.audio[self._committed_samples:]
+        result = await inference_pool.run(voice_processor.transcribe_samples, tail)
+        processing_metadata = dict(result.get("audio_metadata", {}))
+        processing_metadata["original_duration"] = round(self.duration, 3)
+        processing_metadata["streamed"] = True
+        processing_metadata["decode_profile"] = settings.decode_profile
+
+        text = self._committed_text
+        if result.get("success"):
+            text = f"{text} {result['text']}".strip()
+        if not text:
+            return {
+                "success": False,
+                "error": result.get("error", "Transcription failed"),
+                "transcription": "",
+                "task": None,
+                "processing_metadata": processing_metadata
+            }
+
+        tasks = await asyncio.to_thread(task_parser.parse_task_commands, text)
+        successful = [task for task in tasks if task.get("success")]
+        task_info = successful[0] if successful else tasks[0]
+        return {
+            "success": bool(successful),
+            "transcription": text,
+            "task": task_info,
+            "tasks": tasks,
+            "error": task_info.get("errors", []),
+            "processing_metadata": processing_metadata
+        }
+
+
+def create_session(sample_rate: int = SAMPLE_RATE, channels: int = 1) -> StreamingTranscriber:
+    """Build a streaming session using the configured window and partial interval"""
+    return StreamingTranscriber(
+        sample_rate=sample_rate,
+        channels=channels,
+        window_seconds=settings.stream_window_seconds,
+        partial_interval_ms=settings.stream_partial_interval_ms
+    )
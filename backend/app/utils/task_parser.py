@@ -2,77 +2,259 @@
 Task parser for VoiceTaskAI
 Extracts structured task information from voice commands
 """
-import re
 import logging
-from datetime import datetime
-from typing import Dict, Optional, Any, List
-import spacy
-import dateparser
-from difflib import SequenceMatcher
+import threading
+from datetime import date
+from typing import Dict, Optional, Any, List, Set, Tuple
 
 from app.config import settings
+from app.utils.load_state import LoadState
+from app.utils.lru import LRUCache
+from app.utils.deadline_resolver import deadline_resolver
+from app.utils.ids import id_generator
+from app.utils.name_index import NameIndex
+from app.utils.keyword_scanner import KeywordScanner, span_text, SPAN_FILLERS_KEEP_COMMA
 
 logger = logging.getLogger(__name__)
 
+# Trained components of the en_core_web_* pipelines; extraction only reads token.text
+SPACY_TRAINED_COMPONENTS = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
+# Words joining dictated commands ("... deadline Friday and task ..."), dropped from the end of a command
+COMMAND_JOINERS = {"and", "then", "also", "plus", "next"}
+
 
 class TaskParser:
     """Parser for extracting task information from voice commands"""
     
     def __init__(self):
-        """Initialize task parser with spaCy model"""
-        self.nlp = None
-        self._load_nlp_model()
+        """Initialize task parser; the spaCy model is loaded on first use"""
+        self._nlp = None
+        self.load_state = LoadState(f"spacy-{settings.spacy_model}-{settings.spacy_pipeline}")
+        # Fault-tolerant keyword variations, compiled into one matcher
+        self.keyword_scanner = KeywordScanner(settings.keyword_variations, separators=["to", "by"])
+        # Resolved names keyed by (kind, normalized text, roster version)
+        self.name_memo = LRUCache(max_entries=settings.name_memo_max_entries)
+        self.roster_version = 0
+        # Roster versions restart with the process; this keeps cached contexts from an earlier run apart
+        self._roster_epoch = id_generator.new_id()
+        # Serializes roster writers; parses read the indexes without locking
+        self._roster_lock = threading.Lock()
         # Predefined user names for mapping from config
         self.predefined_users = settings.predefined_users_list
         # Predefined categories for mapping from config
         self.predefined_categories = settings.predefined_categories_list
     
-    def _load_nlp_model(self):
-        """Load spaCy NLP model"""
-        try:
-            logger.info(f"Loading spaCy model: {settings.spacy_model}")
-            self.nlp = spacy.load(settings.spacy_model)
-            logger.info(f"✅ spaCy model '{settings.spacy_model}' loaded successfully")
-        except Exception as e:
-            logger.error(f"❌ Failed to load spaCy model: {e}")
-            raise
+    @property
+    def predefined_users(self) -> List[str]:
+        """Roster used for assignee mapping"""
+        return list(self._user_index.names)
     
-    def _map_user_name(self, transcribed_name: str) -> str:
+    @predefined_users.setter
+    def predefined_users(self, users: List[str]):
+        self._user_index = self._build_index(users)
+        self._roster_changed()
+    
+    @property
+    def predefined_categories(self) -> List[str]:
+        """Categories used for category mapping"""
+        return list(self._category_index.names)
+    
+    @predefined_categories.setter
+    def predefined_categories(self, categories: List[str]):
+        self._category_index = self._build_index(categories)
+        self._roster_changed()
+    
+    @staticmethod
+    def _build_index(names: List[str]) -> NameIndex:
+        return NameIndex(names, top_k=settings.similarity_top_k, phonetic=settings.phonetic_matching)
+    
+    def _roster_changed(self):
+        """Invalidate memoized name resolutions after the users or categories change"""
+        self.roster_version += 1
+        self.name_memo.clear()
+    
+    def _sync_index(self, index_attr: str, names: List[str]) -> bool:
         """
-        Map transcribed user name to predefined user using similarity matching
+        Bring one index in line with a roster list, adding and removing in place
+        
+        Returns:
+            bool: Whether anything changed
+        """
+        index = getattr(self, index_attr)
+        wanted = list(dict.fromkeys(names))
+        current = set(index.names)
+        added = [name for name in wanted if name not in current]
+        removed = current.difference(wanted)
+        if not added and not removed:
+            return False
+        
+        if index.tombstones + len(removed) > max(len(index), index.full_scan_below):
+            # Mostly dead entries: build a fresh index on the side and swap it in
+            setattr(self, index_attr, self._build_index(wanted))
+        else:
+            index.remove(removed)
+            index.add(added)
+        logger.info(f"Roster sync {index_attr}: +{len(added)} -{len(removed)}")
+        return True
+    
+    def sync_roster(self, roster: Dict[str, Any]) -> bool:
+        """
+        Apply a roster from the roster store without blocking in-flight parses
         
         Args:
-            transcribed_name: Raw transcribed name from voice
+            roster: Dict with "users" and "categories" lists
             
         Returns:
-            Best matching predefined user name
+            bool: Whether the users or categories changed
+        """
+        with self._roster_lock:
+            users_changed = self._sync_index("_user_index", roster["users"])
+            categories_changed = self._sync_index("_category_index", roster["categories"])
+            if users_changed or categories_changed:
+                # Bumped after the indexes change so memo entries made mid-update stay on the old version
+                self._roster_changed()
+                logger.info(f"✅ Roster updated (version {roster.get('version')}, "
+                            f"{len(self._user_index)} users, {len(self._category_index)} categories)")
+            return users_changed or categories_changed
+    
+    @property
+    def nlp(self):
+        """The spaCy pipeline, loaded on first access"""
+        if self._nlp is None:
+            self._load_nlp_model()
+        return self._nlp
+    
+    def _load_nlp_model(self):
+        """
+        Load spaCy NLP model
+        
+        settings.spacy_pipeline picks how much of it:
+            full      - the whole trained pipeline
+            tokenizer - the model's tokenizer only, trained components excluded
+            blank     - a blank English tokenizer, no model package needed
+        """
+        with self.load_state.lock:
+            if self._nlp is not None:
+                return
+            try:
+                mode = settings.spacy_pipeline
+                logger.info(f"Loading spaCy model: {settings.spacy_model} ({mode})")
+                import spacy
+                with self.load_state.track("load"):
+                    if mode == "blank":
+                        self._nlp = spacy.blank("en")
+                    elif mode == "tokenizer":
+                        self._nlp = spacy.load(settings.spacy_model, exclude=SPACY_TRAINED_COMPONENTS)
+                    elif mode == "full":
+                        self._nlp = spacy.load(settings.spacy_model)
+                    else:
+                        raise ValueError(f"Unknown spaCy pipeline mode '{mode}', expected full, tokenizer or blank")
+                logger.info(f"✅ spaCy model '{settings.spacy_model}' loaded successfully (pipes: {self._nlp.pipe_names})")
+            except Exception as e:
+                logger.error(f"❌ Failed to load spaCy model: {e}")
+                raise
+    
+    def warm_up(self):
+        """Load the pipeline, parse a sample command and import dateparser"""
+        if self._nlp is None:
+            self._load_nlp_model()
+        if self.load_state.ready:
+            return
+        with self.load_state.track("warmup"):
+            self.parse_task_command("Task warm up user Alice category Construction deadline tomorrow")
+            deadline_resolver.warm_up()
+        logger.info(f"✅ Task parser warmed up in {self.load_state.warmup_seconds:.2f}s")
+    
+    def parse_context(self) -> str:
+        """
+        Fingerprint of everything besides the text that affects parse output
+        
+        Keyed on the roster version rather than the roster itself, so it costs
+        the same for ten users as for ten thousand.
+        
+        Returns:
+            str: Current date and roster version
         """
-        if not transcribed_name or transcribed_name.strip() == "":
-            return "Unknown"
+        return f"{date.today().isoformat()}|{self._roster_epoch}|{self.roster_version}"
+    
+    def mapping_stats(self) -> Dict[str, Any]:
+        """User and category index counters"""
+        return {
+            "roster_version": self.roster_version,
+            "memo": self.name_memo.stats(),
+            "users": self._user_index.stats(),
+            "categories": self._category_index.stats()
+        }
+    
+    def _resolve_name(self, index_attr: str, transcribed: str, empty_value: str, label: str) -> Tuple[str, List[tuple]]:
+        """
+        Map a transcribed name onto an index, memoized per roster version
         
-        # Clean the transcribed name
-        clean_name = transcribed_name.strip().lower()
+        Args:
+            index_attr: Attribute holding the user or category index
+            transcribed: Raw transcribed text
+            empty_value: Value returned when nothing was transcribed
+            label: What is being mapped, for log messages
+            
+        Returns:
+            Tuple of (mapped name, [(name, similarity_score), ...] best first)
+        """
+        if not transcribed or transcribed.strip() == "":
+            return empty_value, []
         
-        # Calculate similarity scores
-        similarities = []
-        for predefined_user in self.predefined_users:
-            # Use SequenceMatcher for string similarity
-            similarity = SequenceMatcher(None, clean_name, predefined_user.lower()).ratio()
-            similarities.append((predefined_user, similarity))
+        # Version is read before the index: a roster swap in between files the result under the old version
+        memo_key = (label, transcribed.strip().lower(), self.roster_version)
+        memoized = self.name_memo.get(memo_key)
+        if memoized is None:
+            memoized = self._match_name(getattr(self, index_attr), transcribed, label)
+            self.name_memo.put(memo_key, memoized)
+        best_match, similarities = memoized
+        # Low-similarity lookups keep the text as transcribed
+        return best_match or transcribed, list(similarities)
+    
+    def _match_name(self, index: NameIndex, transcribed: str, label: str) -> Tuple[Optional[str], List[tuple]]:
+        """
+        Score a transcribed name against an index
         
-        # Sort by similarity score (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        Returns:
+            Tuple of (best match, or None if nothing is similar enough, similarity matrix)
+        """
+        similarities = index.search(transcribed)
+        if not similarities:
+            logger.warning(f"No {label.lower()} similar to '{transcribed}'")
+            return None, similarities
         
         best_match, best_score = similarities[0]
         
-        logger.info(f"User name mapping: '{transcribed_name}' -> '{best_match}' (similarity: {best_score:.3f})")
+        logger.info(f"{label} mapping: '{transcribed}' -> '{best_match}' (similarity: {best_score:.3f})")
         
         # If similarity is too low, return the original with a warning
         if best_score < 0.3:
-            logger.warning(f"Low similarity score ({best_score:.3f}) for user name '{transcribed_name}'")
-            return transcribed_name
+            logger.warning(f"Low similarity score ({best_score:.3f}) for {label.lower()} '{transcribed}'")
+            return None, similarities
         
-        return best_match
+        return best_match, similarities
+    
+    def _resolve_user(self, transcribed_name: str) -> Tuple[str, List[tuple]]:
+        """Map a transcribed name to a predefined user, with its similarity matrix"""
+        return self._resolve_name("_user_index", transcribed_name, "Unknown", "User name")
+    
+    def _resolve_category(self, transcribed_category: str) -> Tuple[str, List[tuple]]:
+        """Map a transcribed category to a predefined category, with its similarity matrix"""
+        return self._resolve_name("_category_index", transcribed_category, "Uncategorized", "Category")
+    
+    def _map_user_name(self, transcribed_name: str) -> str:
+        """
+        Map transcribed user name to predefined user using similarity matching
+        
+        Args:
+            transcribed_name: Raw transcribed name from voice
+            
+        Returns:
+            Best matching predefined user name
+        """
+        return self._resolve_user(transcribed_name)[0]
     
     def _calculate_similarity_matrix(self, transcribed_name: str) -> List[tuple]:
         """
@@ -82,18 +264,9 @@ class TaskParser:
             transcribed_name: Raw transcribed name
             
         Returns:
-            List of tuples (user_name, similarity_score) sorted by score
+            List of tuples (user_name, similarity_score) sorted by score, top-k only
         """
-        clean_name = transcribed_name.strip().lower()
-        similarities = []
-        
-        for predefined_user in self.predefined_users:
-            similarity = SequenceMatcher(None, clean_name, predefined_user.lower()).ratio()
-            similarities.append((predefined_user, similarity))
-        
-        # Sort by similarity score (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities
+        return self._user_index.search(transcribed_name)
     
     def _map_category_name(self, transcribed_category: str) -> str:
         """
@@ -105,32 +278,7 @@ class TaskParser:
         Returns:
             Best matching predefined category name
         """
-        if not transcribed_category or transcribed_category.strip() == "":
-            return "Uncategorized"
-        
-        # Clean the transcribed category
-        clean_category = transcribed_category.strip().lower()
-        
-        # Calculate similarity scores
-        similarities = []
-        for predefined_category in self.predefined_categories:
-            # Use SequenceMatcher for string similarity
-            similarity = SequenceMatcher(None, clean_category, predefined_category.lower()).ratio()
-            similarities.append((predefined_category, similarity))
-        
-        # Sort by similarity score (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        best_match, best_score = similarities[0]
-        
-        logger.info(f"Category mapping: '{transcribed_category}' -> '{best_match}' (similarity: {best_score:.3f})")
-        
-        # If similarity is too low, return the original with a warning
-        if best_score < 0.3:
-            logger.warning(f"Low similarity score ({best_score:.3f}) for category '{transcribed_category}'")
-            return transcribed_category
-        
-        return best_match
+        return self._resolve_category(transcribed_category)[0]
     
     def _calculate_category_similarity_matrix(self, transcribed_category: str) -> List[tuple]:
         """
@@ -140,18 +288,9 @@ class TaskParser:
             transcribed_category: Raw transcribed category
             
         Returns:
-            List of tuples (category_name, similarity_score) sorted by score
+            List of tuples (category_name, similarity_score) sorted by score, top-k only
         """
-        clean_category = transcribed_category.strip().lower()
-        similarities = []
-        
-        for predefined_category in self.predefined_categories:
-            similarity = SequenceMatcher(None, clean_category, predefined_category.lower()).ratio()
-            similarities.append((predefined_category, similarity))
-        
-        # Sort by similarity score (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities
+        return self._category_index.search(transcribed_category)
     
     def parse_task_command(self, text: str) -> Dict[str, Any]:
         """
@@ -181,6 +320,89 @@ class TaskParser:
                 "errors": [str(e)]
             }
     
+    def parse_many(self, texts: List[str],
+                   batch_size: Optional[int] = None,
+                   n_process: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse many task commands, tokenizing them in batches with nlp.pipe
+        
+        Args:
+            texts: Transcribed voice commands
+            batch_size: Texts per nlp.pipe batch (defaults to settings.parse_batch_size)
+            n_process: Worker processes for nlp.pipe (defaults to settings.parse_n_process)
+            
+        Returns:
+            One task info dict per text, in the same order as texts
+        """
+        texts = list(texts)
+        batch_size = batch_size or settings.parse_batch_size
+        n_process = n_process or settings.parse_n_process
+        if len(texts) < 2 * batch_size:
+            # Worker start-up costs more than it saves on small inputs
+            n_process = 1
+        
+        logger.info(f"Parsing {len(texts)} task commands (batch_size={batch_size}, n_process={n_process})")
+        try:
+            docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+            return [self._extract_from_doc(doc) for doc in docs]
+        except Exception as e:
+            # Fall back to one-by-one parsing so a single bad text doesn't fail the whole batch
+            logger.error(f"❌ Batch parsing failed, parsing one by one: {e}")
+            return [self.parse_task_command(text) for text in texts]
+    
+    def split_task_commands(self, text: str) -> List[str]:
+        """
+        Split a transcript holding several dictated tasks into one command per task
+        
+        Args:
+            text: Transcribed voice command(s)
+            
+        Returns:
+            List of command strings; a single-task transcript comes back unchanged
+        """
+        words = text.split()
+        ranges = self.keyword_scanner.split(words)
+        if len(ranges) == 1:
+            return [text]
+        
+        commands = []
+        for start, end in ranges:
+            command = words[start:end]
+            while command and command[-1].lower().strip(".,;!?") in COMMAND_JOINERS:
+                command.pop()
+            if command:
+                commands.append(" ".join(command))
+        return commands
+    
+    def parse_task_commands(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Parse every task dictated in one transcript
+        
+        Args:
+            text: Transcribed voice command(s)
+            
+        Returns:
+            One task info dict per command, in the order they were spoken
+        """
+        commands = self.split_task_commands(text)
+        if len(commands) == 1:
+            return [self.parse_task_command(commands[0])]
+        logger.info(f"Transcript holds {len(commands)} task commands")
+        return self.parse_many(commands)
+    
+    def keywords_present(self, text: str) -> Set[str]:
+        """
+        Find which command keywords appear in a (possibly partial) transcription
+        
+        Args:
+            text: Transcribed text so far
+            
+        Returns:
+            Set drawn from "task", "user", "category" and "deadline"
+        """
+        # Same precedence as the extractor: a word fills the first keyword it matches that isn't found yet
+        return set(self.keyword_scanner.scan(text.split()).positions)
+    
     def _parse_deadline(self, deadline_text: str) -> Optional[str]:
         """
         Parse deadline text into ISO format
@@ -194,23 +416,10 @@ class TaskParser:
         try:
             logger.info(f"Parsing deadline: '{deadline_text}'")
             
-            # Try dateparser first
-            parsed_date = dateparser.parse(deadline_text)
+            parsed_date = deadline_resolver.resolve(deadline_text)
             if parsed_date:
                 return parsed_date.isoformat()
             
-            # Common deadline patterns
-            deadline_patterns = {
-                r'today': datetime.now().isoformat(),
-                r'tomorrow': (datetime.now().replace(day=datetime.now().day + 1)).isoformat(),
-                r'next week': (datetime.now().replace(day=datetime.now().day + 7)).isoformat(),
-                r'next month': (datetime.now().replace(month=datetime.now().month + 1)).isoformat(),
-            }
-            
-            for pattern, date_str in deadline_patterns.items():
-                if re.search(pattern, deadline_text.lower()):
-                    return date_str
-            
             logger.warning(f"Could not parse deadline: {deadline_text}")
             return None
             
@@ -228,6 +437,27 @@ class TaskParser:
         """
         try:
             doc = self.nlp(text)
+        except Exception as e:
+            logger.error(f"Error in spaCy extraction: {e}")
+            return {
+                "title": None,
+                "assignee": None,
+                "category": None,
+                "deadline": None,
+                "success": False,
+                "errors": [str(e)]
+            }
+        return self._extract_from_doc(doc)
+    
+    def _extract_from_doc(self, doc) -> Dict[str, Any]:
+        """
+        Extract task information from an already tokenized command
+        Args:
+            doc: spaCy Doc for the transcribed text
+        Returns:
+            Dict containing extracted task information
+        """
+        try:
             task_info = {
                 "title": None,
                 "assignee": None,
@@ -237,117 +467,70 @@ class TaskParser:
                 "errors": []
             }
 
-            # Define fault-tolerant keyword variations
-            task_variations = ["task", "tasks", "tusk", "tack"]
-            user_variations = ["user", "users", "youser", "yuser"]
-            category_variations = ["category", "categories", "cat", "type", "kind"]
-            deadline_variations = ["deadlin", "deadline", "dead line"]
-
-            task_idx = None
-            user_idx = None
-            category_idx = None
-            deadline_idx = None
-
-            # First pass: find all keyword positions
-            for i, token in enumerate(doc):
-                token_text = token.text.lower()
-                if task_idx is None and any(var in token_text for var in task_variations):
-                    task_idx = i
-                elif user_idx is None and any(var in token_text for var in user_variations):
-                    user_idx = i
-                elif category_idx is None and any(var in token_text for var in category_variations):
-                    category_idx = i
-                elif deadline_idx is None and any(var in token_text for var in deadline_variations):
-                    deadline_idx = i
+            words = [token.text for token in doc]
+            scan = self.keyword_scanner.scan(words)
+            task_idx = scan.positions.get("task")
+            user_idx = scan.positions.get("user")
+            category_idx = scan.positions.get("category")
+            deadline_idx = scan.positions.get("deadline")
 
             # Extract task title (between 'task' and the next keyword)
             if task_idx is not None:
-                # Find the next keyword after 'task'
-                next_keyword_idx = None
-                for idx in [user_idx, category_idx, deadline_idx]:
-                    if idx is not None and idx > task_idx:
-                        if next_keyword_idx is None or idx < next_keyword_idx:
-                            next_keyword_idx = idx
-                
+                next_keyword_idx = scan.next_position(task_idx, ["user", "category", "deadline"])
                 if next_keyword_idx is not None:
-                    title_tokens = [doc[i].text for i in range(task_idx + 1, next_keyword_idx) if doc[i].text not in ['"', "'", 'the', 'a', 'an', ',']]
-                    if title_tokens:
-                        task_info["title"] = " ".join(title_tokens).strip()
+                    title = span_text(words, task_idx + 1, next_keyword_idx)
+                    if title is not None:
+                        task_info["title"] = title
 
             # Extract assignee (after 'user', before next keyword)
             if user_idx is not None:
-                # Find the next keyword after 'user'
-                next_keyword_idx = None
-                for idx in [category_idx, deadline_idx]:
-                    if idx is not None and idx > user_idx:
-                        if next_keyword_idx is None or idx < next_keyword_idx:
-                            next_keyword_idx = idx
-                
-                end_idx = next_keyword_idx if next_keyword_idx else len(doc)
-                assignee_tokens = [doc[i].text for i in range(user_idx + 1, end_idx) if doc[i].text not in ['"', "'", 'the', 'a', 'an', ',']]
-                if assignee_tokens:
-                    raw_assignee = " ".join(assignee_tokens).strip()
-                    # Map the transcribed name to predefined users
-                    task_info["assignee"] = self._map_user_name(raw_assignee)
-                    # Store the similarity matrix for debugging
-                    task_info["assignee_similarity"] = self._calculate_similarity_matrix(raw_assignee)
+                next_keyword_idx = scan.next_position(user_idx, ["category", "deadline"])
+                end_idx = next_keyword_idx if next_keyword_idx is not None else len(words)
+                raw_assignee = span_text(words, user_idx + 1, end_idx)
+                if raw_assignee is not None:
+                    # Map the transcribed name to predefined users, keeping the similarity matrix for debugging
+                    task_info["assignee"], task_info["assignee_similarity"] = self._resolve_user(raw_assignee)
 
             # Extract category (after 'category', before next keyword)
             if category_idx is not None:
-                # Find the next keyword after 'category'
-                next_keyword_idx = deadline_idx if deadline_idx and deadline_idx > category_idx else None
-                end_idx = next_keyword_idx if next_keyword_idx else len(doc)
-                category_tokens = [doc[i].text for i in range(category_idx + 1, end_idx) if doc[i].text not in ['"', "'", 'the', 'a', 'an', ',']]
-                if category_tokens:
-                    raw_category = " ".join(category_tokens).strip()
-                    # Map the transcribed category to predefined categories
-                    task_info["category"] = self._map_category_name(raw_category)
-                    # Store the category similarity matrix for debugging
-                    task_info["category_similarity"] = self._calculate_category_similarity_matrix(raw_category)
+                next_keyword_idx = scan.next_position(category_idx, ["deadline"])
+                end_idx = next_keyword_idx if next_keyword_idx is not None else len(words)
+                raw_category = span_text(words, category_idx + 1, end_idx)
+                if raw_category is not None:
+                    # Map the transcribed category to predefined categories, keeping the similarity matrix for debugging
+                    task_info["category"], task_info["category_similarity"] = self._resolve_category(raw_category)
 
             # Extract deadline (after 'deadlin')
             if deadline_idx is not None:
-                deadline_tokens = [doc[i].text for i in range(deadline_idx + 1, len(doc)) if doc[i].text not in ['"', "'", 'the', 'a', 'an']]
-                if deadline_tokens:
-                    deadline_text = " ".join(deadline_tokens).strip()
+                deadline_text = span_text(words, deadline_idx + 1, len(words), SPAN_FILLERS_KEEP_COMMA)
+                if deadline_text is not None:
                     parsed_deadline = self._parse_deadline(deadline_text)
                     if parsed_deadline:
                         task_info["deadline"] = parsed_deadline
                     else:
                         task_info["errors"].append(f"Could not parse deadline: {deadline_text}")
 
-            # Fallback: If not all fields found, try 'to' and 'by' as separators
-            if not (task_info["title"] and task_info["assignee"]):
-                # Try to find 'to' and 'by' as separators
-                to_idx = None
-                by_idx = None
-                for i, token in enumerate(doc):
-                    if token.text.lower() == "to":
-                        to_idx = i
-                    elif token.text.lower() == "by":
-                        by_idx = i
-                if to_idx is not None and by_idx is not None:
-                    # Task title: before 'to'
-                    title_tokens = [doc[i].text for i in range(0, to_idx) if doc[i].text not in ['"', "'", 'the', 'a', 'an']]
-                    if title_tokens and not task_info["title"]:
-                        task_info["title"] = " ".join(title_tokens).strip()
-                    # Assignee: between 'to' and 'by'
-                    assignee_tokens = [doc[i].text for i in range(to_idx + 1, by_idx) if doc[i].text not in ['"', "'", 'the', 'a', 'an']]
-                    if assignee_tokens and not task_info["assignee"]:
-                        raw_assignee = " ".join(assignee_tokens).strip()
-                        # Map the transcribed name to predefined users
-                        task_info["assignee"] = self._map_user_name(raw_assignee)
-                        # Store the similarity matrix for debugging
-                        task_info["assignee_similarity"] = self._calculate_similarity_matrix(raw_assignee)
-                    # Deadline: after 'by'
-                    deadline_tokens = [doc[i].text for i in range(by_idx + 1, len(doc)) if doc[i].text not in ['"', "'", 'the', 'a', 'an']]
-                    if deadline_tokens and not task_info["deadline"]:
-                        deadline_text = " ".join(deadline_tokens).strip()
-                        parsed_deadline = self._parse_deadline(deadline_text)
-                        if parsed_deadline:
-                            task_info["deadline"] = parsed_deadline
-                        else:
-                            task_info["errors"].append(f"Could not parse deadline: {deadline_text}")
+            # Fallback: If not all fields found, try 'to' and 'by' as separators (last occurrence of each)
+            to_idx = scan.separators.get("to")
+            by_idx = scan.separators.get("by")
+            if not (task_info["title"] and task_info["assignee"]) and to_idx is not None and by_idx is not None:
+                # Task title: before 'to'
+                title = span_text(words, 0, to_idx, SPAN_FILLERS_KEEP_COMMA)
+                if title is not None and not task_info["title"]:
+                    task_info["title"] = title
+                # Assignee: between 'to' and 'by'
+                raw_assignee = span_text(words, to_idx + 1, by_idx, SPAN_FILLERS_KEEP_COMMA)
+                if raw_assignee is not None and not task_info["assignee"]:
+                    # Map the transcribed name to predefined users, keeping the similarity matrix for debugging
+                    task_info["assignee"], task_info["assignee_similarity"] = self._resolve_user(raw_assignee)
+                # Deadline: after 'by'
+                deadline_text = span_text(words, by_idx + 1, len(words), SPAN_FILLERS_KEEP_COMMA)
+                if deadline_text is not None and not task_info["deadline"]:
+                    parsed_deadline = self._parse_deadline(deadline_text)
+                    if parsed_deadline:
+                        task_info["deadline"] = parsed_deadline
+                    else:
+                        task_info["errors"].append(f"Could not parse deadline: {deadline_text}")
 
             # Set success if at least title and assignee found
             if task_info["title"] and task_info["assignee"]:
@@ -0,0 +1,92 @@
+"""
+Voice activity detection for VoiceTaskAI
+Vectorized energy / zero-crossing VAD used to trim silence before transcription
+"""
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from app.utils.wav_decoder import SAMPLE_RATE
+
+
+def speech_frames(audio: np.ndarray,
+                  sample_rate: int = SAMPLE_RATE,
+                  frame_ms: int = 30,
+                  margin_db: float = 10.0,
+                  floor_db: float = -50.0,
+                  loud_db: float = -30.0) -> np.ndarray:
+    """
+    Classify fixed-size frames as speech or silence
+
+    A frame counts as speech when its energy clears an adaptive threshold set
+    `margin_db` above the recording's noise floor (clamped to [floor_db, loud_db]).
+    Quieter frames with a high zero-crossing rate are also kept so unvoiced
+    consonants like "s" and "f" at word edges aren't clipped.
+
+    Args:
+        audio: Mono float32 samples
+        sample_rate: Sample rate of the audio
+        frame_ms: Frame length in milliseconds
+        margin_db: Energy above the noise floor that counts as activity
+        floor_db: Lowest threshold, in dBFS
+        loud_db: Highest threshold, in dBFS; anything louder is always activity
+
+    Returns:
+        np.ndarray: Boolean mask with one entry per frame
+    """
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(audio) // frame_len
+    if n_frames == 0:
+        return np.zeros(0, dtype=bool)
+
+    frames = audio[:n_frames * frame_len].reshape(n_frames, frame_len)
+    energy_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+    noise_floor = np.percentile(energy_db, 10)
+    threshold = min(max(noise_floor + margin_db, floor_db), loud_db)
+
+    voiced = energy_db > threshold
+    unvoiced = (energy_db > threshold - 6.0) & (zcr > 0.25)
+    return voiced | unvoiced
+
+
+def trim_silence(audio: np.ndarray,
+                 sample_rate: int = SAMPLE_RATE,
+                 frame_ms: int = 30,
+                 padding_ms: int = 200,
+                 min_speech_ms: int = 150) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Trim leading and trailing silence
+
+    Args:
+        audio: Mono float32 samples
+        sample_rate: Sample rate of the audio
+        frame_ms: Frame length in milliseconds
+        padding_ms: Audio kept on either side of the detected speech
+        min_speech_ms: Minimum total speech needed to treat the clip as non-silent
+
+    Returns:
+        Tuple of (trimmed audio, info dict with durations and a speech_detected flag)
+    """
+    original_duration = len(audio) / sample_rate
+    mask = speech_frames(audio, sample_rate, frame_ms)
+    speech_ms = int(mask.sum()) * frame_ms
+
+    info = {
+        "original_duration": round(original_duration, 3),
+        "trimmed_duration": 0.0,
+        "speech_detected": speech_ms >= min_speech_ms
+    }
+    if not info["speech_detected"]:
+        return audio[:0], info
+
+    frame_len = int(sample_rate * frame_ms / 1000)
+    padding = int(sample_rate * padding_ms / 1000)
+    active = np.flatnonzero(mask)
+    start = max(0, active[0] * frame_len - padding)
+    end = min(len(audio), (active[-1] + 1) * frame_len + padding)
+
+    trimmed = audio[start:end]
+    info["trimmed_duration"] = round(len(trimmed) / sample_rate, 3)
+    return trimmed, info
@@ -4,41 +4,225 @@ Voice processing utilities for VoiceTaskAI
 import os
 import tempfile
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
-import whisper
+from typing import Optional, Dict, Any, Tuple, Union, Callable
+import numpy as np
 import ffmpeg
 
 from app.config import settings
+from app.utils.wav_decoder import SAMPLE_RATE, is_pcm16_wav, decode_pcm16_wav
+from app.utils.batch_scheduler import BatchScheduler
+from app.utils.vad import trim_silence
+from app.utils.load_state import LoadState
+from app.utils.task_parser import task_parser
 
 # Configure logging
 logging.basicConfig(level=getattr(logging, settings.log_level))
 logger = logging.getLogger(__name__)
 
+# Whisper works on 30-second windows; only clips that fit in one can be batched
+BATCH_MAX_SAMPLES = 30 * SAMPLE_RATE
+
+
+class CascadeStats:
+    """Escalation rate and latency savings for the two-tier ASR cascade"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.escalations = 0
+        self.reasons: Dict[str, int] = {}
+        # Requests answered by the fast model
+        self.accepted_audio_seconds = 0.0
+        self.accepted_fast_seconds = 0.0
+        # Requests that were re-run on the accurate model
+        self.escalated_audio_seconds = 0.0
+        self.escalated_fast_seconds = 0.0
+        self.escalated_accurate_seconds = 0.0
+    
+    def record(self, audio_seconds: float, fast_seconds: float,
+               accurate_seconds: Optional[float] = None, reason: Optional[str] = None):
+        """Record one cascade decision"""
+        with self._lock:
+            self.requests += 1
+            if accurate_seconds is None:
+                self.accepted_audio_seconds += audio_seconds
+                self.accepted_fast_seconds += fast_seconds
+            else:
+                self.escalations += 1
+                self.reasons[reason] = self.reasons.get(reason, 0) + 1
+                self.escalated_audio_seconds += audio_seconds
+                self.escalated_fast_seconds += fast_seconds
+                self.escalated_accurate_seconds += accurate_seconds
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of cascade counters
+        
+        Savings are estimated from the accurate model's real-time factor measured on escalations.
+        """
+        with self._lock:
+            stats = {
+                "requests": self.requests,
+                "escalations": self.escalations,
+                "escalation_rate": round(self.escalations / self.requests, 3) if self.requests else 0.0,
+                "escalation_reasons": dict(self.reasons),
+                "estimated_seconds_saved": None
+            }
+            if self.escalated_audio_seconds > 0:
+                accurate_rtf = self.escalated_accurate_seconds / self.escalated_audio_seconds
+                saved = accurate_rtf * self.accepted_audio_seconds - self.accepted_fast_seconds
+                # Escalated requests paid for the fast pass on top of the accurate one
+                stats["estimated_seconds_saved"] = round(saved - self.escalated_fast_seconds, 3)
+            return stats
+
 
 class VoiceProcessor:
     """Voice processing class using Whisper for transcription"""
     
-    def __init__(self, model_name: str = "base"):
+    def __init__(self, model_name: str = "base", enable_cascade: bool = True):
         """
-        Initialize voice processor with Whisper model
+        Initialize voice processor; the Whisper model is loaded on first use
         
         Args:
             model_name: Whisper model to use (tiny, base, small, medium, large)
+            enable_cascade: Put a fast model in front of this one when the cascade is configured
         """
         self.model_name = model_name
-        self.model = None
-        self._load_model()
+        self._model = None
+        self.load_state = LoadState(f"whisper-{model_name}")
+        # Whisper installs KV-cache hooks on the shared model during decoding,
+        # so decodes on the same model must not overlap
+        self._model_lock = threading.Lock()
+        # (roster version, prompt) of the last vocabulary prompt built
+        self._prompt: Tuple[int, str] = (-1, "")
+        self.batch_scheduler = None
+        if settings.batch_enabled:
+            self.batch_scheduler = BatchScheduler(
+                lambda: self.model,
+                window_ms=settings.batch_window_ms,
+                max_batch_size=settings.batch_max_size,
+                model_lock=self._model_lock,
+                options_provider=self.batch_decode_options
+            )
+        
+        # Two-tier cascade: transcribe with a small model first, escalate to this one when needed
+        self.fast_processor: Optional["VoiceProcessor"] = None
+        self.cascade_stats = CascadeStats()
+        if enable_cascade and settings.cascade_enabled and settings.cascade_fast_model != model_name:
+            self.fast_processor = VoiceProcessor(settings.cascade_fast_model, enable_cascade=False)
+    
+    @property
+    def model(self):
+        """The Whisper model, loaded on first access"""
+        if self._model is None:
+            self._load_model()
+        return self._model
     
     def _load_model(self):
         """Load Whisper model"""
-        try:
-            logger.info(f"Loading Whisper model: {self.model_name}")
-            self.model = whisper.load_model(self.model_name)
-            logger.info(f"✅ Whisper model '{self.model_name}' loaded successfully")
-        except Exception as e:
-            logger.error(f"❌ Failed to load Whisper model: {e}")
-            raise
+        with self.load_state.lock:
+            if self._model is not None:
+                return
+            try:
+                logger.info(f"Loading Whisper model: {self.model_name}")
+                # Importing whisper pulls in torch, so it's deferred until the model is needed
+                import whisper
+                with self.load_state.track("load"):
+                    self._model = whisper.load_model(self.model_name)
+                logger.info(f"✅ Whisper model '{self.model_name}' loaded successfully")
+            except Exception as e:
+                logger.error(f"❌ Failed to load Whisper model: {e}")
+                raise
+    
+    def warm_up(self):
+        """Load the model and run one dummy inference to prime kernels and caches"""
+        if self.fast_processor is not None:
+            self.fast_processor.warm_up()
+        model = self.model
+        if self.load_state.ready:
+            return
+        logger.info(f"Warming up Whisper model: {self.model_name}")
+        dummy = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        with self.load_state.track("warmup"), self._model_lock:
+            model.transcribe(dummy, fp16=model.device.type == "cuda")
+        logger.info(f"✅ Whisper model warmed up in {self.load_state.warmup_seconds:.2f}s")
+    
+    def _vocabulary_prompt(self) -> str:
+        """
+        Initial prompt that primes Whisper with the command keywords, users and categories
+        
+        Names come from the parser's live roster, categories first, and stop once
+        the prompt would pass settings.vocabulary_prompt_max_chars; Whisper only
+        keeps the end of a longer prompt. Rebuilt when the roster version changes.
+        """
+        version = task_parser.roster_version
+        if self._prompt[0] == version:
+            return self._prompt[1]
+        prompt = "Task, user, category, deadline."
+        budget = settings.vocabulary_prompt_max_chars
+        for label, names in (("Categories", task_parser.predefined_categories),
+                             ("Users", task_parser.predefined_users)):
+            listed = []
+            length = len(prompt) + len(label) + 4
+            for name in names:
+                length += len(name) + (2 if listed else 0)
+                if length > budget:
+                    break
+                listed.append(name)
+            if listed:
+                prompt += f" {label}: {', '.join(listed)}."
+        self._prompt = (version, prompt)
+        return prompt
+    
+    def profile_options(self) -> Dict[str, Any]:
+        """
+        Options of the configured decode profile, with the vocabulary prompt resolved
+        
+        Returns:
+            Dict of keyword arguments for model.transcribe()
+        """
+        options = settings.decode_profile_options
+        if options.pop("initial_prompt_vocabulary", False):
+            options["initial_prompt"] = self._vocabulary_prompt()
+        return options
+    
+    def batch_decode_options(self) -> Dict[str, Any]:
+        """
+        Map the decode profile onto whisper.DecodingOptions for batched decoding
+        
+        Batches always decode at a single temperature, so fallback settings don't apply.
+        """
+        profile = self.profile_options()
+        options = {key: profile[key] for key in ("language", "sample_len", "beam_size", "without_timestamps") if key in profile}
+        temperature = profile.get("temperature", 0.0)
+        options["temperature"] = temperature[0] if isinstance(temperature, (tuple, list)) else temperature
+        if "initial_prompt" in profile:
+            options["prompt"] = profile["initial_prompt"]
+        return options
+    
+    def decode_fingerprint(self) -> Dict[str, Any]:
+        """
+        Model and decode settings that determine the transcription of a given clip
+        
+        Returns:
+            Dict used as part of the result cache key
+        """
+        return {
+            "model": self.model_name,
+            "decode_profile": settings.decode_profile,
+            "decode_options": self.profile_options(),
+            "roster_version": task_parser.roster_version,
+            "batched": self.batch_scheduler is not None,
+            "vad": [settings.vad_enabled, settings.vad_padding_ms, settings.vad_min_speech_ms],
+            "cascade": None if self.fast_processor is None else [
+                self.fast_processor.model_name,
+                settings.cascade_min_avg_logprob,
+                settings.cascade_max_no_speech_prob
+            ]
+        }
     
     def convert_audio_format(self, input_path: str, output_path: str) -> bool:
         """
@@ -66,24 +250,138 @@ class VoiceProcessor:
             logger.error(f"❌ Audio conversion failed: {e}")
             return False
     
-    def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+    def decode_audio_bytes(self, audio_data: bytes) -> np.ndarray:
+        """
+        Decode audio bytes in memory by piping them through ffmpeg
+        
+        Args:
+            audio_data: Raw audio file bytes
+            
+        Returns:
+            np.ndarray: Mono float32 samples at 16 kHz
+        """
+        out, _ = (
+            ffmpeg
+            .input("pipe:0")
+            .output("pipe:1", format="f32le", acodec="pcm_f32le", ac=1, ar=SAMPLE_RATE)
+            .run(input=audio_data, capture_stdout=True, capture_stderr=True)
+        )
+        # frombuffer gives a read-only view; torch.from_numpy needs a writable array
+        return np.frombuffer(out, dtype=np.float32).copy()
+    
+    def decode_audio(self, audio_data: bytes) -> np.ndarray:
+        """
+        Decode audio bytes to 16 kHz mono float32 samples
+        
+        Plain 16-bit PCM WAV (what the frontend uploads) is decoded in-process;
+        everything else goes through ffmpeg.
+        
+        Args:
+            audio_data: Raw audio file bytes
+            
+        Returns:
+            np.ndarray: Mono float32 samples at 16 kHz
+        """
+        if is_pcm16_wav(audio_data):
+            logger.info("Decoding PCM WAV natively")
+            return decode_pcm16_wav(audio_data, SAMPLE_RATE)
+        
+        return self.decode_audio_bytes(audio_data)
+    
+    def transcribe_audio(self,
+                         audio: Union[str, np.ndarray],
+                         accept: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
         """
-        Transcribe audio file using Whisper
+        Transcribe audio using Whisper, through the fast/accurate cascade when configured
         
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or 16 kHz mono float32 samples
+            accept: Optional check on the fast model's text (e.g. "did the parser find a task?");
+                    returning False escalates to the accurate model
+            
+        Returns:
+            Dict containing transcription results
+        """
+        if self.fast_processor is None or not isinstance(audio, np.ndarray):
+            return self._transcribe_single(audio)
+        return self._transcribe_cascade(audio, accept)
+    
+    def _low_confidence_reason(self, result: Dict[str, Any]) -> Optional[str]:
+        """
+        Decide whether a fast-model transcription needs a second opinion
+        
+        Returns:
+            Escalation reason, or None if the transcription looks good
+        """
+        if not result.get("success"):
+            return "fast_model_failed"
+        if not result.get("text"):
+            return "empty_transcript"
+        for segment in result.get("segments", []):
+            if segment.get("avg_logprob", 0.0) < settings.cascade_min_avg_logprob:
+                return "low_avg_logprob"
+            if segment.get("no_speech_prob", 0.0) > settings.cascade_max_no_speech_prob:
+                return "high_no_speech_prob"
+        return None
+    
+    def _transcribe_cascade(self, audio: np.ndarray, accept: Optional[Callable[[str], bool]]) -> Dict[str, Any]:
+        """Transcribe with the fast model and re-run on this model only when needed"""
+        audio_seconds = len(audio) / SAMPLE_RATE
+        
+        started_at = time.perf_counter()
+        result = self.fast_processor._transcribe_single(audio)
+        fast_seconds = time.perf_counter() - started_at
+        
+        reason = self._low_confidence_reason(result)
+        if reason is None and accept is not None and not accept(result["text"]):
+            reason = "parse_failed"
+        
+        if reason is None:
+            self.cascade_stats.record(audio_seconds, fast_seconds)
+            result["asr"] = {"model": self.fast_processor.model_name, "escalated": False}
+            return result
+        
+        logger.info(f"Escalating transcription to '{self.model_name}': {reason}")
+        started_at = time.perf_counter()
+        result = self._transcribe_single(audio)
+        self.cascade_stats.record(audio_seconds, fast_seconds, time.perf_counter() - started_at, reason)
+        result["asr"] = {"model": self.model_name, "escalated": True, "escalation_reason": reason}
+        return result
+    
+    def _transcribe_single(self, audio: Union[str, np.ndarray]) -> Dict[str, Any]:
+        """
+        Transcribe audio with this processor's Whisper model
+        
+        Args:
+            audio: Path to audio file, or 16 kHz mono float32 samples
             
         Returns:
             Dict containing transcription results
         """
         try:
-            logger.info(f"Transcribing audio: {audio_path}")
+            if isinstance(audio, np.ndarray):
+                logger.info(f"Transcribing in-memory audio: {len(audio) / SAMPLE_RATE:.2f}s")
+            else:
+                logger.info(f"Transcribing audio: {audio}")
+                
+                if not os.path.exists(audio):
+                    raise FileNotFoundError(f"Audio file not found: {audio}")
             
-            if not os.path.exists(audio_path):
-                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            if (self.batch_scheduler is not None
+                    and isinstance(audio, np.ndarray)
+                    and len(audio) <= BATCH_MAX_SAMPLES):
+                # Short clips share an encoder/decoder pass with concurrent requests
+                result = self.batch_scheduler.transcribe(audio)
+                result["decode_profile"] = settings.decode_profile
+                logger.info(f"✅ Batched transcription successful: {result['text'][:50]}...")
+                return result
             
-            # Transcribe using Whisper
-            result = self.model.transcribe(audio_path)
+            # Transcribe using Whisper with the configured decode profile
+            options = self.profile_options()
+            model = self.model
+            options["fp16"] = model.device.type == "cuda"
+            with self._model_lock:
+                result = model.transcribe(audio, **options)
             
             logger.info(f"✅ Transcription successful: {result['text'][:50]}...")
             
@@ -91,6 +389,7 @@ class VoiceProcessor:
                 "text": result["text"].strip(),
                 "language": result.get("language", "unknown"),
                 "segments": result.get("segments", []),
+                "decode_profile": settings.decode_profile,
                 "success": True
             }
             
@@ -104,13 +403,94 @@ class VoiceProcessor:
                 "error": str(e)
             }
     
-    def process_audio_file(self, audio_data: bytes, filename: str) -> Dict[str, Any]:
+    def transcribe_samples(self, audio: np.ndarray, accept: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """
+        Trim silence from decoded audio and transcribe what's left
+        
+        Args:
+            audio: 16 kHz mono float32 samples
+            accept: Optional cascade acceptance check, see transcribe_audio
+            
+        Returns:
+            Dict containing transcription results plus audio_metadata
+        """
+        audio_metadata = {"original_duration": round(len(audio) / SAMPLE_RATE, 3)}
+        
+        if settings.vad_enabled:
+            audio, audio_metadata = trim_silence(
+                audio,
+                SAMPLE_RATE,
+                padding_ms=settings.vad_padding_ms,
+                min_speech_ms=settings.vad_min_speech_ms
+            )
+            if not audio_metadata["speech_detected"]:
+                logger.warning("No speech detected, skipping transcription")
+                return {
+                    "text": "",
+                    "language": "unknown",
+                    "segments": [],
+                    "success": False,
+                    "error": "No speech detected in recording",
+                    "audio_metadata": audio_metadata
+                }
+            logger.info(f"VAD trimmed {audio_metadata['original_duration']:.2f}s -> {audio_metadata['trimmed_duration']:.2f}s")
+        
+        result = self.transcribe_audio(audio, accept)
+        result["audio_metadata"] = audio_metadata
+        return result
+    
+    def process_audio_file(self,
+                           audio_data: bytes,
+                           filename: str,
+                           accept: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
         """
         Process audio file from bytes to transcription
         
         Args:
             audio_data: Raw audio file bytes
             filename: Original filename
+            accept: Optional cascade acceptance check, see transcribe_audio
+            
+        Returns:
+            Dict containing processing results
+        """
+        if settings.audio_decode_mode == "disk" and not is_pcm16_wav(audio_data):
+            return self._process_audio_file_on_disk(audio_data, filename, accept)
+        
+        try:
+            logger.info(f"Processing audio file in memory: {filename}")
+            
+            try:
+                audio = self.decode_audio(audio_data)
+            except ffmpeg.Error as e:
+                # Some containers (e.g. MP4 with a trailing moov atom) can't be
+                # demuxed from a pipe, so retry them through temp files
+                logger.warning(f"In-memory decode failed, falling back to disk: {e.stderr.decode(errors='ignore')[-200:]}")
+                return self._process_audio_file_on_disk(audio_data, filename, accept)
+            
+            return self.transcribe_samples(audio, accept)
+            
+        except Exception as e:
+            logger.error(f"❌ Audio processing failed: {e}")
+            return {
+                "text": "",
+                "language": "unknown",
+                "segments": [],
+                "success": False,
+                "error": str(e)
+            }
+    
+    def _process_audio_file_on_disk(self,
+                                    audio_data: bytes,
+                                    filename: str,
+                                    accept: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """
+        Process audio file through temporary files and an ffmpeg conversion
+        
+        Args:
+            audio_data: Raw audio file bytes
+            filename: Original filename
+            accept: Optional cascade acceptance check, see transcribe_audio
             
         Returns:
             Dict containing processing results
@@ -130,7 +510,8 @@ class VoiceProcessor:
                 raise Exception("Audio conversion failed")
             
             # Transcribe the converted audio
-            transcription_result = self.transcribe_audio(temp_output_path)
+            with open(temp_output_path, "rb") as converted_file:
+                transcription_result = self.transcribe_samples(decode_pcm16_wav(converted_file.read()), accept)
             
             # Clean up temporary files
             try:
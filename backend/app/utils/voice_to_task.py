@@ -1,9 +1,45 @@
 """
 Voice-to-task pipeline: Connects Whisper transcription and spaCy task parsing
 """
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, List
 from app.utils.voice_processor import voice_processor
 from app.utils.task_parser import task_parser
+from app.utils.result_cache import result_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _processing_metadata(transcription_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the audio and ASR details worth recording with the task"""
+    metadata = dict(transcription_result.get('audio_metadata', {}))
+    if transcription_result.get('decode_profile'):
+        metadata['decode_profile'] = transcription_result['decode_profile']
+    asr = transcription_result.get('asr')
+    if asr:
+        metadata['asr_model'] = asr['model']
+        metadata['asr_escalated'] = asr['escalated']
+        if asr.get('escalation_reason'):
+            metadata['asr_escalation_reason'] = asr['escalation_reason']
+    return metadata
+
+
+def _task_result(text: str,
+                 tasks: List[Dict[str, Any]],
+                 processing_metadata: Dict[str, Any],
+                 cached: bool) -> Dict[str, Any]:
+    """Build the pipeline result; "task" is the first task that parsed, "tasks" all of them"""
+    successful = [task for task in tasks if task.get('success')]
+    task_info = successful[0] if successful else tasks[0]
+    return {
+        'success': bool(successful),
+        'transcription': text,
+        'task': task_info,
+        'tasks': tasks,
+        'error': task_info.get('errors', []),
+        'processing_metadata': processing_metadata,
+        'cached': cached
+    }
 
 
 def voice_to_task(audio_bytes: bytes, filename: str) -> Dict[str, Any]:
@@ -13,26 +49,54 @@ def voice_to_task(audio_bytes: bytes, filename: str) -> Dict[str, Any]:
         audio_bytes: Raw audio file bytes
         filename: Name of the audio file
     Returns:
-        Dict with transcription, task info, and success status
+        Dict with transcription, task info (first parsed task plus the list of
+        all tasks in the recording), and success status
     """
+    cache_key = result_cache.make_key(audio_bytes, voice_processor.decode_fingerprint())
+    parse_context = task_parser.parse_context()
+    
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Result cache hit for {filename}")
+        text = cached['transcription']
+        tasks = cached.get('tasks')
+        # Deadlines and name mapping depend on the date and roster, so re-parse if those moved
+        if tasks is None or cached.get('parse_context') != parse_context:
+            tasks = task_parser.parse_task_commands(text)
+            cached['tasks'] = tasks
+            cached['parse_context'] = parse_context
+            result_cache.put(cache_key, cached)
+        return _task_result(text, tasks, cached.get('processing_metadata', {}), cached=True)
+    
+    # Parses made while the ASR cascade checks the fast transcript are reused below
+    parses: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def parses_as_task(candidate: str) -> bool:
+        parses[candidate] = task_parser.parse_task_commands(candidate)
+        return any(task.get('success') for task in parses[candidate])
+    
     # Step 1: Transcribe audio
-    transcription_result = voice_processor.process_audio_file(audio_bytes, filename)
+    transcription_result = voice_processor.process_audio_file(audio_bytes, filename, accept=parses_as_task)
+    processing_metadata = _processing_metadata(transcription_result)
     
     if not transcription_result.get('success'):
         return {
             'success': False,
             'error': transcription_result.get('error', 'Transcription failed'),
             'transcription': transcription_result.get('text', ''),
-            'task': None
+            'task': None,
+            'processing_metadata': processing_metadata
         }
     
-    # Step 2: Parse task from transcription
+    # Step 2: Parse every task dictated in the transcription
     text = transcription_result['text']
-    task_info = task_parser.parse_task_command(text)
+    tasks = parses.get(text) or task_parser.parse_task_commands(text)
     
-    return {
-        'success': task_info.get('success', False),
+    result_cache.put(cache_key, {
         'transcription': text,
-        'task': task_info,
-        'error': task_info.get('errors', [])
-    } 
\ No newline at end of file
+        'tasks': tasks,
+        'processing_metadata': processing_metadata,
+        'parse_context': parse_context
+    })
+    
+    return _task_result(text, tasks, processing_metadata, cached=False)
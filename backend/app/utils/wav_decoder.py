@@ -0,0 +1,241 @@
+"""
+Native WAV decoding for VoiceTaskAI
+Decodes plain 16-bit PCM WAV uploads in-process so ffmpeg only runs for other codecs
+"""
+import io
+import struct
+import wave
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Whisper expects 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _read_pcm16_wav(data: bytes) -> Optional[Tuple[int, int, memoryview]]:
+    """
+    Walk the RIFF chunks of a WAV file
+
+    Args:
+        data: Raw file bytes
+
+    Returns:
+        Tuple of (channels, sample_rate, sample bytes) for 16-bit PCM WAV, else None
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+
+    view = memoryview(data)
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack_from("<I", data, offset + 4)[0]
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(data):
+                return None
+            audio_format, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", data, body)
+            if audio_format == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26 and body + 26 <= len(data):
+                # The sub-format GUID starts with the actual format tag
+                audio_format = struct.unpack_from("<H", data, body + 24)[0]
+            if audio_format != WAVE_FORMAT_PCM or bits != 16 or channels == 0 or sample_rate == 0:
+                return None
+            fmt = (channels, sample_rate)
+        elif chunk_id == b"data" and fmt is not None:
+            # Streaming writers may leave the size as a placeholder, so clamp it
+            end = min(body + chunk_size, len(data))
+            return fmt[0], fmt[1], view[body:end]
+
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def is_pcm16_wav(data: bytes) -> bool:
+    """Check whether the bytes are a 16-bit PCM WAV file we can decode natively"""
+    return _read_pcm16_wav(data) is not None
+
+
+def _lowpass_taps(orig_rate: int, target_rate: int, num_taps: int = 63) -> np.ndarray:
+    """Windowed-sinc low-pass at the target Nyquist frequency"""
+    cutoff = 0.5 * target_rate / orig_rate
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(num_taps)
+    return taps / taps.sum()
+
+
+def resample(audio: np.ndarray, orig_rate: int, target_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Resample mono audio with a windowed-sinc anti-aliasing filter and linear interpolation
+
+    Args:
+        audio: Mono float32 samples
+        orig_rate: Sample rate of the input
+        target_rate: Desired sample rate
+
+    Returns:
+        np.ndarray: Resampled float32 samples
+    """
+    if orig_rate == target_rate or len(audio) == 0:
+        return audio
+
+    if orig_rate > target_rate:
+        # Low-pass at the target Nyquist frequency before decimating
+        audio = np.convolve(audio, _lowpass_taps(orig_rate, target_rate), mode="same")
+
+    n_out = int(round(len(audio) * target_rate / orig_rate))
+    positions = np.arange(n_out) * (orig_rate / target_rate)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+class StreamResampler:
+    """
+    Chunk-by-chunk version of resample() for audio arriving in pieces
+
+    Filter history and the fractional read position carry over between
+    chunks, so the output matches resampling the whole stream at once instead
+    of restarting the filter and rounding the length at every chunk boundary.
+    """
+
+    def __init__(self, orig_rate: int, target_rate: int = SAMPLE_RATE):
+        """
+        Initialize stream resampler
+
+        Args:
+            orig_rate: Sample rate of the incoming audio
+            target_rate: Desired sample rate
+        """
+        self.ratio = orig_rate / target_rate
+        self.passthrough = orig_rate == target_rate
+        self._taps = _lowpass_taps(orig_rate, target_rate) if orig_rate > target_rate else None
+        # Centered filter: the first output sample sees half a filter of silence, like mode="same"
+        self._history = np.zeros(len(self._taps) // 2 if self._taps is not None else 0, dtype=np.float32)
+        # Filtered samples still needed for interpolation, starting at stream index _base
+        self._filtered = np.zeros(0, dtype=np.float32)
+        self._base = 0
+        self._next_output = 0
+        self._consumed = 0
+
+    def _filter(self, audio: np.ndarray) -> np.ndarray:
+        if self._taps is None:
+            return audio
+        extended = np.concatenate([self._history, audio])
+        if len(extended) < len(self._taps):
+            self._history = extended
+            return np.zeros(0, dtype=np.float32)
+        self._history = extended[len(extended) - (len(self._taps) - 1):]
+        return np.convolve(extended, self._taps, mode="valid")
+
+    def _interpolate(self, filtered: np.ndarray, last_output: Optional[int] = None) -> np.ndarray:
+        buffer = np.concatenate([self._filtered, filtered])
+        end = self._base + len(buffer)
+        if len(buffer) == 0:
+            return np.zeros(0, dtype=np.float32)
+        if last_output is None:
+            # Emit every output whose source position lies within the samples seen so far
+            last_output = int(np.floor((end - 1) / self.ratio))
+        outputs = np.arange(self._next_output, last_output + 1)
+        positions = outputs * self.ratio - self._base
+        resampled = np.interp(positions, np.arange(len(buffer)), buffer).astype(np.float32)
+
+        self._next_output = last_output + 1
+        keep_from = min(max(int(np.floor(self._next_output * self.ratio)) - self._base, 0), len(buffer))
+        self._filtered = buffer[keep_from:]
+        self._base += keep_from
+        return resampled
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk
+
+        Args:
+            audio: Mono float32 samples following the previous chunk
+
+        Returns:
+            np.ndarray: Resampled float32 samples available so far
+        """
+        if self.passthrough:
+            return audio
+        self._consumed += len(audio)
+        return self._interpolate(self._filter(audio))
+
+    def flush(self) -> np.ndarray:
+        """Release the samples held back by the filter once the stream has ended"""
+        if self.passthrough:
+            return np.zeros(0, dtype=np.float32)
+        tail = np.zeros(len(self._taps) // 2 if self._taps is not None else 0, dtype=np.float32)
+        filtered = self._filter(tail) if self._taps is not None else tail
+        # Same output length as resample() on the whole stream; the last samples hold the final value
+        return self._interpolate(filtered, last_output=int(round(self._consumed / self.ratio)) - 1)
+
+
+def pcm16_to_mono(pcm: bytes, channels: int = 1) -> np.ndarray:
+    """
+    Convert raw interleaved little-endian 16-bit PCM to mono float32
+
+    Args:
+        pcm: Raw sample bytes (no header)
+        channels: Number of interleaved channels
+
+    Returns:
+        np.ndarray: Mono float32 samples in [-1, 1]
+    """
+    frame_count = len(pcm) // (2 * channels)
+    samples = np.frombuffer(pcm, dtype="<i2", count=frame_count * channels)
+
+    if channels > 1:
+        # Interleaved frames -> average the channels
+        audio = samples.reshape(frame_count, channels).mean(axis=1, dtype=np.float32)
+    else:
+        audio = samples.astype(np.float32)
+    audio /= 32768.0
+    return audio
+
+
+def encode_pcm16_wav(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """
+    Encode mono float32 samples as a 16-bit PCM WAV file
+
+    Args:
+        audio: Mono float32 samples in [-1, 1]
+        sample_rate: Sample rate of the audio
+
+    Returns:
+        bytes: WAV file contents
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def decode_pcm16_wav(data: bytes, target_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decode a 16-bit PCM WAV file to mono float32 samples at the target rate
+
+    Args:
+        data: Raw WAV file bytes
+        target_rate: Desired sample rate
+
+    Returns:
+        np.ndarray: Mono float32 samples in [-1, 1]
+
+    Raises:
+        ValueError: If the bytes are not a 16-bit PCM WAV file
+    """
+    parsed = _read_pcm16_wav(data)
+    if parsed is None:
+        raise ValueError("Not a 16-bit PCM WAV file")
+
+    channels, sample_rate, pcm = parsed
+    return resample(pcm16_to_mono(pcm, channels), sample_rate, target_rate)
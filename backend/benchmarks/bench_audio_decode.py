@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: native WAV decode vs. in-memory ffmpeg pipe vs. temp-file decode
+
+Usage:
+    python benchmarks/bench_audio_decode.py [--runs 20] [--transcribe]
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.voice_processor import voice_processor
+from app.utils.wav_decoder import decode_pcm16_wav
+import whisper
+
+
+def make_wav_bytes(duration: float, sample_rate: int = 44100) -> bytes:
+    """Build a 16-bit mono WAV similar to what the frontend uploads"""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    samples = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.05 * np.random.randn(len(t))
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((np.clip(samples, -1, 1) * 32767).astype(np.int16).tobytes())
+    return buffer.getvalue()
+
+
+def decode_on_disk(audio_data: bytes) -> np.ndarray:
+    """Replicate the temp-file path: write, convert, and let Whisper re-read"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
+        temp_file.write(audio_data)
+        temp_input_path = temp_file.name
+    temp_output_path = temp_input_path.replace(".wav", "_converted.wav")
+    try:
+        voice_processor.convert_audio_format(temp_input_path, temp_output_path)
+        return whisper.load_audio(temp_output_path)
+    finally:
+        for path in (temp_input_path, temp_output_path):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def time_runs(fn, runs: int) -> list:
+    """Return per-run wall times in milliseconds"""
+    fn()  # warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list):
+    print(f"  {label:<22} mean {statistics.mean(timings):8.2f} ms   "
+          f"p50 {statistics.median(timings):8.2f} ms   max {max(timings):8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--transcribe", action="store_true",
+                        help="Also time the full process_audio_file path including Whisper")
+    args = parser.parse_args()
+
+    print("🎵 Audio decode benchmark")
+    print("=" * 60)
+
+    for duration in (2.0, 5.0, 15.0):
+        audio_data = make_wav_bytes(duration)
+        print(f"\n{duration:.0f}s clip ({len(audio_data) / 1024:.0f} KiB)")
+        report("disk (temp files)", time_runs(lambda: decode_on_disk(audio_data), args.runs))
+        report("memory (pipe)", time_runs(lambda: voice_processor.decode_audio_bytes(audio_data), args.runs))
+        report("native wav", time_runs(lambda: decode_pcm16_wav(audio_data), args.runs))
+
+        if args.transcribe:
+            transcribe_runs = max(1, args.runs // 5)
+            report("disk + transcribe", time_runs(
+                lambda: voice_processor._process_audio_file_on_disk(audio_data, "bench.wav"), transcribe_runs))
+            report("native + transcribe", time_runs(
+                lambda: voice_processor.process_audio_file(audio_data, "bench.wav"), transcribe_runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: micro-batch size vs. latency for Whisper on CPU
+
+Fires bursts of concurrent short clips at a BatchScheduler and reports
+per-request latency and throughput for each max batch size / window.
+
+Usage:
+    python benchmarks/bench_batching.py [--audio command.wav] [--requests 16]
+"""
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.voice_processor import voice_processor
+from app.utils.batch_scheduler import BatchScheduler
+from app.utils.wav_decoder import SAMPLE_RATE
+
+
+def load_clip(audio_path: str) -> np.ndarray:
+    """Use a real recording if given, otherwise a 3-second synthetic clip"""
+    if audio_path:
+        return voice_processor.decode_audio(Path(audio_path).read_bytes())
+    t = np.arange(3 * SAMPLE_RATE) / SAMPLE_RATE
+    return (0.2 * np.sin(2 * np.pi * 180 * t) * np.sin(2 * np.pi * 3 * t)).astype(np.float32)
+
+
+def run_burst(scheduler: BatchScheduler, clip: np.ndarray, requests: int):
+    """Submit a burst of requests at once and time each one"""
+    def one(_):
+        start = time.perf_counter()
+        scheduler.transcribe(clip)
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=requests) as executor:
+        latencies = list(executor.map(one, range(requests)))
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", default="", help="WAV file with a spoken command")
+    parser.add_argument("--requests", type=int, default=16, help="Concurrent requests per burst")
+    parser.add_argument("--windows", default="20,50", help="Comma-separated batch windows in ms")
+    parser.add_argument("--sizes", default="1,2,4,8", help="Comma-separated max batch sizes")
+    args = parser.parse_args()
+
+    clip = load_clip(args.audio)
+    windows = [float(w) for w in args.windows.split(",")]
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    print(f"⚡ Micro-batching benchmark (model '{voice_processor.model_name}', "
+          f"{len(clip) / SAMPLE_RATE:.1f}s clip, {args.requests} concurrent requests)")
+    print("=" * 78)
+    print(f"{'window':>8} {'max batch':>10} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10} {'req/s':>8} {'avg batch':>10}")
+
+    for window in windows:
+        for size in sizes:
+            scheduler = BatchScheduler(lambda: voice_processor.model, window_ms=window, max_batch_size=size)
+            scheduler.transcribe(clip)  # warm-up
+            scheduler.batches = scheduler.items = 0
+
+            latencies, wall = run_burst(scheduler, clip, args.requests)
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+            print(f"{window:>8.0f} {size:>10d} {statistics.median(latencies):>10.0f} {p99:>10.0f} "
+                  f"{latencies[-1]:>10.0f} {args.requests / wall:>8.2f} {scheduler.stats()['avg_batch_size']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: deadline parsing throughput
+
+Compares plain dateparser.parse (the old path) with the rule engine, with and
+without its cache, on the deadline phrases found in the command corpus.
+
+Usage:
+    python benchmarks/bench_deadline_resolver.py [--repeat 20]
+"""
+import argparse
+import re
+import time
+
+from corpus import load_corpus
+
+from app.utils.deadline_resolver import DeadlineResolver
+from app.config import settings
+
+EXTRA_PHRASES = ["tomorrow", "end of day", "next week", "next month", "in 3 days", "Friday",
+                 "end of the month", "December 15", "2 weeks from now", "the 3rd of next month"]
+
+
+def corpus_phrases() -> list:
+    """Text following the deadline keyword in every corpus command"""
+    phrases = []
+    for text in load_corpus():
+        match = re.search(r"dead\s?lin\w*[\s,]+(.+)$", text, flags=re.IGNORECASE)
+        if match:
+            phrases.append(match.group(1).strip(" ."))
+    return phrases + EXTRA_PHRASES
+
+
+def throughput(parse, phrases: list, repeat: int) -> float:
+    """Parses per second over the phrase list"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for phrase in phrases:
+            parse(phrase)
+    return repeat * len(phrases) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    phrases = corpus_phrases()
+    start = time.perf_counter()
+    import dateparser
+    import_s = time.perf_counter() - start
+    dateparser.parse("tomorrow")
+
+    uncached = DeadlineResolver(settings.deadline_languages_list, cache_entries=0)
+    cached = DeadlineResolver(settings.deadline_languages_list)
+    uncached.warm_up()
+
+    print(f"📅 Deadline parsing benchmark ({len(phrases)} phrases x {args.repeat}, dateparser import {import_s:.2f}s)")
+    print("=" * 60)
+    for label, parse in (("dateparser.parse (all languages)", dateparser.parse),
+                         ("rules + dateparser fallback", uncached.resolve),
+                         ("rules + fallback, cached", cached.resolve)):
+        print(f"  {label:<36} {throughput(parse, phrases, args.repeat):>10.0f} parses/s")
+
+    stats = uncached.stats()
+    resolved = stats["rule_hits"] + stats["fallback_hits"] + stats["unparsed"]
+    print(f"\n  rule hit rate {stats['rule_hits'] / resolved:.0%}, "
+          f"fallback {stats['fallback_hits'] / resolved:.0%}, unparsed {stats['unparsed'] / resolved:.0%}")
+
+
+if __name__ == "__main__":
+    main()
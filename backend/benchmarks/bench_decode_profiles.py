@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Whisper decode profiles on short command audio
+
+Usage:
+    python benchmarks/bench_decode_profiles.py command1.wav [command2.wav ...] [--runs 5]
+
+Without audio files a synthetic clip is used, which only measures decoder
+overhead (language detection, fallback retries) rather than accuracy.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings, DECODE_PROFILES
+from app.utils.voice_processor import voice_processor
+from app.utils.wav_decoder import SAMPLE_RATE
+
+
+def load_clips(paths):
+    """Decode the given recordings, or synthesize one 3-second clip"""
+    if paths:
+        return {Path(p).name: voice_processor.decode_audio(Path(p).read_bytes()) for p in paths}
+    t = np.arange(3 * SAMPLE_RATE) / SAMPLE_RATE
+    return {"synthetic": (0.2 * np.sin(2 * np.pi * 180 * t) * np.sin(2 * np.pi * 3 * t)).astype(np.float32)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("audio", nargs="*", help="WAV recordings of spoken commands")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--profiles", default=",".join(DECODE_PROFILES))
+    args = parser.parse_args()
+
+    clips = load_clips(args.audio)
+    profiles = args.profiles.split(",")
+    original_profile = settings.decode_profile
+
+    print(f"🎛️ Decode profile benchmark (model '{voice_processor.model_name}', {args.runs} runs per clip)")
+    print("=" * 78)
+
+    voice_processor.warm_up()
+    try:
+        for profile in profiles:
+            settings.decode_profile = profile
+            print(f"\n{profile}")
+            for name, clip in clips.items():
+                voice_processor.transcribe_audio(clip)  # warm-up for this profile
+                timings = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    result = voice_processor.transcribe_audio(clip)
+                    timings.append((time.perf_counter() - start) * 1000)
+                print(f"  {name:<24} p50 {statistics.median(timings):8.0f} ms   "
+                      f"max {max(timings):8.0f} ms   → {result['text'][:60]!r}")
+    finally:
+        settings.decode_profile = original_profile
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: indexed name lookup vs scoring the whole roster
+
+Builds synthetic rosters, queries them with misspelled roster names and
+compares the NameIndex top match with an exhaustive SequenceMatcher scan.
+
+Usage:
+    python benchmarks/bench_name_index.py [--sizes 10000,100000] [--queries 200] [--no-phonetic]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Add the backend directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.name_index import NameIndex
+
+SYLLABLES = ["al", "be", "car", "da", "el", "fi", "go", "han", "is", "jo", "ka", "li", "mar",
+             "no", "os", "pe", "ra", "sa", "ta", "ul", "vi", "wen", "xa", "yo", "zed"]
+
+
+def make_roster(size: int, rng: random.Random) -> list:
+    """Unique 'First Last' names built from random syllables"""
+    names = set()
+    while len(names) < size:
+        first = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3))).capitalize()
+        last = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+        names.add(f"{first} {last}")
+    return sorted(names)
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Drop, swap or replace one character, like a transcription slip"""
+    chars = list(name.lower())
+    i = rng.randrange(len(chars))
+    edit = rng.choice(("drop", "replace", "swap"))
+    if edit == "drop" and len(chars) > 3:
+        del chars[i]
+    elif edit == "swap" and i + 1 < len(chars):
+        chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    else:
+        chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+def exhaustive(query: str, roster: list) -> tuple:
+    """Best roster match by scoring every entry (the old behaviour)"""
+    scores = [(name, SequenceMatcher(None, query, name.lower()).ratio()) for name in roster]
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--baseline-queries", type=int, default=20,
+                        help="Queries also run through the exhaustive scan (it is slow)")
+    parser.add_argument("--phonetic", action=argparse.BooleanOptionalAction, default=True,
+                        help="Try phonetic keys before n-gram candidates")
+    args = parser.parse_args()
+
+    print("📇 Name index benchmark")
+    print("=" * 108)
+    print(f"{'roster':>8} {'build s':>8} {'p50 ms':>8} {'p99 ms':>8} {'scan p50 ms':>12} "
+          f"{'speedup':>8} {'top-1 agrees':>13} {'recall@1':>9} {'phonetic':>9}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(size)
+        roster = make_roster(size, rng)
+        targets = [rng.choice(roster) for _ in range(args.queries)]
+        queries = [misspell(name, rng) for name in targets]
+
+        start = time.perf_counter()
+        index = NameIndex(roster, phonetic=args.phonetic)
+        build_s = time.perf_counter() - start
+
+        timings = []
+        hits = 0
+        phonetic_before = index.phonetic_hits
+        for query, target in zip(queries, targets):
+            start = time.perf_counter()
+            matches = index.search(query)
+            timings.append((time.perf_counter() - start) * 1000)
+            hits += bool(matches) and matches[0][0] == target
+
+        scan_timings = []
+        agree = 0
+        baseline = list(zip(queries, targets))[:args.baseline_queries]
+        for query, _ in baseline:
+            start = time.perf_counter()
+            best_name, best_score = exhaustive(query, roster)
+            scan_timings.append((time.perf_counter() - start) * 1000)
+            matches = index.search(query)
+            agree += bool(matches) and abs(matches[0][1] - best_score) < 1e-9
+
+        timings.sort()
+        p50 = statistics.median(timings)
+        scan_p50 = statistics.median(scan_timings) if scan_timings else float("nan")
+        print(f"{size:>8} {build_s:>8.2f} {p50:>8.2f} {timings[int(0.99 * (len(timings) - 1))]:>8.2f} "
+              f"{scan_p50:>12.1f} {scan_p50 / p50:>7.0f}x {agree:>6}/{len(baseline):<6} "
+              f"{hits / len(queries):>9.0%} {(index.phonetic_hits - phonetic_before) / len(queries):>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TaskParser throughput and memory per spaCy pipeline mode
+
+Each mode runs in a fresh interpreter so model memory doesn't accumulate.
+
+Usage:
+    python benchmarks/bench_parser_modes.py [--modes full,tokenizer,blank] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter
+CHILD_SCRIPT = r'''
+import json, resource, sys, time, tracemalloc
+sys.path.insert(0, "benchmarks")
+from corpus import load_corpus
+from app.utils.task_parser import TaskParser
+
+repeat = int(sys.argv[1])
+corpus = load_corpus()
+
+tracemalloc.start()
+start = time.perf_counter()
+parser = TaskParser()
+parser.nlp
+load_s = time.perf_counter() - start
+load_bytes = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+# Warm up dateparser and name mapping before timing
+for text in corpus:
+    parser.parse_task_command(text)
+
+tokenize_start = time.perf_counter()
+for _ in range(repeat):
+    for text in corpus:
+        parser.nlp(text)
+tokenize_s = time.perf_counter() - tokenize_start
+
+parse_start = time.perf_counter()
+successes = 0
+for _ in range(repeat):
+    for text in corpus:
+        successes += parser.parse_task_command(text)["success"]
+parse_s = time.perf_counter() - parse_start
+
+batch_start = time.perf_counter()
+for _ in range(repeat):
+    parser.parse_many(corpus)
+batch_s = time.perf_counter() - batch_start
+
+n = repeat * len(corpus)
+print("BENCH_RESULT " + json.dumps({
+    "pipes": parser.nlp.pipe_names,
+    "load_s": load_s,
+    "load_mib": load_bytes / 2**20,
+    "max_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "nlp_docs_per_s": n / tokenize_s,
+    "parses_per_s": n / parse_s,
+    "batch_parses_per_s": n / batch_s,
+    "success_rate": successes / n,
+}))
+'''
+
+
+def run_mode(mode: str, repeat: int) -> dict:
+    env = dict(os.environ, SPACY_PIPELINE=mode)
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, str(repeat)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("BENCH_RESULT "):
+            return json.loads(line[len("BENCH_RESULT "):])
+    raise RuntimeError(f"Benchmark child produced no result:\n{completed.stderr[-2000:]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modes", default="full,tokenizer,blank")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print("🧠 spaCy pipeline mode benchmark")
+    print("=" * 108)
+    print(f"{'mode':<10} {'load s':>8} {'load MiB':>9} {'RSS MiB':>9} {'nlp docs/s':>11} "
+          f"{'parses/s':>10} {'batch/s':>10} {'success':>8}  pipes")
+    for mode in args.modes.split(","):
+        r = run_mode(mode, args.repeat)
+        print(f"{mode:<10} {r['load_s']:>8.2f} {r['load_mib']:>9.1f} {r['max_rss_mib']:>9.0f} "
+              f"{r['nlp_docs_per_s']:>11.0f} {r['parses_per_s']:>10.0f} {r['batch_parses_per_s']:>10.0f} {r['success_rate']:>8.0%}  {r['pipes']}")
+
+
+if __name__ == "__main__":
+    main()
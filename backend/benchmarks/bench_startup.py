@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: startup cost — import time, model load, warm-up and first-request latency
+
+Each scenario runs in a fresh interpreter so import caches don't leak between runs.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter
+CHILD_SCRIPT = r'''
+import io, json, sys, time, wave
+import numpy as np
+
+def command_wav():
+    t = np.arange(3 * 16000) / 16000
+    samples = 0.3 * np.sin(2 * np.pi * 200 * t) * (np.sin(2 * np.pi * 2 * t) > 0)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1); f.setsampwidth(2); f.setframerate(16000)
+        f.writeframes((samples * 32767).astype(np.int16).tobytes())
+    return buffer.getvalue()
+
+timings = {}
+start = time.perf_counter()
+import main
+timings["import_main_s"] = time.perf_counter() - start
+
+from app.utils.voice_processor import voice_processor
+from app.utils.task_parser import task_parser
+from app.utils.voice_to_task import voice_to_task
+from app.utils.result_cache import result_cache
+
+if sys.argv[1] == "warm":
+    start = time.perf_counter()
+    task_parser.warm_up()
+    voice_processor.warm_up()
+    timings["load_and_warm_up_s"] = time.perf_counter() - start
+    timings["whisper_load_s"] = voice_processor.load_state.load_seconds
+    timings["whisper_warmup_s"] = voice_processor.load_state.warmup_seconds
+    timings["spacy_load_s"] = task_parser.load_state.load_seconds
+    timings["spacy_warmup_s"] = task_parser.load_state.warmup_seconds
+
+audio = command_wav()
+for label in ("first_request_s", "second_request_s"):
+    result_cache.memory.clear()
+    start = time.perf_counter()
+    voice_to_task(audio, "bench.wav")
+    timings[label] = time.perf_counter() - start
+
+print("BENCH_RESULT " + json.dumps(timings))
+'''
+
+
+def run_child(mode: str) -> dict:
+    """Run one scenario in a fresh interpreter and return its timings"""
+    env = dict(os.environ, PRELOAD_MODELS="false", RESULT_CACHE_DISK="false")
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, mode],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("BENCH_RESULT "):
+            return json.loads(line[len("BENCH_RESULT "):])
+    raise RuntimeError(f"Benchmark child produced no result:\n{completed.stderr[-2000:]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print("🚀 Startup benchmark")
+    print("=" * 60)
+
+    for mode, description in (("cold", "lazy load on first request"), ("warm", "explicit load + warm-up")):
+        runs = [run_child(mode) for _ in range(args.runs)]
+        print(f"\n{mode} ({description}), median of {args.runs} runs:")
+        for key in runs[0]:
+            values = [run[key] for run in runs if run.get(key) is not None]
+            if values:
+                print(f"  {key:<22} {statistics.median(values) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Command corpus shared by the parser benchmarks
+"""
+import json
+import random
+import sys
+from pathlib import Path
+from typing import List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Add the backend directory to Python path
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+def construction_commands() -> List[str]:
+    """Hand-written commands from test_construction_commands.py"""
+    from test_construction_commands import CONSTRUCTION_COMMANDS
+    return list(CONSTRUCTION_COMMANDS)
+
+
+def stored_transcriptions(tasks_dir: Path = BACKEND_DIR / "data" / "processed_tasks") -> List[str]:
+    """Real Whisper transcriptions saved with processed tasks"""
+    texts = []
+    for path in sorted(tasks_dir.glob("*.json")):
+        try:
+            text = json.loads(path.read_text(encoding="utf-8")).get("transcription", "")
+        except (OSError, ValueError):
+            continue
+        if text:
+            texts.append(text)
+    return texts
+
+
+TITLES = ["pour concrete foundation", "install electrical wiring", "inspect roof drainage",
+          "repair leaking pipe", "check fire exits", "paint north stairwell", "replace broken window",
+          "survey east lot", "clean site office", "test smoke detectors"]
+USERS = ["Alice", "Bob", "Charlie", "Ali", "alise", "charley", "bobb", "John", "Sarah"]
+CATEGORIES = ["Construction", "Inspection", "Maintenance", "construct", "inspections", "maintainance"]
+DEADLINES = ["today", "tomorrow", "next Friday", "Monday", "end of day", "next week",
+             "end of month", "in 3 days", "December 15", "the day after tomorrow"]
+KEYWORDS = {
+    "task": ["Task", "task", "tasks", "tusk"],
+    "user": ["user", "users", "youser"],
+    "category": ["category", "categories", "type"],
+    "deadline": ["deadline", "deadlin"],
+}
+
+
+def synthetic_commands(count: int, seed: int = 0, multi_task_ratio: float = 0.1) -> List[str]:
+    """
+    Generated commands with keyword misspellings, optional fields and multi-task utterances
+    
+    Args:
+        count: Number of commands
+        seed: Random seed, so runs are comparable
+        multi_task_ratio: Share of commands dictating two or three tasks
+    """
+    rng = random.Random(seed)
+    
+    def one_task() -> str:
+        parts = [rng.choice(KEYWORDS["task"]), rng.choice(TITLES), rng.choice(KEYWORDS["user"]), rng.choice(USERS)]
+        if rng.random() < 0.8:
+            parts += [rng.choice(KEYWORDS["category"]), rng.choice(CATEGORIES)]
+        if rng.random() < 0.8:
+            parts += [rng.choice(KEYWORDS["deadline"]), rng.choice(DEADLINES)]
+        return " ".join(parts)
+    
+    commands = []
+    for _ in range(count):
+        tasks = rng.choice([2, 3]) if rng.random() < multi_task_ratio else 1
+        commands.append(" and ".join(one_task() for _ in range(tasks)))
+    return commands
+
+
+def load_corpus(synthetic: int = 0) -> List[str]:
+    """Hand-written commands plus stored transcriptions, plus `synthetic` generated ones"""
+    return construction_commands() + stored_transcriptions() + synthetic_commands(synthetic)
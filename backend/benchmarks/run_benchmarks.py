@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: parser and pipeline metrics checked against stored baselines
+
+Measures, on the command corpus plus synthetic variants:
+  - TaskParser.parse_task_command throughput, p50/p99 latency and allocations
+  - user name mapping cost for growing roster sizes
+  - end-to-end voice_to_task time with a stub ASR (no Whisper model is loaded)
+
+Results are written as JSON and compared with benchmarks/baselines.json; any
+metric worse than its baseline by more than the tolerance fails the run. The
+baselines keep the environment they were recorded in, since timings from another
+machine or spaCy model aren't comparable. With --check a missing baselines file
+fails the run too, so CI can't pass without anything to compare against.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--synthetic 2000] [--repeat 3] [--output results/latest.json]
+    python benchmarks/run_benchmarks.py --update-baselines
+    python benchmarks/run_benchmarks.py --check
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+# Add the backend directory to Python path
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+# Keep cached pipeline results off disk while benchmarking
+os.environ.setdefault("RESULT_CACHE_DISK", "false")
+
+from corpus import construction_commands, stored_transcriptions, synthetic_commands
+from bench_name_index import make_roster, misspell
+
+from app.config import settings
+from app.utils.task_parser import task_parser
+from app.utils.voice_processor import voice_processor
+from app.utils.voice_to_task import voice_to_task
+
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_BASELINES = BENCH_DIR / "baselines.json"
+
+
+def metric(value: float, unit: str, better: str) -> dict:
+    """One result entry; `better` is "higher" or "lower" and drives the regression check"""
+    return {"value": round(value, 4), "unit": unit, "better": better}
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of the samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_parser(corpus: list, repeat: int) -> dict:
+    """parse_task_command throughput, latency percentiles and allocations"""
+    # Warm up spaCy, dateparser and the name memo before timing
+    for text in corpus:
+        task_parser.parse_task_command(text)
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            call_start = time.perf_counter()
+            task_parser.parse_task_command(text)
+            latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    # Allocation tracing slows everything down, so it gets its own pass
+    tracemalloc.start()
+    baseline_bytes = tracemalloc.get_traced_memory()[0]
+    for text in corpus:
+        task_parser.parse_task_command(text)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size for stat in snapshot.statistics("filename"))
+
+    return {
+        "parse.throughput": metric(len(latencies) / elapsed, "parses/s", "higher"),
+        "parse.p50_ms": metric(percentile(latencies, 0.50) * 1000, "ms", "lower"),
+        "parse.p99_ms": metric(percentile(latencies, 0.99) * 1000, "ms", "lower"),
+        "parse.peak_kib": metric((peak_bytes - baseline_bytes) / 1024, "KiB", "lower"),
+        "parse.retained_kib_per_parse": metric(allocated / len(corpus) / 1024, "KiB", "lower"),
+    }
+
+
+def bench_name_mapping(sizes: list, queries: int) -> dict:
+    """Cost of resolving a misspelled user name for each roster size"""
+    rng = random.Random(0)
+    original_users = task_parser.predefined_users
+    results = {}
+    try:
+        for size in sizes:
+            roster = make_roster(size, rng)
+            start = time.perf_counter()
+            task_parser.predefined_users = roster
+            build_s = time.perf_counter() - start
+
+            timings = []
+            for name in rng.sample(roster, min(queries, size)):
+                query = misspell(name, rng)
+                # Every lookup should hit the index, not the per-version memo
+                task_parser.name_memo.clear()
+                call_start = time.perf_counter()
+                task_parser._resolve_user(query)
+                timings.append(time.perf_counter() - call_start)
+
+            results[f"name_mapping.{size}.mean_us"] = metric(statistics.mean(timings) * 1e6, "us", "lower")
+            results[f"name_mapping.{size}.p99_us"] = metric(percentile(timings, 0.99) * 1e6, "us", "lower")
+            results[f"name_mapping.{size}.build_ms"] = metric(build_s * 1000, "ms", "lower")
+    finally:
+        task_parser.predefined_users = original_users
+    return results
+
+
+def bench_pipeline(corpus: list) -> dict:
+    """voice_to_task end to end with transcription replaced by the corpus text"""
+    texts = iter(corpus)
+
+    def stub_asr(audio_bytes, filename, accept=None):
+        text = next(texts)
+        if accept is not None:
+            accept(text)
+        return {"success": True, "text": text, "audio_metadata": {"filename": filename}}
+
+    voice_processor.process_audio_file = stub_asr
+    try:
+        timings = []
+        for i in range(len(corpus)):
+            # Distinct audio bytes so every run misses the result cache
+            audio = f"bench-{time.time_ns()}-{i}".encode()
+            start = time.perf_counter()
+            voice_to_task(audio, f"bench_{i}.wav")
+            timings.append(time.perf_counter() - start)
+    finally:
+        del voice_processor.process_audio_file
+
+    return {
+        "pipeline.throughput": metric(len(timings) / sum(timings), "requests/s", "higher"),
+        "pipeline.p50_ms": metric(percentile(timings, 0.50) * 1000, "ms", "lower"),
+        "pipeline.p99_ms": metric(percentile(timings, 0.99) * 1000, "ms", "lower"),
+    }
+
+
+def compare(metrics: dict, baselines: dict, tolerance: float) -> list:
+    """
+    Find metrics that regressed past the tolerance
+
+    Args:
+        metrics: Metrics from this run
+        baselines: Stored metrics in the same format
+        tolerance: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        List of (name, baseline value, current value) for each regression
+    """
+    regressions = []
+    for name, baseline in baselines.items():
+        current = metrics.get(name)
+        if current is None or not baseline["value"]:
+            continue
+        if baseline["better"] == "higher":
+            regressed = current["value"] < baseline["value"] * (1 - tolerance)
+        else:
+            regressed = current["value"] > baseline["value"] * (1 + tolerance)
+        if regressed:
+            regressions.append((name, baseline["value"], current["value"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=2000, help="Generated commands added to the corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the corpus")
+    parser.add_argument("--roster-sizes", default="100,1000,10000")
+    parser.add_argument("--queries", type=int, default=200, help="Name lookups per roster size")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baselines", type=Path, default=DEFAULT_BASELINES)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    parser.add_argument("--update-baselines", action="store_true", help="Store this run as the new baselines")
+    parser.add_argument("--check", action="store_true", help="Fail if there are no baselines to compare with")
+    args = parser.parse_args()
+
+    recorded = construction_commands() + stored_transcriptions()
+    corpus = recorded + synthetic_commands(args.synthetic)
+    sizes = [int(size) for size in args.roster_sizes.split(",")]
+
+    print(f"📊 Benchmark suite ({len(recorded)} recorded + {args.synthetic} synthetic commands)")
+    print("=" * 60)
+    metrics = {}
+    metrics.update(bench_parser(corpus, args.repeat))
+    metrics.update(bench_name_mapping(sizes, args.queries))
+    metrics.update(bench_pipeline(corpus))
+
+    for name, entry in metrics.items():
+        print(f"  {name:<36} {entry['value']:>12.2f} {entry['unit']}")
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spacy_model": settings.spacy_model,
+            "spacy_pipeline": settings.spacy_pipeline,
+        },
+        "corpus": {"recorded": len(recorded), "synthetic": args.synthetic, "repeat": args.repeat},
+        "metrics": metrics,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.update_baselines:
+        baselines = {key: report[key] for key in ("timestamp", "environment", "corpus", "metrics")}
+        args.baselines.write_text(json.dumps(baselines, indent=2))
+        print(f"📌 Baselines updated in {args.baselines}")
+        return
+
+    if not args.baselines.exists():
+        print(f"⚠️  No baselines at {args.baselines}; run with --update-baselines to record them")
+        if args.check:
+            sys.exit(1)
+        return
+
+    baselines = json.loads(args.baselines.read_text())
+    if baselines["environment"] != report["environment"]:
+        print(f"⚠️  Baselines were recorded in a different environment: {baselines['environment']}")
+    regressions = compare(metrics, baselines["metrics"], args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}:")
+        for name, baseline, current in regressions:
+            print(f"  {name:<36} {baseline:>12.2f} → {current:.2f}")
+        sys.exit(1)
+    print(f"\n✅ All metrics within {args.tolerance:.0%} of baselines")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,31 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 import tempfile
 import os
+import json
+import threading
+import logging
 from datetime import datetime
 import shutil
+from typing import Optional
 from app.utils.voice_to_task import voice_to_task
-from app.storage.task_storage import task_storage, categories_storage
-from fastapi.responses import JSONResponse
+from app.utils.inference_pool import inference_pool, InferencePoolFull
+from app.utils.voice_processor import voice_processor
+from app.utils.task_parser import task_parser
+from app.utils.deadline_resolver import deadline_resolver
+from app.utils.result_cache import result_cache
+from app.utils.streaming import create_session
+from app.utils.ids import id_generator, id_timestamp
+from app.utils.wav_decoder import SAMPLE_RATE, encode_pcm16_wav
+from app.storage.task_storage import task_storage, categories_storage, TaskFilter, project_task, task_id_from_location
+from app.api.models.task import ParseTextBatchRequest
+from app.api.models.roster import RosterUpdateRequest
+from app.storage.roster_storage import roster_storage, ROSTER_KINDS
+from app.config import settings
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="VoiceTaskAI API",
@@ -33,6 +52,147 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "VoiceTaskAI API"}
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint: 200 once every model is loaded and warmed up, 503 before
+    
+    With PRELOAD_MODELS=false nothing warms the models up; they load on the
+    first request that needs them, so a model counts as ready unless it is
+    loading right now or failed to load.
+    """
+    states = {
+        "whisper": voice_processor.load_state,
+        "spacy": task_parser.load_state
+    }
+    if voice_processor.fast_processor is not None:
+        states["whisper_fast"] = voice_processor.fast_processor.load_state
+    models = {name: state.as_dict() for name, state in states.items()}
+    if settings.preload_models:
+        ready = all(state.ready for state in states.values())
+    else:
+        ready = all(state.ready or state.status in ("not_loaded", "loaded") for state in states.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "models": models}
+    )
+
+def _warm_up_models():
+    """Load and warm up models off the event loop"""
+    for model in (task_parser, voice_processor):
+        try:
+            model.warm_up()
+        except Exception as e:
+            logger.error(f"❌ Model warm-up failed: {e}")
+
+@app.on_event("startup")
+async def start_model_warm_up():
+    """Start loading models in the background so the server can bind immediately"""
+    if settings.preload_models:
+        threading.Thread(target=_warm_up_models, name="model-warm-up", daemon=True).start()
+
+@app.on_event("startup")
+async def start_roster_watcher():
+    """Load the roster store and keep the parser in sync with it"""
+    try:
+        task_parser.sync_roster(roster_storage.load())
+    except Exception as e:
+        logger.error(f"❌ Could not load roster, keeping configured users and categories: {e}")
+    roster_storage.watch(task_parser.sync_roster, settings.roster_poll_seconds)
+
+@app.on_event("startup")
+async def start_categories_compactor():
+    """Fold category task additions into the categories snapshot in the background"""
+    categories_storage.start_compactor()
+
+@app.get("/metrics")
+async def get_metrics():
+    """Inference pool queue depth, wait times and counters"""
+    metrics = {
+        "inference_pool": inference_pool.stats(),
+        "result_cache": result_cache.stats(),
+        "name_mapping": task_parser.mapping_stats(),
+        "deadlines": deadline_resolver.stats(),
+        "task_storage": task_storage.stats(),
+        "categories": categories_storage.stats()
+    }
+    if voice_processor.batch_scheduler is not None:
+        metrics["batching"] = voice_processor.batch_scheduler.stats()
+    if voice_processor.fast_processor is not None:
+        metrics["asr_cascade"] = voice_processor.cascade_stats.stats()
+    return metrics
+
+def _queue_full_response(error: InferencePoolFull) -> HTTPException:
+    """Build the 429 returned when the inference queue is full"""
+    return HTTPException(
+        status_code=429,
+        detail="Server is busy processing other recordings, please retry",
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+def _persist_result(content: bytes, filename: str, result: dict, add_to_category: bool = True) -> dict:
+    """
+    Save the audio, the task records and (optionally) the category entries for a processed recording
+    
+    Returns:
+        Dict with the transcription, task data and storage paths
+    """
+    # Save the processed audio file to the backend
+    audio_cache_dir = "data/audio_cache"
+    os.makedirs(audio_cache_dir, exist_ok=True)
+    file_path = os.path.join(audio_cache_dir, filename)
+    
+    with open(file_path, "wb") as buffer:
+        buffer.write(content)
+    
+    # Store every task that parsed (results without a task list carry a single task)
+    transcription = result.get('transcription', '')
+    tasks = [task for task in result.get('tasks') or [] if task.get('success')] or [result.get('task') or {}]
+    
+    # Create processing metadata
+    processing_metadata = {
+        "audio_file_path": file_path,
+        "audio_file_size": len(content),
+        "processing_timestamp": datetime.now().isoformat(),
+        "pipeline_version": "1.0",
+        "result_cache_hit": result.get('cached', False),
+        **result.get('processing_metadata', {})
+    }
+    
+    # Save all tasks from the recording to task storage in one transaction
+    saved_task_paths = task_storage.save_processed_tasks(
+        audio_filename=filename,
+        transcription=transcription,
+        tasks=tasks,
+        processing_metadata=processing_metadata
+    )
+
+    # Add each task to the correct category in categories.json
+    if add_to_category:
+        for task_data, task_path in zip(tasks, saved_task_paths):
+            if not task_data.get('category'):
+                continue
+            # Map category name to ID
+            category_id = categories_storage.find_category_id(task_data['category'])
+            if category_id:
+                category_task = {
+                    'task_id': task_id_from_location(task_path),
+                    'title': task_data.get('title'),
+                    'assignee': task_data.get('assignee') or task_data.get('name'),
+                    'deadline': task_data.get('deadline'),
+                    'description': task_data.get('description', ''),
+                }
+                categories_storage.add_task_to_category(category_id, category_task)
+    
+    return {
+        "transcription": transcription,
+        "task": tasks[0],
+        "tasks": tasks,
+        "audio_file_path": file_path,
+        "task_storage_path": saved_task_paths[0],
+        "task_storage_paths": saved_task_paths
+    }
+
 @app.post("/process-voice")
 async def process_voice(audio: UploadFile = File(...)):
     """Process voice recording and convert to task"""
@@ -45,11 +205,10 @@ async def process_voice(audio: UploadFile = File(...)):
         content = await audio.read()
         
         # Generate filename for processing
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"recording_{timestamp}.wav"
+        filename = f"{id_generator.new_id('recording')}.wav"
         
-        # Process through voice-to-task pipeline
-        result = voice_to_task(content, filename)
+        # Process through voice-to-task pipeline on the inference pool
+        result = await inference_pool.run(voice_to_task, content, filename)
         
         if not result.get('success'):
             return {
@@ -60,67 +219,113 @@ async def process_voice(audio: UploadFile = File(...)):
                 "error": result.get('error', 'Unknown error')
             }
         
-        # Save the processed audio file to the backend
-        audio_cache_dir = "data/audio_cache"
-        os.makedirs(audio_cache_dir, exist_ok=True)
-        file_path = os.path.join(audio_cache_dir, filename)
-        
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
-        
-        # Save the processed task data to storage
-        task_data = result.get('task', {})
-        transcription = result.get('transcription', '')
-        
-        # Create processing metadata
-        processing_metadata = {
-            "audio_file_path": file_path,
-            "audio_file_size": len(content),
-            "processing_timestamp": datetime.now().isoformat(),
-            "pipeline_version": "1.0"
-        }
-        
-        # Save to task storage
-        saved_task_path = task_storage.save_processed_task(
-            audio_filename=filename,
-            transcription=transcription,
-            task_data=task_data,
-            processing_metadata=processing_metadata
-        )
-
-        # Add the task to the correct category in categories.json
-        if task_data and task_data.get('category'):
-            # Map category name to ID
-            category_name = task_data['category']
-            categories = categories_storage.load_categories()
-            category_id = None
-            for cat in categories:
-                if cat['title'].lower() == str(category_name).lower() or str(cat['id']) == str(category_name):
-                    category_id = cat['id']
-                    break
-            if category_id:
-                category_task = {
-                    'title': task_data.get('title'),
-                    'assignee': task_data.get('assignee') or task_data.get('name'),
-                    'deadline': task_data.get('deadline'),
-                    'description': task_data.get('description', ''),
-                }
-                categories_storage.add_task_to_category(category_id, category_task)
+        saved = _persist_result(content, filename, result)
         
         # Return the task JSON if processing was successful
         return {
             "success": True,
-            "transcription": transcription,
-            "task": task_data,
+            "transcription": saved["transcription"],
+            "task": saved["task"],
+            "tasks": saved["tasks"],
+            "task_count": len(saved["tasks"]),
             "message": "Voice processed successfully",
             "filename": filename,
-            "audio_file_path": file_path,
-            "task_storage_path": saved_task_path
+            "audio_file_path": saved["audio_file_path"],
+            "task_storage_path": saved["task_storage_path"],
+            "task_storage_paths": saved["task_storage_paths"]
         }
                 
+    except InferencePoolFull as e:
+        raise _queue_full_response(e)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing voice: {str(e)}")
 
+@app.websocket("/ws/process-voice")
+async def process_voice_stream(websocket: WebSocket):
+    """
+    Stream a recording while the user speaks
+    
+    Protocol:
+        client → {"type": "start", "sample_rate": 48000, "channels": 1}   (optional, defaults to 16 kHz mono)
+        client → binary frames of little-endian PCM16 audio
+        server → {"type": "partial", "transcription": ..., "task": ...} as the rolling window is decoded
+        client → {"type": "stop"}
+        server → {"type": "final", ...same fields as /process-voice...}
+    """
+    await websocket.accept()
+    session = create_session()
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            
+            if message.get("bytes") is not None:
+                session.add_chunk(message["bytes"])
+                if session.partial_due():
+                    session.start_partial(websocket.send_json)
+                continue
+            
+            control = json.loads(message.get("text") or "{}")
+            if control.get("type") == "start":
+                await session.cancel()
+                session = create_session(
+                    sample_rate=int(control.get("sample_rate", SAMPLE_RATE)),
+                    channels=int(control.get("channels", 1))
+                )
+            elif control.get("type") == "stop":
+                break
+        
+        try:
+            result = await session.finish()
+        except InferencePoolFull as e:
+            await websocket.send_json({
+                "type": "error",
+                "error": "Server is busy processing other recordings, please retry",
+                "retry_after": e.retry_after
+            })
+            await websocket.close(code=1013)
+            return
+        
+        if not result.get('success'):
+            await websocket.send_json({
+                "type": "final",
+                "success": False,
+                "transcription": result.get('transcription', ''),
+                "task": None,
+                "message": "Failed to process voice",
+                "error": result.get('error', 'Unknown error')
+            })
+        else:
+            filename = f"{id_generator.new_id('recording')}.wav"
+            saved = _persist_result(encode_pcm16_wav(session.audio), filename, result)
+            await websocket.send_json({
+                "type": "final",
+                "success": True,
+                "transcription": saved["transcription"],
+                "task": saved["task"],
+                "tasks": saved["tasks"],
+                "task_count": len(saved["tasks"]),
+                "message": "Voice processed successfully",
+                "filename": filename,
+                "audio_file_path": saved["audio_file_path"],
+                "task_storage_path": saved["task_storage_path"],
+                "task_storage_paths": saved["task_storage_paths"]
+            })
+        await websocket.close()
+        
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        await websocket.send_json({"type": "error", "error": f"Error processing voice: {str(e)}"})
+        await websocket.close(code=1011)
+    finally:
+        # Don't leave a partial transcript holding a pool slot or writing to a closed socket
+        await session.cancel()
+
 @app.post("/save-audio")
 async def save_audio(audio: UploadFile = File(...)):
     """Process audio file through voice-to-task pipeline and return task JSON"""
@@ -133,11 +338,10 @@ async def save_audio(audio: UploadFile = File(...)):
         content = await audio.read()
         
         # Generate filename for processing
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"recording_{timestamp}.wav"
+        filename = f"{id_generator.new_id('recording')}.wav"
         
-        # Process through voice-to-task pipeline
-        result = voice_to_task(content, filename)
+        # Process through voice-to-task pipeline on the inference pool
+        result = await inference_pool.run(voice_to_task, content, filename)
         
         if not result.get('success'):
             return {
@@ -148,61 +352,173 @@ async def save_audio(audio: UploadFile = File(...)):
                 "task": None
             }
         
-        # Save the processed audio file to the backend
-        audio_cache_dir = "data/audio_cache"
-        os.makedirs(audio_cache_dir, exist_ok=True)
-        file_path = os.path.join(audio_cache_dir, filename)
-        
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
-        
-        # Save the processed task data to storage
-        task_data = result.get('task', {})
-        transcription = result.get('transcription', '')
-        
-        # Create processing metadata
-        processing_metadata = {
-            "audio_file_path": file_path,
-            "audio_file_size": len(content),
-            "processing_timestamp": datetime.now().isoformat(),
-            "pipeline_version": "1.0"
-        }
-        
-        # Save to task storage
-        saved_task_path = task_storage.save_processed_task(
-            audio_filename=filename,
-            transcription=transcription,
-            task_data=task_data,
-            processing_metadata=processing_metadata
-        )
+        saved = _persist_result(content, filename, result, add_to_category=False)
         
         # Return the task JSON if processing was successful
         return {
             "success": True,
             "message": "Audio processed successfully",
-            "transcription": transcription,
-            "task": task_data,
+            "transcription": saved["transcription"],
+            "task": saved["task"],
+            "tasks": saved["tasks"],
+            "task_count": len(saved["tasks"]),
             "filename": filename,
-            "audio_file_path": file_path,
-            "task_storage_path": saved_task_path,
+            "audio_file_path": saved["audio_file_path"],
+            "task_storage_path": saved["task_storage_path"],
+            "task_storage_paths": saved["task_storage_paths"],
             "file_size": len(content)
         }
         
+    except InferencePoolFull as e:
+        raise _queue_full_response(e)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
 
-@app.get("/tasks")
-async def get_all_tasks():
-    """Retrieve all processed tasks"""
+@app.post("/parse-text/batch")
+async def parse_text_batch(request: ParseTextBatchRequest):
+    """Parse already transcribed commands into tasks, results in request order"""
+    if not request.texts:
+        raise HTTPException(status_code=400, detail="No texts provided")
+    if len(request.texts) > settings.parse_batch_max_texts:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many texts ({len(request.texts)}), at most {settings.parse_batch_max_texts} per request"
+        )
+    try:
+        results = await run_in_threadpool(task_parser.parse_many, request.texts, request.batch_size)
+        return {
+            "success": True,
+            "results": results,
+            "count": len(results)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error parsing texts: {str(e)}")
+
+@app.get("/roster")
+async def get_roster():
+    """Return the users and categories tasks are mapped onto"""
+    try:
+        roster = roster_storage.load()
+        roster["parser_roster_version"] = task_parser.roster_version
+        return roster
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error loading roster: {str(e)}")
+
+@app.post("/roster/{kind}")
+async def update_roster(kind: str, request: RosterUpdateRequest):
+    """Add, remove or replace users or categories; applied without a restart"""
+    if kind not in ROSTER_KINDS:
+        raise HTTPException(status_code=404, detail=f"Unknown roster '{kind}', expected one of {list(ROSTER_KINDS)}")
     try:
-        tasks = task_storage.get_all_tasks()
+        roster = await run_in_threadpool(
+            roster_storage.update, kind, request.add, request.remove, request.replace
+        )
+        # Apply now rather than waiting for the watcher to notice the file
+        await run_in_threadpool(task_parser.sync_roster, roster)
         return {
             "success": True,
-            "tasks": tasks,
-            "count": len(tasks)
+            "version": roster["version"],
+            kind: roster[kind],
+            "count": len(roster[kind])
         }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating roster: {str(e)}")
+
+def _iso_param(name: str, value: Optional[str]) -> Optional[str]:
+    """Validate an ISO date/datetime query parameter and normalize it to a local naive datetime"""
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be an ISO date or datetime, got '{value}'")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+def _task_query(cursor: Optional[str],
+                assignee: Optional[str],
+                category: Optional[str],
+                status: Optional[str],
+                due_after: Optional[str],
+                due_before: Optional[str],
+                since: Optional[str],
+                until: Optional[str],
+                fields: Optional[str]):
+    """Build the task filter and field list shared by /tasks and /tasks/export"""
+    if cursor is not None and id_timestamp(cursor) is None:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor '{cursor}'")
+    task_filter = TaskFilter(
+        assignee=assignee,
+        category=category,
+        status=status,
+        due_after=_iso_param("due_after", due_after),
+        due_before=_iso_param("due_before", due_before),
+        since=_iso_param("since", since),
+        until=_iso_param("until", until)
+    )
+    field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    return task_filter, field_list
+
+@app.get("/tasks")
+async def get_all_tasks(limit: int = Query(settings.tasks_page_size, ge=1, le=settings.tasks_page_max),
+                        cursor: Optional[str] = None,
+                        assignee: Optional[str] = None,
+                        category: Optional[str] = None,
+                        status: Optional[str] = None,
+                        due_after: Optional[str] = None,
+                        due_before: Optional[str] = None,
+                        since: Optional[str] = None,
+                        until: Optional[str] = None,
+                        fields: Optional[str] = None):
+    """
+    Retrieve processed tasks, newest first, one page at a time
+    
+    Pass the returned next_cursor as cursor to get the following page. fields
+    is a comma separated list of keys to return (e.g. "task_id,task_data.title").
+    """
+    task_filter, field_list = _task_query(cursor, assignee, category, status, due_after, due_before, since, until, fields)
+    try:
+        # One extra task tells whether another page follows
+        tasks = await run_in_threadpool(task_storage.query_tasks, task_filter, cursor, limit + 1)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving tasks: {str(e)}")
+    
+    next_cursor = tasks[limit - 1]["task_id"] if len(tasks) > limit else None
+    tasks = tasks[:limit]
+    if field_list:
+        tasks = [project_task(task, field_list) for task in tasks]
+    return {
+        "success": True,
+        "tasks": tasks,
+        "count": len(tasks),
+        "next_cursor": next_cursor
+    }
+
+@app.get("/tasks/export")
+async def export_tasks(cursor: Optional[str] = None,
+                       assignee: Optional[str] = None,
+                       category: Optional[str] = None,
+                       status: Optional[str] = None,
+                       due_after: Optional[str] = None,
+                       due_before: Optional[str] = None,
+                       since: Optional[str] = None,
+                       until: Optional[str] = None,
+                       fields: Optional[str] = None):
+    """Stream every matching task as newline-delimited JSON, newest first"""
+    task_filter, field_list = _task_query(cursor, assignee, category, status, due_after, due_before, since, until, fields)
+    
+    def lines():
+        for task in task_storage.iter_tasks(task_filter, cursor):
+            if field_list:
+                task = project_task(task, field_list)
+            yield json.dumps(task, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 @app.get("/tasks/{task_id}")
 async def get_task(task_id: str):
@@ -225,11 +541,17 @@ async def get_task(task_id: str):
 async def get_categories():
     """Return all categories and their tasks"""
     try:
-        categories = categories_storage.load_categories()
-        return JSONResponse(content=categories)
+        return Response(content=categories_storage.categories_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading categories: {str(e)}")
 
+@app.on_event("shutdown")
+async def shutdown_inference_pool():
+    """Let in-flight inference jobs finish on shutdown"""
+    roster_storage.stop_watching()
+    categories_storage.stop_compactor()
+    inference_pool.shutdown()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -6,17 +6,26 @@ Allows viewing and updating the predefined users list
 
 import sys
 import os
+import json
+import urllib.error
+import urllib.request
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.config import settings
+from app.storage.roster_storage import roster_storage
 from app.utils.task_parser import TaskParser
 
+# Running server to push roster changes to
+SERVER_URL = os.environ.get("VOICETASK_SERVER_URL", f"http://localhost:{settings.port}")
+
 def show_current_users():
     """Display current predefined users"""
     print("👥 Current Predefined Users")
     print("=" * 40)
     
-    users = settings.predefined_users_list
+    roster = roster_storage.load()
+    users = roster["users"]
+    print(f"Roster version {roster['version']} ({roster_storage.roster_file})")
     if users:
         for i, user in enumerate(users, 1):
             print(f"{i}. {user}")
@@ -30,7 +39,8 @@ def test_user_mapping():
     print("=" * 40)
     
     parser = TaskParser()
-    users = settings.predefined_users_list
+    parser.sync_roster(roster_storage.load())
+    users = parser.predefined_users
     
     if not users:
         print("No users defined to test with")
@@ -65,21 +75,61 @@ def test_user_mapping():
             print(f"    {user}: {score:.3f}")
         print()
 
+def push_roster_change(change):
+    """
+    Send a roster change to the running server, or write the roster file directly
+    
+    Args:
+        change: Dict with any of "add", "remove" and "replace" name lists
+        
+    Returns:
+        The updated users list
+    """
+    request = urllib.request.Request(
+        f"{SERVER_URL}/roster/users",
+        data=json.dumps(change).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            result = json.load(response)
+        print(f"Pushed to running server at {SERVER_URL} (roster version {result['version']})")
+        return result["users"]
+    except urllib.error.HTTPError as e:
+        print(f"❌ Server rejected the roster change: {e.code} {e.read().decode('utf-8', 'replace')}")
+        sys.exit(1)
+    except urllib.error.URLError as e:
+        # No server running: update the file, a server picks it up when it (re)starts or on its next poll
+        print(f"Server at {SERVER_URL} not reachable ({e.reason}), updating {roster_storage.roster_file}")
+        roster = roster_storage.update("users", change.get("add"), change.get("remove"), change.get("replace"))
+        return roster["users"]
+
 def update_users(new_users):
-    """Update the predefined users list"""
+    """Replace the predefined users list"""
     print("🔄 Updating Predefined Users")
     print("=" * 40)
     
-    # Convert list to comma-separated string
-    users_str = ",".join(new_users)
+    users = push_roster_change({"replace": new_users})
     
-    # Update environment variable
-    os.environ["PREDEFINED_USERS"] = users_str
-    
-    print(f"Updated users: {new_users}")
-    print("Note: This change will take effect when you restart the application")
-    print("To make it permanent, add to your .env file:")
-    print(f"PREDEFINED_USERS={users_str}")
+    print(f"Updated users: {users}")
+    print("No restart needed, running servers apply the change immediately")
+    print()
+
+def add_users(names):
+    """Add users to the roster"""
+    print("➕ Adding Users")
+    print("=" * 40)
+    users = push_roster_change({"add": names})
+    print(f"Users now: {users}")
+    print()
+
+def remove_users(names):
+    """Remove users from the roster"""
+    print("➖ Removing Users")
+    print("=" * 40)
+    users = push_roster_change({"remove": names})
+    print(f"Users now: {users}")
     print()
 
 def main():
@@ -88,7 +138,10 @@ def main():
         print("Usage:")
         print("  python manage_users.py show          # Show current users")
         print("  python manage_users.py test          # Test user mapping")
-        print("  python manage_users.py update user1,user2,user3  # Update users")
+        print("  python manage_users.py update user1,user2,user3  # Replace users")
+        print("  python manage_users.py add user1,user2           # Add users")
+        print("  python manage_users.py remove user1,user2        # Remove users")
+        print(f"Changes are pushed to {SERVER_URL} (set VOICETASK_SERVER_URL to change)")
         return
     
     command = sys.argv[1].lower()
@@ -105,6 +158,17 @@ def main():
         
         new_users = [user.strip() for user in sys.argv[2].split(",")]
         update_users(new_users)
+    elif command in ("add", "remove"):
+        if len(sys.argv) < 3:
+            print(f"Error: Please provide users to {command}")
+            print(f"Example: python manage_users.py {command} Dana,Eli")
+            return
+        
+        names = [user.strip() for user in sys.argv[2].split(",") if user.strip()]
+        if command == "add":
+            add_users(names)
+        else:
+            remove_users(names)
     else:
         print(f"Unknown command: {command}")
 
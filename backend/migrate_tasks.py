@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Task migration script for VoiceTaskAI
+Copies the JSON task files into the SQLite task database; task IDs already in
+the database are left alone, so it is safe to run more than once
+
+Usage:
+    python migrate_tasks.py [--source ./data/processed_tasks] [--db ./data/tasks.db]
+Then set TASK_STORAGE_BACKEND=sqlite and restart the server.
+"""
+
+import argparse
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings
+from app.storage.task_storage import TaskStorage
+from app.storage.sqlite_task_storage import SQLiteTaskStorage
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Migrate JSON task files to SQLite")
+    parser.add_argument("--source", default=settings.task_storage_dir, help="Directory of JSON task files")
+    parser.add_argument("--db", default=settings.task_storage_db, help="SQLite database to fill")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source):
+        print(f"❌ No task directory at {args.source}")
+        sys.exit(1)
+
+    print("🗄️  VoiceTaskAI - Task Migration")
+    print("=" * 40)
+    records = TaskStorage(args.source).get_all_tasks()
+    database = SQLiteTaskStorage(args.db)
+    inserted = database.import_records(records)
+
+    print(f"Read {len(records)} tasks from {args.source}")
+    print(f"✅ Inserted {inserted} into {args.db} ({len(records) - inserted} already present)")
+    if settings.task_storage_backend != "sqlite":
+        print("Set TASK_STORAGE_BACKEND=sqlite to serve tasks from the database")
+
+if __name__ == "__main__":
+    main()
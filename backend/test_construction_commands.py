@@ -10,6 +10,30 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.utils.task_parser import TaskParser
 
+# Construction and real estate specific test commands
+CONSTRUCTION_COMMANDS = [
+    # Construction Tasks
+    "Task pour concrete foundation user John category Construction deadline next Friday",
+    "Task install electrical wiring user Mike category Construction deadline this week",
+    "Task frame second floor user Sarah category Construction deadline Monday",
+    "Task build retaining wall user Bob category Construction deadline today",
+    "Task install windows user Alice category Construction deadline Wednesday",
+    
+    # Inspection Tasks
+    "Task inspect foundation work user Mike category Inspection deadline tomorrow",
+    "Task check electrical compliance user Sarah category Inspection deadline today",
+    "Task review plumbing installation user John category Inspection deadline Monday",
+    "Task verify building code user Bob category Inspection deadline this week",
+    "Task test fire alarm system user Alice category Inspection deadline Friday",
+    
+    # Maintenance Tasks
+    "Task repair leaking roof user Sarah category Maintenance deadline today",
+    "Task service HVAC units user Mike category Maintenance deadline this week",
+    "Task fix electrical issues user John category Maintenance deadline tomorrow",
+    "Task replace broken window user Bob category Maintenance deadline Monday",
+    "Task troubleshoot heating system user Alice category Maintenance deadline Friday",
+]
+
 def test_construction_commands():
     """Test construction and real estate specific voice commands"""
     
@@ -18,29 +42,7 @@ def test_construction_commands():
     
     parser = TaskParser()
     
-    # Construction and real estate specific test commands
-    test_commands = [
-        # Construction Tasks
-        "Task pour concrete foundation user John category Construction deadline next Friday",
-        "Task install electrical wiring user Mike category Construction deadline this week",
-        "Task frame second floor user Sarah category Construction deadline Monday",
-        "Task build retaining wall user Bob category Construction deadline today",
-        "Task install windows user Alice category Construction deadline Wednesday",
-        
-        # Inspection Tasks
-        "Task inspect foundation work user Mike category Inspection deadline tomorrow",
-        "Task check electrical compliance user Sarah category Inspection deadline today",
-        "Task review plumbing installation user John category Inspection deadline Monday",
-        "Task verify building code user Bob category Inspection deadline this week",
-        "Task test fire alarm system user Alice category Inspection deadline Friday",
-        
-        # Maintenance Tasks
-        "Task repair leaking roof user Sarah category Maintenance deadline today",
-        "Task service HVAC units user Mike category Maintenance deadline this week",
-        "Task fix electrical issues user John category Maintenance deadline tomorrow",
-        "Task replace broken window user Bob category Maintenance deadline Monday",
-        "Task troubleshoot heating system user Alice category Maintenance deadline Friday",
-    ]
+    test_commands = CONSTRUCTION_COMMANDS
     
     print(f"Available Categories: {parser.predefined_categories}")
     print(f"Available Users: {parser.predefined_users}")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for the deadline resolver
+Checks the rule fast path against a fixed reference date
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.utils.deadline_resolver import DeadlineResolver
+
+# Saturday, so weekday rules roll into the next week
+NOW = datetime(2026, 10, 17, 10, 30)
+
+EXPECTED = {
+    "today": datetime(2026, 10, 17, 17),
+    "Tomorrow.": datetime(2026, 10, 18),
+    "by end of day": datetime(2026, 10, 17, 17),
+    "the day after tomorrow": datetime(2026, 10, 19),
+    "in two weeks": datetime(2026, 10, 31),
+    "Monday": datetime(2026, 10, 19),
+    "next Friday": datetime(2026, 10, 23),
+    "next week": datetime(2026, 10, 19),
+    "end of month": datetime(2026, 10, 31),
+    "next month": datetime(2026, 11, 1),
+}
+
+
+def test_rules():
+    """Common phrases resolve without dateparser"""
+    print("🧪 Rule fast path")
+    resolver = DeadlineResolver(["en"])
+    for phrase, expected in EXPECTED.items():
+        resolved = resolver.resolve(phrase, now=NOW)
+        print(f"  {phrase!r:<26} → {resolved}")
+        assert resolved == expected, phrase
+    assert resolver.stats()["fallback_hits"] == 0
+
+
+def test_month_arithmetic():
+    """Month rules clamp to shorter months and roll over the year"""
+    print("🧪 Month arithmetic")
+    resolver = DeadlineResolver(["en"])
+    assert resolver.resolve("in a month", now=datetime(2027, 1, 31)) == datetime(2027, 2, 28)
+    assert resolver.resolve("next month", now=datetime(2026, 12, 5)) == datetime(2027, 1, 1)
+    print("  ✅ Calendar arithmetic")
+
+
+def test_cache():
+    """Repeated phrases on the same day are served from the cache"""
+    print("🧪 Cache")
+    resolver = DeadlineResolver(["en"])
+    resolver.resolve("Tomorrow", now=NOW)
+    resolver.resolve("tomorrow ", now=NOW.replace(hour=16))
+    assert resolver.cache.stats()["hits"] == 1
+    assert resolver.resolve("tomorrow", now=datetime(2026, 10, 18)) == datetime(2026, 10, 19)
+    print("  ✅ Cached per phrase and reference date")
+
+
+def main():
+    """Main function"""
+    print("📅 VoiceTaskAI - Deadline Resolver Test")
+    print("=" * 50)
+    test_rules()
+    test_month_arithmetic()
+    test_cache()
+    print("\n🎉 Deadline resolver tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for task and recording ID generation
+Checks IDs are unique and sort in creation order, including legacy timestamp IDs
+"""
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.utils.ids import IdGenerator, id_timestamp, sort_key
+
+
+def test_burst_is_monotonic():
+    """Thousands of IDs in the same millisecond stay unique and increasing"""
+    print("🧪 Burst allocation")
+    generator = IdGenerator(node_id=7)
+    ids = [generator.new_id("task") for _ in range(20000)]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert ids == sorted(ids, key=sort_key)
+    print(f"  ✅ {len(ids)} increasing IDs, e.g. {ids[0]}")
+
+
+def test_threads_and_nodes():
+    """Concurrent threads and separate nodes never collide"""
+    print("🧪 Threads and nodes")
+    generators = [IdGenerator(node_id=1), IdGenerator(node_id=2)]
+    ids = []
+    lock = threading.Lock()
+
+    def allocate(generator):
+        batch = [generator.new_id("recording") for _ in range(5000)]
+        with lock:
+            ids.extend(batch)
+
+    threads = [threading.Thread(target=allocate, args=(generators[i % 2],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(ids)) == 40000
+    print("  ✅ 40000 unique IDs")
+
+
+def test_legacy_ids():
+    """Legacy timestamp IDs order by time alongside generated ones"""
+    print("🧪 Legacy IDs")
+    assert id_timestamp("task_20250709_202845") == datetime(2025, 7, 9, 20, 28, 45)
+    assert id_timestamp("task_20250709_202845_2") == datetime(2025, 7, 9, 20, 28, 45)
+
+    new = IdGenerator(node_id=3).new_id("task")
+    assert abs((id_timestamp(new) - datetime.now()).total_seconds()) < 5
+    ordered = ["task_20250709_202845", "task_20250709_202845_1", "task_20250709_202845_2",
+               "task_20250710_225825", new]
+    assert sorted(reversed(ordered), key=sort_key) == ordered
+    print("  ✅ Legacy and generated IDs interleave by time")
+
+
+def main():
+    """Main function"""
+    print("🆔 VoiceTaskAI - ID Generation Test")
+    print("=" * 50)
+    test_burst_is_monotonic()
+    test_threads_and_nodes()
+    test_legacy_ids()
+    print("\n🎉 ID generation tests completed!")
+
+
+if __name__ == "__main__":
+    main()
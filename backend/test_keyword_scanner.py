@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled keyword scanner
+Checks it finds the same keyword positions as matching every variation per word
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.utils.keyword_scanner import KeywordScanner, span_text, SPAN_FILLERS_KEEP_COMMA
+
+KEYWORD_VARIATIONS = [
+    ("task", ["task", "tasks", "tusk", "tack"]),
+    ("user", ["user", "users", "youser", "yuser"]),
+    ("category", ["category", "categories", "cat", "type", "kind"]),
+    ("deadline", ["deadlin", "deadline", "dead line"]),
+]
+
+
+def naive_positions(words):
+    """First-occurrence positions using substring checks against every variation"""
+    positions = {}
+    for i, word in enumerate(words):
+        word = word.lower()
+        for kind, variations in KEYWORD_VARIATIONS:
+            if kind not in positions and any(var in word for var in variations):
+                positions[kind] = i
+                break
+    return positions
+
+
+def test_matches_naive_scan():
+    """Random commands built from keyword-like words should scan identically"""
+    print("🧪 Comparing with per-variation substring matching")
+    scanner = KeywordScanner(KEYWORD_VARIATIONS)
+    vocabulary = ("Task tasks tusk attack user abuser Users category concatenate cat typed kind "
+                  "Deadline deadlines dead line usertask Alice Bob tomorrow the , to by").split()
+    rng = random.Random(0)
+    for _ in range(5000):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(0, 14))]
+        assert scanner.scan(words).positions == naive_positions(words), words
+    print("  ✅ 5000 random commands matched")
+
+
+def test_spans_and_separators():
+    """Span boundaries, filler removal and last to/by positions"""
+    print("🧪 Spans and separators")
+    scanner = KeywordScanner(KEYWORD_VARIATIONS, separators=["to", "by"])
+    words = "Task fix the roof user Bob category Maintenance deadline next Monday , 9am".split()
+    scan = scanner.scan(words)
+
+    assert scan.positions == {"task": 0, "user": 4, "category": 6, "deadline": 8}
+    assert span_text(words, 1, scan.next_position(0, ["user", "category", "deadline"])) == "fix roof"
+    assert span_text(words, 9, len(words), SPAN_FILLERS_KEEP_COMMA) == "next Monday , 9am"
+    assert span_text(words, 1, 1) is None
+
+    words = "send report to Alice to Bob by Friday".split()
+    assert scanner.scan(words).separators == {"to": 4, "by": 6}
+    print("  ✅ Spans extracted")
+
+
+def test_split_commands():
+    """Several dictated tasks split at each 'task' once the previous one has a user"""
+    print("🧪 Splitting multi-task transcripts")
+    scanner = KeywordScanner(KEYWORD_VARIATIONS)
+    text = ("Task pour concrete user Bob category Construction deadline Friday "
+            "task inspect attack damage user Alice deadline tomorrow task clean site user Ali")
+    words = text.split()
+    commands = [" ".join(words[start:end]) for start, end in scanner.split(words)]
+    assert commands == [
+        "Task pour concrete user Bob category Construction deadline Friday",
+        "task inspect attack damage user Alice deadline tomorrow",
+        "task clean site user Ali",
+    ], commands
+
+    # "attack" before any user keyword stays in the title
+    words = "Task repair attack damage user Bob".split()
+    assert scanner.split(words) == [(0, len(words))]
+
+    # A later "task" word without a user of its own belongs to the current command
+    for text in ("Task review drawings user Bob category Construction deadline Friday note the task list is outdated",
+                 "Task pour slab user Bob deadline tomorrow then tasks for Alice"):
+        words = text.split()
+        assert scanner.split(words) == [(0, len(words))], text
+    for text, commands in (
+            ("Task clean site user Bob. Check the task board first. Task inspect roof user Alice",
+             ["Task clean site user Bob. Check the task board first.", "Task inspect roof user Alice"]),
+            ("Task review drawings user Bob note the task list is outdated task clean site user Ali",
+             ["Task review drawings user Bob note the task list is outdated", "task clean site user Ali"])):
+        words = text.split()
+        assert [" ".join(words[start:end]) for start, end in scanner.split(words)] == commands, text
+    print("  ✅ Commands split")
+
+
+def main():
+    """Main function"""
+    print("🔎 VoiceTaskAI - Keyword Scanner Test")
+    print("=" * 50)
+    test_matches_naive_scan()
+    test_spans_and_separators()
+    test_split_commands()
+    print("\n🎉 Keyword scanner tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the name similarity index
+Checks small rosters score exactly like before and large rosters use candidates
+"""
+import random
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.utils.name_index import NameIndex
+
+
+def exhaustive(query, roster):
+    """Score every roster entry, best first, ties in roster order"""
+    clean = query.strip().lower()
+    scores = [(name, SequenceMatcher(None, clean, name.lower()).ratio()) for name in roster]
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores
+
+
+def test_small_roster_matches_full_scan():
+    """Without phonetic keys, four users should get exactly the old similarity matrix"""
+    print("🧪 Small roster")
+    roster = ["Alice", "Bob", "Charlie", "Ali"]
+    index = NameIndex(roster, phonetic=False)
+    for query in ["Alise", "bob", "Charley", "Al", "xyz", "  ALICE "]:
+        assert index.search(query) == exhaustive(query, roster), query
+    print("  ✅ Same scores and order as scoring every user")
+
+
+def test_large_roster_finds_misspelled_names():
+    """A misspelled name on a large roster should still come back first"""
+    print("🧪 Large roster")
+    rng = random.Random(0)
+    roster = sorted({f"{rng.choice('BCDFGHJKLMNPRST')}{''.join(rng.choice('aeiou') + rng.choice('lmnrst') for _ in range(3))}"
+                     for _ in range(5000)})
+    index = NameIndex(roster, top_k=5, phonetic=False)
+    for name in rng.sample(roster, 50):
+        query = name[:3] + name[4:]  # drop a character
+        matches = index.search(query)
+        assert len(matches) <= 5
+        assert matches[0][1] == exhaustive(query, roster)[0][1], (query, matches[0])
+    print("  ✅ Best score matches the exhaustive scan")
+
+
+def test_phonetic_lookup():
+    """Names spelled the way they sound should resolve by key, others fall back"""
+    print("🧪 Phonetic keys")
+    index = NameIndex(["Alice", "Bob", "Charlie", "Ali", "Kathy Brown"])
+    for query, expected in [("Alise", "Alice"), ("Charley", "Charlie"), ("bobb", "Bob"), ("Cathy Braun", "Kathy Brown")]:
+        assert index.search(query)[0][0] == expected, query
+    assert index.stats()["phonetic_hits"] == 4
+
+    assert index.search("Charlotte")[0][0] == "Charlie"
+    assert index.stats()["fuzzy_lookups"] == 1
+    print("  ✅ Sound-alike names matched by key")
+
+
+def test_incremental_updates():
+    """Added names are found and removed ones are never returned"""
+    print("🧪 Incremental updates")
+    index = NameIndex(["Alice", "Bob", "Charlie", "Ali"])
+    index.add(["Dana"])
+    index.remove(["Bob"])
+    assert index.names == ["Alice", "Charlie", "Ali", "Dana"]
+    assert index.search("dana")[0][0] == "Dana"
+    assert all(name != "Bob" for name, _ in index.search("bob"))
+    assert index.stats()["tombstones"] == 1
+    print("  ✅ Roster changes applied in place")
+
+
+def main():
+    """Main function"""
+    print("📇 VoiceTaskAI - Name Index Test")
+    print("=" * 50)
+    test_small_roster_matches_full_scan()
+    test_large_roster_finds_misspelled_names()
+    test_phonetic_lookup()
+    test_incremental_updates()
+    print("\n🎉 Name index tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Test script for the task storage backends
+Checks the JSON and SQLite backends behave the same and the migrator copies tasks
+"""
+import json
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.storage.task_storage import TaskStorage, CategoriesStorage, TaskFilter, project_task
+from app.storage.sqlite_task_storage import SQLiteTaskStorage
+
+TASKS = [
+    {"title": "pour concrete", "assignee": "Bob", "category": "Construction",
+     "deadline": "2026-10-23T00:00:00", "success": True, "errors": []},
+    {"title": "inspect roof", "assignee": "Alice", "category": "Inspection",
+     "deadline": None, "success": True, "errors": []},
+]
+
+
+def exercise(storage):
+    """Save, read, query and delete through the shared contract"""
+    paths = storage.save_processed_tasks("rec.wav", "Task pour concrete ...", TASKS, {"pipeline_version": "1.0"})
+    assert len(paths) == 2
+
+    tasks = storage.get_all_tasks()
+    assert sorted(task["task_data"]["title"] for task in tasks) == ["inspect roof", "pour concrete"]
+    first = storage.get_task(tasks[0]["task_id"])
+    assert first == tasks[0]
+    assert first["processing_metadata"]["task_count"] == 2
+
+    assert [t["task_data"]["assignee"] for t in storage.query_tasks(TaskFilter(assignee="Bob"))] == ["Bob"]
+    assert [t["task_data"]["title"] for t in storage.query_tasks(TaskFilter(due_before="2026-12-01"))] == ["pour concrete"]
+    assert storage.query_tasks(TaskFilter(category="Maintenance")) == []
+    assert storage.query_tasks(TaskFilter(since="2000-01-01", status="processed"), limit=1) == tasks[:1]
+
+    assert storage.delete_task(tasks[0]["task_id"])
+    assert not storage.delete_task(tasks[0]["task_id"])
+    assert storage.get_task(tasks[0]["task_id"]) is None
+    assert len(storage.get_all_tasks()) == 1
+
+
+def test_backends():
+    """Both backends honour the same contract"""
+    print("🧪 JSON and SQLite backends")
+    with tempfile.TemporaryDirectory() as tmp:
+        exercise(TaskStorage(str(Path(tmp) / "processed_tasks")))
+        exercise(SQLiteTaskStorage(str(Path(tmp) / "tasks.db")))
+    print("  ✅ Same behaviour")
+
+
+def test_pagination():
+    """Pages follow the cursor without gaps or repeats"""
+    print("🧪 Cursor pagination")
+    with tempfile.TemporaryDirectory() as tmp:
+        for storage in (TaskStorage(str(Path(tmp) / "processed_tasks")),
+                        SQLiteTaskStorage(str(Path(tmp) / "tasks.db"))):
+            for _ in range(7):
+                storage.save_processed_tasks("rec.wav", "text", TASKS)
+            everything = [task["task_id"] for task in storage.get_all_tasks()]
+            assert [task["task_id"] for task in storage.iter_tasks()] == everything
+
+            seen, cursor = [], None
+            while True:
+                page = storage.query_tasks(cursor=cursor, limit=4)
+                seen += [task["task_id"] for task in page]
+                if len(page) < 4:
+                    break
+                cursor = page[-1]["task_id"]
+            assert seen == everything
+
+            bob = [task["task_id"] for task in storage.iter_tasks(TaskFilter(assignee="Bob"), cursor=everything[5])]
+            assert bob == [task_id for task_id in everything[6:] if storage.get_task(task_id)["task_data"]["assignee"] == "Bob"]
+    print("  ✅ 14 tasks paged by 4")
+
+
+def test_legacy_order():
+    """Legacy and generated IDs page identically on both backends, old databases included"""
+    print("🧪 Ordering legacy IDs")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "processed_tasks"
+        source = TaskStorage(str(directory), refresh_interval_seconds=3600)
+        source.save_processed_tasks("rec.wav", "text", TASKS)
+        # Legacy records whose stored timestamp disagrees with the time in their ID
+        for task_id in ("task_20250709_202845", "task_20250709_202845_1", "task_20250709_202845_2"):
+            record = {"task_id": task_id, "timestamp": "2099-01-01T00:00:00", "task_data": TASKS[0]}
+            (directory / f"{task_id}.json").write_text(json.dumps(record))
+        source.refresh()
+
+        # A database from before sort_id existed
+        path = Path(tmp) / "tasks.db"
+        old = sqlite3.connect(path)
+        old.execute("CREATE TABLE tasks (task_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, assignee TEXT, "
+                    "category TEXT, deadline TEXT, record TEXT NOT NULL)")
+        old.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?)",
+                        [(t["task_id"], t["timestamp"], None, None, None, json.dumps(t)) for t in source.get_all_tasks()[:2]])
+        old.commit()
+        old.close()
+        database = SQLiteTaskStorage(str(path))
+        database.import_records(source.get_all_tasks())
+
+        everything = [task["task_id"] for task in source.get_all_tasks()]
+        assert [task["task_id"] for task in database.get_all_tasks()] == everything
+        assert everything[-3:] == ["task_20250709_202845_2", "task_20250709_202845_1", "task_20250709_202845"]
+        for cursor in everything:
+            assert [t["task_id"] for t in database.query_tasks(cursor=cursor, limit=2)] == \
+                [t["task_id"] for t in source.query_tasks(cursor=cursor, limit=2)]
+    print("  ✅ Same pages from both backends")
+
+
+def test_index_refresh():
+    """The JSON index picks up files changed by other processes, re-reading only those"""
+    print("🧪 In-memory index refresh")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "processed_tasks"
+        storage = TaskStorage(str(directory), refresh_interval_seconds=3600)
+        paths = storage.save_processed_tasks("rec.wav", "text", TASKS)
+        assert storage.refresh() == 0
+
+        # Another process edits one task, deletes the other and adds a legacy one
+        edited = json.loads(Path(paths[0]).read_text())
+        edited["status"] = "done"
+        Path(paths[0]).write_text(json.dumps(edited))
+        Path(paths[1]).unlink()
+        legacy = dict(edited, task_id="task_20250709_202845", timestamp="2025-07-09T20:28:45")
+        (directory / "task_20250709_202845.json").write_text(json.dumps(legacy))
+
+        # Reads are served from memory until the next refresh
+        assert len(storage.get_all_tasks()) == 2
+        assert storage.refresh() == 2
+        assert [task["task_id"] for task in storage.get_all_tasks()] == [edited["task_id"], "task_20250709_202845"]
+        assert storage.get_task(edited["task_id"])["status"] == "done"
+
+        stats = storage.stats()
+        assert stats["tasks"] == 2 and stats["index_bytes"] > 0
+        print(f"  ✅ Refreshed: {stats}")
+
+
+def test_refresh_skips_unchanged_dir():
+    """Reads only rescan once the directory changed, and saves made here don't count"""
+    print("🧪 Directory change check")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "processed_tasks"
+        storage = TaskStorage(str(directory), refresh_interval_seconds=0)
+        time.sleep(0.2)
+        storage.refresh()
+        refreshes = storage.refreshes
+
+        storage.save_processed_tasks("rec.wav", "text", TASKS)
+        storage.delete_task(storage.get_all_tasks()[0]["task_id"])
+        assert len(storage.get_all_tasks()) == 1
+        assert storage.refreshes == refreshes
+
+        # Another process adds a task
+        record = dict(storage.get_all_tasks()[0], task_id="task_20250709_202845")
+        (directory / "task_20250709_202845.json").write_text(json.dumps(record))
+        assert len(storage.get_all_tasks()) == 2
+        assert storage.refreshes == refreshes + 1
+    print("  ✅ Rescanned once")
+
+
+def test_projection():
+    """Projected records keep just the requested, possibly nested, fields"""
+    print("🧪 Field projection")
+    record = {"task_id": "task_1", "status": "processed", "task_data": {"title": "x", "assignee": "Bob"}}
+    assert project_task(record, ["task_id", "task_data.title", "task_data.missing", "nope"]) == {
+        "task_id": "task_1", "task_data": {"title": "x"}}
+    print("  ✅ Projected")
+
+
+def test_categories_journal():
+    """Category tasks go through the journal, survive restarts and compaction, and are not duplicated"""
+    print("🧪 Categories journal")
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = Path(tmp) / "categories.json"
+        snapshot.write_text(json.dumps([{"id": "1", "title": "Maintenance", "tasks": []},
+                                        {"id": "2", "title": "Inspection"}]))
+        storage = CategoriesStorage(str(snapshot), compact_every=10**6)
+
+        threads = [threading.Thread(target=lambda n=n: [
+            storage.add_task_to_category("1", {"task_id": f"task_{n}_{i}", "title": "fix"}) for i in range(50)])
+            for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        storage.add_task_to_category("2", {"task_id": "task_x", "title": "check"})
+        storage.add_task_to_category("9", {"task_id": "task_y", "title": "nowhere"})
+        assert len(storage.load_categories()[0]["tasks"]) == 200
+        assert json.loads(snapshot.read_text())[0]["tasks"] == []
+
+        # A restart replays the journal, ignoring a line torn by a crash
+        with open(storage.journal_file, "a") as f:
+            f.write('{"category_id": "1", "ta')
+        reopened = CategoriesStorage(str(snapshot))
+        assert reopened.load_categories() == storage.load_categories()
+        reopened.add_task_to_category("2", {"task_id": "task_z", "title": "after crash"})
+        storage = CategoriesStorage(str(snapshot))
+        assert storage.load_categories() == reopened.load_categories()
+
+        # Crash after the snapshot was replaced but before the old journal was removed
+        assert reopened.compact()
+        replayed = storage.load_categories()[0]["tasks"][:5]
+        Path(reopened.compacting_file).write_text(
+            "".join(json.dumps({"category_id": "1", "task": task}) + "\n" for task in replayed))
+        recovered = CategoriesStorage(str(snapshot))
+        assert recovered.load_categories() == storage.load_categories()
+        assert recovered.compact()
+        assert not Path(recovered.compacting_file).exists() and not Path(recovered.journal_file).exists()
+        assert len(json.loads(snapshot.read_text())[0]["tasks"]) == 200
+        assert len(json.loads(snapshot.read_text())[1]["tasks"]) == 2
+
+        # Someone edits the snapshot: it is merged with the journal, not overwritten
+        recovered.add_task_to_category("2", {"task_id": "task_w", "title": "journaled"})
+        edited = json.loads(snapshot.read_text())
+        edited.append({"id": "3", "title": "Landscaping", "tasks": []})
+        snapshot.write_text(json.dumps(edited))
+        recovered.add_task_to_category("3", {"task_id": "task_v", "title": "plant"})
+        categories = recovered.load_categories()
+        assert [cat["title"] for cat in categories] == ["Maintenance", "Inspection", "Landscaping"]
+        assert [task["task_id"] for task in categories[1]["tasks"]][-1] == "task_w"
+        assert recovered.compact()
+        assert json.loads(snapshot.read_text()) == categories
+        recovered.add_task_to_category("3", {"task_id": "task_v", "title": "plant again"})
+        assert recovered.load_categories() == categories
+
+        # Name lookups and the serialized list follow additions without copying the tasks
+        assert recovered.find_category_id("landscaping") == "3"
+        assert recovered.find_category_id("2") == "2"
+        assert recovered.find_category_id("Plumbing") is None
+        assert json.loads(recovered.categories_json()) == categories
+        recovered.add_task_to_category("3", {"task_id": "task_u", "title": "mow"})
+        assert json.loads(recovered.categories_json()) == recovered.load_categories()
+    print("  ✅ 202 tasks journaled, replayed and compacted")
+
+
+def test_migration():
+    """Importing JSON records is idempotent"""
+    print("🧪 JSON → SQLite migration")
+    with tempfile.TemporaryDirectory() as tmp:
+        source = TaskStorage(str(Path(tmp) / "processed_tasks"))
+        source.save_processed_tasks("rec.wav", "text", TASKS)
+        database = SQLiteTaskStorage(str(Path(tmp) / "tasks.db"))
+
+        assert database.import_records(source.get_all_tasks()) == 2
+        assert database.import_records(source.get_all_tasks()) == 0
+        assert database.get_all_tasks() == source.get_all_tasks()
+    print("  ✅ Migrated once")
+
+
+def main():
+    """Main function"""
+    print("🗄️  VoiceTaskAI - Task Storage Test")
+    print("=" * 50)
+    test_backends()
+    test_pagination()
+    test_legacy_order()
+    test_index_refresh()
+    test_refresh_skips_unchanged_dir()
+    test_projection()
+    test_categories_journal()
+    test_migration()
+    print("\n🎉 Task storage tests completed!")
+
+
+if __name__ == "__main__":
+    main()
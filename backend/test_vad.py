@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for voice activity detection
+Checks that leading/trailing silence is trimmed and silent clips are rejected
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.utils.vad import trim_silence
+from app.utils.wav_decoder import SAMPLE_RATE
+
+
+def test_trims_surrounding_silence():
+    """1.5s silence + 2s tone + 1s silence should trim to roughly the tone"""
+    print("🧪 Trimming surrounding silence")
+    rng = np.random.default_rng(0)
+    silence_head = 0.001 * rng.standard_normal(int(1.5 * SAMPLE_RATE))
+    t = np.arange(2 * SAMPLE_RATE) / SAMPLE_RATE
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t)
+    silence_tail = 0.001 * rng.standard_normal(SAMPLE_RATE)
+    audio = np.concatenate([silence_head, tone, silence_tail]).astype(np.float32)
+
+    trimmed, info = trim_silence(audio, SAMPLE_RATE, padding_ms=200)
+
+    print(f"  → {info['original_duration']}s -> {info['trimmed_duration']}s")
+    assert info["speech_detected"]
+    assert 2.0 <= info["trimmed_duration"] <= 2.5
+    assert len(trimmed) < len(audio)
+
+
+def test_rejects_silence():
+    """Near-silent clips should be flagged before reaching Whisper"""
+    print("🧪 Rejecting silent clip")
+    audio = (0.0005 * np.random.default_rng(1).standard_normal(3 * SAMPLE_RATE)).astype(np.float32)
+
+    trimmed, info = trim_silence(audio, SAMPLE_RATE)
+
+    assert not info["speech_detected"]
+    assert len(trimmed) == 0
+    print("  ✅ Silent clip rejected")
+
+
+def main():
+    """Main function"""
+    print("🔇 VoiceTaskAI - VAD Test")
+    print("=" * 50)
+    test_trims_surrounding_silence()
+    test_rejects_silence()
+    print("\n🎉 VAD tests completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for native WAV decoding
+Checks RIFF sniffing, mono downmix and resampling without ffmpeg
+"""
+import io
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.utils.wav_decoder import SAMPLE_RATE, StreamResampler, is_pcm16_wav, decode_pcm16_wav, resample
+
+
+def make_wav(samples: np.ndarray, sample_rate: int, channels: int = 1, sampwidth: int = 2) -> bytes:
+    """Build an in-memory WAV file"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sampwidth)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_sniffing():
+    """Only 16-bit PCM WAV should take the native path"""
+    print("🧪 RIFF sniffing")
+    pcm16 = make_wav(np.zeros(1600, dtype=np.int16), 16000)
+    pcm8 = make_wav(np.zeros(1600, dtype=np.uint8), 16000, sampwidth=1)
+
+    assert is_pcm16_wav(pcm16)
+    assert not is_pcm16_wav(pcm8)
+    assert not is_pcm16_wav(b"OggS" + b"\x00" * 64)
+    assert not is_pcm16_wav(b"")
+    print("  ✅ PCM16 detected, 8-bit / Ogg / empty rejected")
+
+
+def test_passthrough_16k_mono():
+    """16 kHz mono needs no resampling"""
+    print("🧪 16 kHz mono passthrough")
+    samples = (np.sin(np.linspace(0, 20 * np.pi, 16000)) * 16000).astype(np.int16)
+    audio = decode_pcm16_wav(make_wav(samples, 16000))
+
+    assert audio.dtype == np.float32
+    assert len(audio) == 16000
+    assert np.allclose(audio, samples / 32768.0, atol=1e-6)
+    print("  ✅ Samples match")
+
+
+def test_stereo_48k_downmix_and_resample():
+    """Frontend recordings are interleaved stereo at 48 kHz"""
+    print("🧪 48 kHz stereo -> 16 kHz mono")
+    t = np.arange(48000) / 48000
+    left = np.sin(2 * np.pi * 440 * t)
+    right = np.sin(2 * np.pi * 440 * t)
+    interleaved = (np.column_stack([left, right]).ravel() * 16000).astype(np.int16)
+    audio = decode_pcm16_wav(make_wav(interleaved, 48000, channels=2))
+
+    assert len(audio) == SAMPLE_RATE
+    # A 440 Hz tone should survive the anti-aliasing filter
+    peak_bin = np.argmax(np.abs(np.fft.rfft(audio)))
+    assert abs(peak_bin - 440) <= 1
+    print(f"  ✅ {len(audio)} samples, dominant frequency {peak_bin} Hz")
+
+
+def test_stream_resampler_matches_whole():
+    """Resampling chunk by chunk gives the same samples as resampling the whole clip"""
+    print("🧪 Chunked resampling")
+    rng = np.random.default_rng(0)
+    for rate in (48000, 44100, 8000):
+        t = np.arange(2 * rate) / rate
+        audio = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        resampler = StreamResampler(rate)
+        chunks, start = [], 0
+        while start < len(audio):
+            size = int(rng.integers(1, 4000))
+            chunks.append(resampler.process(audio[start:start + size]))
+            start += size
+        chunks.append(resampler.flush())
+        streamed = np.concatenate(chunks)
+        whole = resample(audio, rate)
+        assert len(streamed) == len(whole), rate
+        assert np.allclose(streamed, whole, atol=1e-5), rate
+    print("  ✅ No drift or edge artifacts at chunk boundaries")
+
+
+def main():
+    """Main function"""
+    print("🎵 VoiceTaskAI - WAV Decoder Test")
+    print("=" * 50)
+    test_sniffing()
+    test_passthrough_16k_mono()
+    test_stereo_48k_downmix_and_resample()
+    test_stream_resampler_matches_whole()
+    print("\n🎉 WAV decoder tests completed!")
+
+
+if __name__ == "__main__":
+    main()